@@ -4,11 +4,13 @@ from logging.config import fileConfig
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
+import functools
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Only read .env when the database URL isn't already in the environment
+if not (os.getenv("DB_URL") or os.getenv("DATABASE_URL")):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -27,25 +29,40 @@ target_metadata = None
 
 # Override sqlalchemy.url with environment variable if available
 # Try DB_URL first, then fall back to DATABASE_URL (Railway default)
-db_url = os.getenv("DB_URL") or os.getenv("DATABASE_URL")
-
-if db_url:
+@functools.lru_cache(maxsize=1)
+def _resolve_sync_url() -> str:
+    """Resolve the database URL from the environment as a psycopg2 URL.
+    
+    Returns:
+        str: SQLAlchemy URL using the psycopg2 driver
+        
+    Raises:
+        ValueError: If neither DB_URL nor DATABASE_URL is set
+    """
+    db_url = os.getenv("DB_URL") or os.getenv("DATABASE_URL")
+    if not db_url:
+        raise ValueError(
+            "Database URL not found. Please set DB_URL or DATABASE_URL environment variable."
+        )
+    
+    # Already a sync URL, nothing to rewrite
+    if "+psycopg2" in db_url:
+        return db_url
+    
     # Convert async URL to sync URL for Alembic
     # postgresql+asyncpg:// -> postgresql+psycopg2://
     # postgresql:// -> postgresql+psycopg2://
     if "+asyncpg" in db_url:
-        db_url = db_url.replace("+asyncpg", "+psycopg2")
-    elif db_url.startswith("postgresql://") and "+psycopg2" not in db_url:
-        db_url = db_url.replace("postgresql://", "postgresql+psycopg2://", 1)
-    elif db_url.startswith("postgres://"):
+        return db_url.replace("+asyncpg", "+psycopg2")
+    if db_url.startswith("postgresql://"):
+        return db_url.replace("postgresql://", "postgresql+psycopg2://", 1)
+    if db_url.startswith("postgres://"):
         # Railway uses postgres:// which needs to be converted
-        db_url = db_url.replace("postgres://", "postgresql+psycopg2://", 1)
-    
-    config.set_main_option("sqlalchemy.url", db_url)
-else:
-    raise ValueError(
-        "Database URL not found. Please set DB_URL or DATABASE_URL environment variable."
-    )
+        return db_url.replace("postgres://", "postgresql+psycopg2://", 1)
+    return db_url
+
+
+config.set_main_option("sqlalchemy.url", _resolve_sync_url())
 
 
 def run_migrations_offline() -> None:
@@ -76,12 +93,15 @@ def run_migrations_online() -> None:
     """Run migrations in 'online' mode using synchronous engine.
     
     Alembic works better with synchronous engines, so we use
-    psycopg2 instead of asyncpg for migrations.
+    psycopg2 instead of asyncpg for migrations. A single pooled
+    connection is reused for the whole run instead of reconnecting.
     """
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        poolclass=pool.QueuePool,
+        pool_size=1,
+        max_overflow=0,
     )
 
     with connectable.connect() as connection:
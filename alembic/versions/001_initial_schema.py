@@ -28,13 +28,10 @@ def upgrade() -> None:
         'sessions',
         sa.Column('id', TEXT, primary_key=True),
         sa.Column('user_id', TEXT, nullable=True),
-        sa.Column('created_at', TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=False),
-        sa.Column('last_active_at', TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=False)
+        sa.Column('created_at', TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('last_active_at', TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False)
     )
     
-    # Create index on sessions.last_active_at
-    op.create_index('idx_sessions_last_active', 'sessions', ['last_active_at'])
-    
     # Create messages table
     op.create_table(
         'messages',
@@ -42,13 +39,10 @@ def upgrade() -> None:
         sa.Column('session_id', TEXT, sa.ForeignKey('sessions.id', ondelete='CASCADE'), nullable=False),
         sa.Column('role', TEXT, nullable=False),
         sa.Column('content', TEXT, nullable=False),
-        sa.Column('created_at', TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=False),
+        sa.Column('created_at', TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
         sa.CheckConstraint("role IN ('user', 'assistant', 'system')", name='check_message_role')
     )
     
-    # Create composite index on messages(session_id, created_at)
-    op.create_index('idx_messages_session_created', 'messages', ['session_id', sa.text('created_at DESC')])
-    
     # Create documents table
     op.create_table(
         'documents',
@@ -56,21 +50,41 @@ def upgrade() -> None:
         sa.Column('title', TEXT, nullable=True),
         sa.Column('source', TEXT, nullable=True),
         sa.Column('metadata_json', JSONB, nullable=True),
-        sa.Column('created_at', TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=False),
-        sa.Column('updated_at', TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=False)
+        sa.Column('created_at', TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False)
     )
     
-    # Create index on documents.created_at
-    op.create_index('idx_documents_created', 'documents', [sa.text('created_at DESC')])
+    # Build indexes CONCURRENTLY so writes are not blocked while they build.
+    # CONCURRENTLY cannot run inside a transaction, so commit the table DDL
+    # above and create the indexes in autocommit mode.
+    with op.get_context().autocommit_block():
+        # Create index on sessions.last_active_at
+        op.create_index(
+            'idx_sessions_last_active', 'sessions', ['last_active_at'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        
+        # Create composite index on messages(session_id, created_at)
+        op.create_index(
+            'idx_messages_session_created', 'messages', ['session_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        
+        # Create index on documents.created_at
+        op.create_index(
+            'idx_documents_created', 'documents', [sa.text('created_at DESC')],
+            postgresql_concurrently=True, if_not_exists=True
+        )
 
 
 def downgrade() -> None:
     """Drop all tables and extension."""
     
     # Drop indexes
-    op.drop_index('idx_documents_created', table_name='documents')
-    op.drop_index('idx_messages_session_created', table_name='messages')
-    op.drop_index('idx_sessions_last_active', table_name='sessions')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_documents_created', table_name='documents', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_messages_session_created', table_name='messages', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_sessions_last_active', table_name='sessions', postgresql_concurrently=True, if_exists=True)
     
     # Drop tables
     op.drop_table('documents')
@@ -7,7 +7,6 @@ Create Date: 2025-11-21 00:00:00.000000
 """
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import TEXT, TIMESTAMP
 
 
 # revision identifiers, used by Alembic.
@@ -20,33 +19,49 @@ depends_on = None
 def upgrade() -> None:
     """Create vaults table and add vault_id to documents."""
     
-    # Create vaults table
-    op.create_table(
-        'vaults',
-        sa.Column('vault_id', TEXT, primary_key=True),
-        sa.Column('name', TEXT, nullable=False, unique=True),
-        sa.Column('description', TEXT, nullable=True),
-        sa.Column('created_at', TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=False),
-        sa.Column('updated_at', TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=False)
-    )
+    # Create vaults table, add documents.vault_id and its foreign key in a
+    # single round trip. The FK is added NOT VALID so existing documents rows
+    # are not scanned while holding the ACCESS EXCLUSIVE lock.
+    op.execute("""
+        CREATE TABLE vaults (
+            vault_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            description TEXT,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+        );
+        
+        ALTER TABLE documents ADD COLUMN vault_id TEXT;
+        
+        ALTER TABLE documents
+            ADD CONSTRAINT fk_documents_vault_id
+            FOREIGN KEY (vault_id) REFERENCES vaults(vault_id)
+            ON DELETE CASCADE
+            NOT VALID;
+    """)
     
-    # Create indexes on vaults table
-    op.create_index('idx_vaults_name', 'vaults', ['name'])
-    op.create_index('idx_vaults_created_at', 'vaults', [sa.text('created_at DESC')])
-    
-    # Add vault_id column to documents table
-    op.add_column('documents', sa.Column('vault_id', TEXT, nullable=True))
-    
-    # Create index on documents.vault_id
-    op.create_index('idx_documents_vault_id', 'documents', ['vault_id'])
-    
-    # Add foreign key constraint (with CASCADE delete)
-    op.create_foreign_key(
-        'fk_documents_vault_id',
-        'documents', 'vaults',
-        ['vault_id'], ['vault_id'],
-        ondelete='CASCADE'
-    )
+    # Entering the autocommit block commits the DDL above and releases its
+    # ACCESS EXCLUSIVE lock. VALIDATE then runs on its own and only takes a
+    # SHARE UPDATE EXCLUSIVE lock, so reads and writes continue during the scan.
+    # Indexes are built CONCURRENTLY outside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE documents VALIDATE CONSTRAINT fk_documents_vault_id")
+        
+        # Create indexes on vaults table
+        op.create_index(
+            'idx_vaults_name', 'vaults', ['name'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'idx_vaults_created_at', 'vaults', [sa.text('created_at DESC')],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        
+        # Create index on documents.vault_id
+        op.create_index(
+            'idx_documents_vault_id', 'documents', ['vault_id'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
 
 
 def downgrade() -> None:
@@ -55,15 +70,14 @@ def downgrade() -> None:
     # Drop foreign key constraint
     op.drop_constraint('fk_documents_vault_id', 'documents', type_='foreignkey')
     
-    # Drop index on documents.vault_id
-    op.drop_index('idx_documents_vault_id', table_name='documents')
+    # Drop indexes
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_documents_vault_id', table_name='documents', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_vaults_created_at', table_name='vaults', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_vaults_name', table_name='vaults', postgresql_concurrently=True, if_exists=True)
     
     # Remove vault_id column from documents
     op.drop_column('documents', 'vault_id')
     
-    # Drop indexes on vaults table
-    op.drop_index('idx_vaults_created_at', table_name='vaults')
-    op.drop_index('idx_vaults_name', table_name='vaults')
-    
     # Drop vaults table
     op.drop_table('vaults')
@@ -27,12 +27,18 @@ def upgrade() -> None:
             created_at TIMESTAMP NOT NULL DEFAULT NOW(),
             CONSTRAINT agents_name_vault_unique UNIQUE (name, vault_id)
         );
-        
-        CREATE INDEX IF NOT EXISTS idx_agents_vault_id ON agents(vault_id);
-        CREATE INDEX IF NOT EXISTS idx_agents_created_at ON agents(created_at DESC);
     """)
+    
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_agents_vault_id ON agents(vault_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_agents_created_at ON agents(created_at DESC)")
 
 
 def downgrade() -> None:
     """Drop agents table."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_agents_created_at")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_agents_vault_id")
+    
     op.execute("DROP TABLE IF EXISTS agents CASCADE;")
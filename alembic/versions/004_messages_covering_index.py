@@ -0,0 +1,41 @@
+"""Replace messages history index with one that includes role
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the chat history index with role included and drop the old one.
+    
+    Only role is included: it is limited to three short values. content
+    stays out because btree tuples are capped at about 2.7 kB, and long
+    messages would fail to insert. History reads still fetch content from
+    the heap.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_session_created_covering
+            ON messages (session_id, created_at DESC) INCLUDE (role)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_messages_session_created")
+
+
+def downgrade() -> None:
+    """Restore the original messages(session_id, created_at) index."""
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_session_created
+            ON messages (session_id, created_at DESC)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_messages_session_created_covering")
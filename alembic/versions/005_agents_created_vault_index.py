@@ -0,0 +1,34 @@
+"""Add agents(created_at DESC, vault_id) index for agent listing
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create index serving both filtered and unfiltered agent listings.
+    
+    Rows come back already ordered by created_at DESC, so the unfiltered
+    listing no longer needs a sequential scan plus sort.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_agents_created_at_vault
+            ON agents (created_at DESC, vault_id)
+        """)
+
+
+def downgrade() -> None:
+    """Drop agents(created_at DESC, vault_id) index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_agents_created_at_vault")
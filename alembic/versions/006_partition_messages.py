@@ -0,0 +1,98 @@
+"""Hash-partition messages by session_id
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+# Number of hash partitions for the messages table
+MESSAGE_PARTITIONS = 8
+
+
+def upgrade() -> None:
+    """Rebuild messages as a table hash-partitioned on session_id.
+
+    Inserts are spread over MESSAGE_PARTITIONS heaps and the per-session
+    history index becomes one smaller index per partition. A partitioned
+    primary key must contain the partition key, so it becomes
+    (id, session_id); ids still come from the existing sequence.
+    """
+    # Block writes while rows are copied into the new table
+    op.execute("LOCK TABLE messages IN EXCLUSIVE MODE")
+
+    op.execute("""
+        CREATE TABLE messages_new (
+            LIKE messages INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            CONSTRAINT messages_new_pkey PRIMARY KEY (id, session_id),
+            CONSTRAINT messages_new_session_id_fkey FOREIGN KEY (session_id)
+                REFERENCES sessions(id) ON DELETE CASCADE
+        ) PARTITION BY HASH (session_id)
+    """)
+
+    for remainder in range(MESSAGE_PARTITIONS):
+        op.execute(f"""
+            CREATE TABLE messages_p{remainder} PARTITION OF messages_new
+            FOR VALUES WITH (MODULUS {MESSAGE_PARTITIONS}, REMAINDER {remainder})
+        """)
+
+    op.execute("INSERT INTO messages_new SELECT * FROM messages")
+
+    # Keep the id sequence alive when the old table is dropped
+    op.execute("ALTER SEQUENCE messages_id_seq OWNED BY messages_new.id")
+    op.execute("DROP TABLE messages")
+
+    op.execute("ALTER TABLE messages_new RENAME TO messages")
+    op.execute("ALTER TABLE messages RENAME CONSTRAINT messages_new_pkey TO messages_pkey")
+    op.execute(
+        "ALTER TABLE messages RENAME CONSTRAINT messages_new_session_id_fkey "
+        "TO messages_session_id_fkey"
+    )
+
+    # Partitioned indexes cannot be built CONCURRENTLY; the partitions
+    # are new and still locked by this transaction, so build it inline.
+    op.execute("""
+        CREATE INDEX idx_messages_session_created_covering
+        ON messages (session_id, created_at DESC) INCLUDE (role)
+    """)
+
+
+def downgrade() -> None:
+    """Rebuild messages as a single unpartitioned table."""
+    op.execute("LOCK TABLE messages IN EXCLUSIVE MODE")
+
+    op.execute("""
+        CREATE TABLE messages_old (
+            LIKE messages INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            CONSTRAINT messages_old_pkey PRIMARY KEY (id),
+            CONSTRAINT messages_old_session_id_fkey FOREIGN KEY (session_id)
+                REFERENCES sessions(id) ON DELETE CASCADE
+        )
+    """)
+
+    op.execute("INSERT INTO messages_old SELECT * FROM messages")
+
+    op.execute("ALTER SEQUENCE messages_id_seq OWNED BY messages_old.id")
+    # Dropping the partitioned parent drops all of its partitions
+    op.execute("DROP TABLE messages")
+
+    op.execute("ALTER TABLE messages_old RENAME TO messages")
+    op.execute("ALTER TABLE messages RENAME CONSTRAINT messages_old_pkey TO messages_pkey")
+    op.execute(
+        "ALTER TABLE messages RENAME CONSTRAINT messages_old_session_id_fkey "
+        "TO messages_session_id_fkey"
+    )
+
+    op.execute("""
+        CREATE INDEX idx_messages_session_created_covering
+        ON messages (session_id, created_at DESC) INCLUDE (role)
+    """)
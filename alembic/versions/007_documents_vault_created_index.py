@@ -0,0 +1,40 @@
+"""Replace documents(vault_id) index with (vault_id, created_at DESC)
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create composite vault listing index and drop the vault_id index.
+    
+    Vault-filtered document listings come back already ordered by
+    created_at DESC, so the sort node goes away. The composite index
+    still serves plain vault_id lookups.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_vault_created
+            ON documents (vault_id, created_at DESC)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_vault_id")
+
+
+def downgrade() -> None:
+    """Restore the single-column documents(vault_id) index."""
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_vault_id
+            ON documents (vault_id)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_vault_created")
@@ -0,0 +1,51 @@
+"""Create the embeddings table up front and add an HNSW index
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+# Must match initialize_vector_store(): PGVectorStore prefixes table_name with "data_"
+EMBEDDINGS_TABLE = 'data_embeddings'
+EMBEDDING_DIM = 1536
+
+
+def upgrade() -> None:
+    """Create the LlamaIndex embeddings table if missing and index it with HNSW.
+    
+    The table mirrors PGVectorStore's schema so the store finds it in place
+    and can run with perform_setup disabled. Without a vector index every
+    retrieval is a sequential scan; HNSW (m=16, ef_construction=64) gives
+    the best speed/recall trade-off for cosine similarity search.
+    """
+    op.execute(f"""
+        CREATE TABLE IF NOT EXISTS {EMBEDDINGS_TABLE} (
+            id BIGSERIAL PRIMARY KEY,
+            text VARCHAR NOT NULL,
+            metadata_ JSON,
+            node_id VARCHAR,
+            embedding VECTOR({EMBEDDING_DIM})
+        )
+    """)
+    
+    with op.get_context().autocommit_block():
+        op.execute(f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {EMBEDDINGS_TABLE}_embedding_idx
+            ON {EMBEDDINGS_TABLE} USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+        """)
+
+
+def downgrade() -> None:
+    """Drop the HNSW index; the table is left to PGVectorStore."""
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {EMBEDDINGS_TABLE}_embedding_idx")
@@ -0,0 +1,36 @@
+"""Add response_cache_generations table shared by all workers
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the per-vault semantic cache generation counters.
+    
+    Each worker keeps its own semantic response cache. Ingesting or
+    deleting a document bumps its vault's row here, so every worker drops
+    answers built on the old documents, not only the one that handled the
+    change. The empty scope stands for unfiltered chats.
+    """
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS response_cache_generations (
+            scope TEXT PRIMARY KEY,
+            generation BIGINT NOT NULL
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Drop response_cache_generations table."""
+    op.execute("DROP TABLE IF EXISTS response_cache_generations")
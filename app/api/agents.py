@@ -8,6 +8,8 @@ This module provides CRUD operations for agents:
 """
 
 from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from typing import List, Optional
 
 from app.models.requests import AgentCreateRequest
@@ -19,6 +21,9 @@ from app.logging_config import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Validates and serializes agent lists in a single pydantic-core pass
+_AGENTS_ADAPTER = TypeAdapter(List[AgentResponse])
+
 # Service will be injected at startup
 _agent_service: AgentService = None
 
@@ -54,27 +59,19 @@ async def create_agent(request: AgentCreateRequest):
     """
     logger.info("POST /agents", extra={"agent_name": request.name})
     
-    try:
-        agent = await _agent_service.create(
-            name=request.name,
-            vault_id=request.vault_id,
-            system_prompt=request.system_prompt
-        )
-        
-        return AgentResponse(
-            agent_id=agent.agent_id,
-            name=agent.name,
-            vault_id=agent.vault_id,
-            system_prompt=agent.system_prompt,
-            created_at=agent.created_at
-        )
-        
-    except Exception as e:
-        logger.error(f"Agent creation failed: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create agent"
-        )
+    agent = await _agent_service.create(
+        name=request.name,
+        vault_id=request.vault_id,
+        system_prompt=request.system_prompt
+    )
+    
+    return AgentResponse(
+        agent_id=agent.agent_id,
+        name=agent.name,
+        vault_id=agent.vault_id,
+        system_prompt=agent.system_prompt,
+        created_at=agent.created_at
+    )
 
 
 @router.get(
@@ -97,26 +94,15 @@ async def list_agents(vault_id: Optional[str] = Query(None, description="Filter
     """
     logger.info("GET /agents", extra={"vault_id": vault_id})
     
-    try:
-        agents = await _agent_service.list_all(vault_id=vault_id)
-        
-        return [
-            AgentResponse(
-                agent_id=agent.agent_id,
-                name=agent.name,
-                vault_id=agent.vault_id,
-                system_prompt=agent.system_prompt,
-                created_at=agent.created_at
-            )
-            for agent in agents
-        ]
-        
-    except Exception as e:
-        logger.error(f"Agent listing failed: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to list agents"
-        )
+    agents = await _agent_service.list_all(vault_id=vault_id)
+    
+    # Convert Agent models in pydantic-core and return the encoded JSON
+    # directly so FastAPI does not validate the list a second time
+    agent_responses = _AGENTS_ADAPTER.validate_python(agents, from_attributes=True)
+    return Response(
+        content=_AGENTS_ADAPTER.dump_json(agent_responses),
+        media_type="application/json"
+    )
 
 
 @router.get(
@@ -140,31 +126,21 @@ async def get_agent(agent_id: str):
     """
     logger.info("GET /agents/{agent_id}", extra={"agent_id": agent_id})
     
-    try:
-        agent = await _agent_service.get_by_id(agent_id)
-        
-        if not agent:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Agent not found: {agent_id}"
-            )
-        
-        return AgentResponse(
-            agent_id=agent.agent_id,
-            name=agent.name,
-            vault_id=agent.vault_id,
-            system_prompt=agent.system_prompt,
-            created_at=agent.created_at
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Agent retrieval failed: {str(e)}", exc_info=True)
+    agent = await _agent_service.get_by_id(agent_id)
+    
+    if not agent:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve agent"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Agent not found: {agent_id}"
         )
+    
+    return AgentResponse(
+        agent_id=agent.agent_id,
+        name=agent.name,
+        vault_id=agent.vault_id,
+        system_prompt=agent.system_prompt,
+        created_at=agent.created_at
+    )
 
 
 @router.delete(
@@ -202,9 +178,3 @@ async def delete_agent(agent_id: str):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.message
         )
-    except Exception as e:
-        logger.error(f"Agent deletion failed: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete agent"
-        )
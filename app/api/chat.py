@@ -1,19 +1,31 @@
 """Chat endpoint for conversational RAG interactions.
 
 This module implements the POST /chat endpoint for conversational interactions
-with the RAG system (Requirements 5.1-5.9, 10.1, 10.2).
+with the RAG system (Requirements 5.1-5.9, 10.1, 10.2), and POST /chat/stream,
+which sends the same answer as server-sent events while it is generated.
 """
 
+import asyncio
+import functools
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import orjson
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from llama_index.core.llms import ChatMessage
 
 from app.models.requests import ChatRequest
-from app.models.responses import ChatResponse
+from app.models.responses import ChatResponse, Source
 from app.services.session_service import SessionService
 from app.services.message_service import MessageService
 from app.services.chat_service import ChatService
+from app.services.semantic_cache import CacheQuery, SemanticResponseCache
 from app.config import Config
+from app.exceptions import RAGAPIException
+from app.logging_config import get_logger
 
 
+logger = get_logger(__name__)
 router = APIRouter()
 
 # These will be injected via dependency injection in main.py
@@ -21,13 +33,26 @@ session_service: SessionService = None
 message_service: MessageService = None
 chat_service: ChatService = None
 config: Config = None
+response_cache: Optional[SemanticResponseCache] = None
+
+# Set once all services above are injected; checked on every request
+_SERVICES_READY: bool = False
+
+# Strong references to in-flight background writes so they are not
+# garbage collected before completion
+_background_tasks: set = set()
+
+# Latest in-flight assistant save per session; the next turn waits on it
+# so history is complete and messages keep their created_at order
+_pending_saves: Dict[str, asyncio.Task] = {}
 
 
 def set_services(
     session_svc: SessionService,
     message_svc: MessageService,
     chat_svc: ChatService,
-    cfg: Config
+    cfg: Config,
+    cache: Optional[SemanticResponseCache] = None
 ) -> None:
     """Set the service instances.
     
@@ -36,12 +61,15 @@ def set_services(
         message_svc: MessageService instance for message handling
         chat_svc: ChatService instance for chat generation
         cfg: Application configuration
+        cache: Optional SemanticResponseCache for first-turn answers
     """
-    global session_service, message_service, chat_service, config
+    global session_service, message_service, chat_service, config, response_cache, _SERVICES_READY
     session_service = session_svc
     message_service = message_svc
     chat_service = chat_svc
     config = cfg
+    response_cache = cache
+    _SERVICES_READY = all([session_svc, message_svc, chat_svc, cfg])
 
 
 @router.post("/chat", response_model=ChatResponse, status_code=status.HTTP_200_OK)
@@ -80,55 +108,30 @@ async def chat(request: ChatRequest) -> ChatResponse:
         HTTPException: 422 if validation fails (handled by FastAPI)
         HTTPException: 500 if chat generation fails
     """
-    # Verify services are initialized
-    if not all([session_service, message_service, chat_service, config]):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Services not initialized"
-        )
+    _check_services_ready()
     
     try:
-        # Step 1: Get or create session (Requirement 3.1, 3.2)
-        session = await session_service.get_or_create_session(
-            session_id=request.session_id
-        )
-        
-        # Step 2: Update last_active timestamp (Requirement 3.3)
-        await session_service.update_last_active(request.session_id)
-        
-        # Step 3: Save user message (Requirement 4.1)
-        await message_service.save_message(
-            session_id=request.session_id,
-            role="user",
-            content=request.message
-        )
-        
-        # Step 4: Retrieve recent messages (Requirements 5.2, 5.3)
-        # Use MAX_HISTORY_MESSAGES from config
-        recent_messages = await message_service.get_recent_messages(
-            session_id=request.session_id,
-            limit=config.max_history_messages
-        )
-        
-        # Convert to LlamaIndex ChatMessage format
-        chat_history = message_service.format_for_chat_engine(recent_messages)
+        # Steps 1-4, plus a semantic cache lookup for opening questions
+        chat_history, cache_query, cached = await _prepare_chat(request)
         
         # Step 5: Generate RAG response (Requirements 5.4, 5.5, 5.6, 5.7, 5.9)
-        answer, sources = await chat_service.generate_response(
-            message=request.message,
-            chat_history=chat_history,
-            top_k=request.config.top_k,
-            temperature=request.config.temperature,
-            session_id=request.session_id,
-            vault_id=request.vault_id
-        )
+        if cached is not None:
+            answer, sources = cached
+        else:
+            answer, sources = await chat_service.generate_response(
+                message=request.message,
+                chat_history=chat_history,
+                top_k=request.config.top_k,
+                temperature=request.config.temperature,
+                session_id=request.session_id,
+                vault_id=request.vault_id
+            )
+            if cache_query is not None:
+                response_cache.put(cache_query, answer, sources)
         
-        # Step 6: Save assistant message (Requirement 4.2)
-        await message_service.save_message(
-            session_id=request.session_id,
-            role="assistant",
-            content=answer
-        )
+        # Step 6: Save assistant message (Requirement 4.2) in the background
+        # so the response is not held back by the write
+        _save_assistant_message(request.session_id, answer)
         
         # Step 7: Return response (Requirement 5.8)
         return ChatResponse(
@@ -143,9 +146,261 @@ async def chat(request: ChatRequest) -> ChatResponse:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        # Error handling for chat failures
+
+
+@router.post("/chat/stream", status_code=status.HTTP_200_OK)
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """Handle chat requests, streaming the answer as server-sent events.
+    
+    Runs the same flow as POST /chat, but sends the answer while the LLM
+    generates it instead of after the whole answer is ready. The stream
+    is a sequence of events:
+    - "token": {"delta": str} for each piece of the answer
+    - "sources": {"session_id": str, "sources": [...]} once the answer is complete
+    - "error": {"error": str, "code": str} if generation fails mid-stream
+    
+    Errors raised before the first event (unknown session, retrieval or
+    LLM failures) are returned as regular JSON error responses.
+    
+    Args:
+        request: ChatRequest containing session_id, message, and optional config
+        
+    Returns:
+        StreamingResponse: text/event-stream response
+        
+    Raises:
+        HTTPException: 422 if validation fails (handled by FastAPI)
+        HTTPException: 500 if chat generation fails
+    """
+    _check_services_ready()
+    
+    try:
+        chat_history, cache_query, cached = await _prepare_chat(request)
+        
+        if cached is not None:
+            answer, sources = cached
+            deltas = _single_delta(answer)
+        else:
+            deltas, sources = await chat_service.generate_response_stream(
+                message=request.message,
+                chat_history=chat_history,
+                top_k=request.config.top_k,
+                temperature=request.config.temperature,
+                session_id=request.session_id,
+                vault_id=request.vault_id
+            )
+        
+    except ValueError as e:
+        # Handle validation errors from services
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return StreamingResponse(
+        _stream_events(request.session_id, deltas, sources, cache_query, cached is None),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _check_services_ready() -> None:
+    """Raise a 500 error if the services have not been injected yet.
+    
+    Raises:
+        HTTPException: 500 if services are not initialized
+    """
+    if not _SERVICES_READY:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate chat response: {str(e)}"
+            detail="Services not initialized"
+        )
+
+
+async def _prepare_chat(
+    request: ChatRequest
+) -> Tuple[List[ChatMessage], Optional[CacheQuery], Optional[Tuple[str, List[Source]]]]:
+    """Record the user's message and gather what answering it needs.
+    
+    Args:
+        request: Incoming chat request
+        
+    Returns:
+        Tuple: Recent chat history, the semantic cache query (None when
+            the cache is not used) and the cached answer and sources, if any
+    """
+    # Step 1 + 2: Get or create session (Requirement 3.1, 3.2) and
+    # update last_active timestamp (Requirement 3.3) in one upsert
+    await session_service.touch_session(request.session_id)
+    
+    # The previous answer in this session may still be being written
+    await _wait_for_pending_save(request.session_id)
+    
+    # Step 3: Save user message (Requirement 4.1)
+    await message_service.save_message(
+        session_id=request.session_id,
+        role="user",
+        content=request.message
+    )
+    
+    # Step 4: Retrieve recent messages (Requirements 5.2, 5.3)
+    # Use MAX_HISTORY_MESSAGES from config, already in LlamaIndex
+    # ChatMessage format
+    chat_history = await message_service.get_recent_chat_history(
+        session_id=request.session_id,
+        limit=config.max_history_messages
+    )
+    
+    # A question that opens a conversation does not depend on history,
+    # so it can be answered from the semantic cache.
+    cache_query = None
+    cached = None
+    if response_cache is not None and len(chat_history) <= 1:
+        cache_query = await response_cache.prepare(
+            request.message, request.vault_id, request.config.top_k
+        )
+        cached = response_cache.get(cache_query)
+    
+    return chat_history, cache_query, cached
+
+
+async def _single_delta(answer: str) -> AsyncIterator[str]:
+    """Yield a complete answer as a single delta."""
+    yield answer
+
+
+def _sse(event: str, data: Any) -> bytes:
+    """Encode one server-sent event with a JSON payload.
+    
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+        
+    Returns:
+        bytes: Encoded event, terminated by a blank line
+    """
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _stream_events(
+    session_id: str,
+    deltas: AsyncIterator[str],
+    sources: List[Source],
+    cache_query: Optional[CacheQuery],
+    cache_answer: bool
+) -> AsyncIterator[bytes]:
+    """Send an answer as server-sent events and save it once complete.
+    
+    If the stream stops early, because generation failed or the client
+    disconnected, the part of the answer generated so far is saved.
+    
+    Args:
+        session_id: Session the answer belongs to
+        deltas: Pieces of the answer text
+        sources: Sources of the answer
+        cache_query: Semantic cache query for the question, if cacheable
+        cache_answer: Whether to store the completed answer in the cache
+        
+    Yields:
+        bytes: Encoded server-sent events
+    """
+    parts = []
+    completed = False
+    try:
+        async for delta in deltas:
+            parts.append(delta)
+            yield _sse("token", {"delta": delta})
+        completed = True
+    except RAGAPIException as e:
+        # Headers are already sent; report the failure in-band
+        yield _sse("error", {"error": e.message, "code": e.code})
+    finally:
+        # Match the stripped text the non-streaming path returns
+        answer = "".join(parts).strip()
+        
+        # Step 6: Save assistant message (Requirement 4.2), also when the
+        # client disconnected mid-stream
+        if completed or answer:
+            _save_assistant_message(session_id, answer)
+    
+    if not completed:
+        return
+    
+    # Only complete answers are cached
+    if cache_answer and cache_query is not None:
+        response_cache.put(cache_query, answer, sources)
+    
+    yield _sse(
+        "sources",
+        {"session_id": session_id, "sources": [source.model_dump() for source in sources]}
+    )
+
+
+def _save_assistant_message(session_id: str, answer: str) -> None:
+    """Save an assistant message in the background.
+    
+    Args:
+        session_id: Session the message belongs to
+        answer: Assistant message content
+    """
+    task = asyncio.create_task(
+        message_service.save_message(
+            session_id=session_id,
+            role="assistant",
+            content=answer
+        )
+    )
+    _background_tasks.add(task)
+    _pending_saves[session_id] = task
+    task.add_done_callback(functools.partial(_on_assistant_message_saved, session_id))
+
+
+async def _wait_for_pending_save(session_id: str) -> None:
+    """Wait for an in-flight assistant save in the same session.
+    
+    A failed save has already been logged by its done callback, so the
+    outcome is not re-raised here.
+    
+    Args:
+        session_id: Session about to record a new turn
+    """
+    task = _pending_saves.get(session_id)
+    if task is not None:
+        await asyncio.wait([task])
+
+
+async def drain_background_tasks(timeout: float) -> None:
+    """Wait for in-flight assistant saves to finish, e.g. before shutdown.
+    
+    Args:
+        timeout: Maximum seconds to wait
+    """
+    if not _background_tasks:
+        return
+    _, pending = await asyncio.wait(list(_background_tasks), timeout=timeout)
+    if pending:
+        logger.warning(
+            "Assistant message saves still pending at shutdown",
+            extra={"pending": len(pending)}
+        )
+
+
+def _on_assistant_message_saved(session_id: str, task: asyncio.Task) -> None:
+    """Release a finished background save and log any failure.
+    
+    Args:
+        session_id: Session the message belongs to
+        task: Completed save_message task
+    """
+    _background_tasks.discard(task)
+    if _pending_saves.get(session_id) is task:
+        del _pending_saves[session_id]
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error(
+            "Failed to save assistant message",
+            extra={"error": str(exc)},
+            exc_info=exc
         )
@@ -5,16 +5,28 @@ in Requirement 9.
 """
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from typing import AsyncIterator, Optional
 
+from app.models.database import DocumentInfo as DocumentRecord
 from app.models.responses import DocumentsResponse, DocumentInfo, DeleteResponse
 from app.services.document_service import DocumentService
+from app.logging_config import get_logger
 
 
+logger = get_logger(__name__)
 router = APIRouter()
 
+# Validates and serializes one streamed document row at a time
+_DOCUMENT_ADAPTER = TypeAdapter(DocumentInfo)
+
 # This will be injected via dependency injection in main.py
 document_service: DocumentService = None
 
+# Set once the document service is injected; checked on every request
+_SERVICES_READY: bool = False
+
 
 def set_document_service(service: DocumentService) -> None:
     """Set the document service instance.
@@ -22,8 +34,9 @@ def set_document_service(service: DocumentService) -> None:
     Args:
         service: DocumentService instance to use for listing documents
     """
-    global document_service
+    global document_service, _SERVICES_READY
     document_service = service
+    _SERVICES_READY = service is not None
 
 
 @router.get("/documents", response_model=DocumentsResponse, status_code=status.HTTP_200_OK)
@@ -47,40 +60,73 @@ async def list_documents(vault_id: str = None) -> DocumentsResponse:
            fields "document_id", "title", "source", and "created_at"
     
     Returns:
-        DocumentsResponse: List of all documents with metadata
+        StreamingResponse: DocumentsResponse JSON, streamed one document at a time
         
     Raises:
         HTTPException: 500 if document service not initialized or retrieval fails
     """
-    if document_service is None:
+    if not _SERVICES_READY:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Document service not initialized"
         )
     
+    # Retrieve documents from database (Requirement 9.2). Pull the first
+    # row before responding so query failures still surface as a 500.
+    documents = document_service.iter_all(vault_id=vault_id)
     try:
-        # Retrieve all documents from database (Requirement 9.2)
-        documents = await document_service.list_all(vault_id=vault_id)
+        first = await documents.__anext__()
+    except StopAsyncIteration:
+        first = None
+    
+    return StreamingResponse(
+        _encode_documents(first, documents),
+        media_type="application/json"
+    )
+
+
+async def _encode_documents(
+    first: Optional[DocumentRecord],
+    documents: AsyncIterator[DocumentRecord]
+) -> AsyncIterator[bytes]:
+    """Encode streamed documents as a chunked DocumentsResponse body.
+    
+    Yields the same {"documents": [...]} JSON as DocumentsResponse, one
+    document per chunk, so the full list is never built in memory.
+    
+    The 200 status is already sent when a later page fails to load, so
+    the error is re-raised instead of closing the JSON. The server then
+    aborts the chunked response, and the client sees a failed transfer
+    rather than a truncated list that parses as complete.
+    
+    Args:
+        first: First document, already fetched, or None if there are none
+        documents: Iterator over the remaining documents
         
-        # Convert to response format with required fields (Requirement 9.3)
-        document_infos = [
-            DocumentInfo(
-                document_id=doc.id,
-                title=doc.title,
-                source=doc.source,
-                created_at=doc.created_at
+    Yields:
+        bytes: Chunks of the JSON response body
+    """
+    try:
+        yield b'{"documents":['
+        if first is not None:
+            # Convert to response format with required fields (Requirement 9.3)
+            yield _DOCUMENT_ADAPTER.dump_json(
+                _DOCUMENT_ADAPTER.validate_python(first, from_attributes=True)
             )
-            for doc in documents
-        ]
-        
-        return DocumentsResponse(documents=document_infos)
-        
+            async for document in documents:
+                yield b"," + _DOCUMENT_ADAPTER.dump_json(
+                    _DOCUMENT_ADAPTER.validate_python(document, from_attributes=True)
+                )
+        yield b"]}"
     except Exception as e:
-        # Error handling for document retrieval failures
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve documents: {str(e)}"
+        logger.error(
+            "Document listing failed mid-stream; aborting response",
+            extra={"error": str(e)},
+            exc_info=True
         )
+        raise
+    finally:
+        await documents.aclose()
 
 
 @router.delete("/documents/{document_id}", response_model=DeleteResponse, status_code=status.HTTP_200_OK)
@@ -96,27 +142,18 @@ async def delete_document(document_id: str):
         dict: Status message
         
     Raises:
-        HTTPException: 404 if document not found
-        HTTPException: 500 if deletion fails
+        DocumentNotFoundError: If document not found (404)
     """
-    if document_service is None:
+    if not _SERVICES_READY:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Document service not initialized"
         )
         
-    try:
-        await document_service.delete(document_id)
-        
-        return DeleteResponse(
-            document_id=document_id,
-            status="deleted"
-        )
-        
-    except Exception as e:
-        # Error handling is largely done in the service, but we catch any leaks here
-        # Service raises DocumentNotFoundError which is handled by global exception handler
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete document: {str(e)}"
-        )
+    # DocumentNotFoundError is handled by the global exception handler
+    await document_service.delete(document_id)
+    
+    return DeleteResponse(
+        document_id=document_id,
+        status="deleted"
+    )
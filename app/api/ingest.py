@@ -4,16 +4,25 @@ This module implements the POST /ingest endpoint for ingesting documents
 into the RAG system (Requirements 2.1-2.7, 10.3).
 """
 
-import uuid
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from app.models.requests import IngestRequest
 from app.models.responses import IngestResponse
-from app.services.document_service import DocumentService
+from app.services.document_service import DocumentService, new_document_id
 
 
 router = APIRouter()
 
+# The body is parsed by hand below, so publish its schema explicitly
+_INGEST_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": IngestRequest.model_json_schema()}}
+    }
+}
+
 # This will be injected via dependency injection in main.py
 document_service: DocumentService = None
 
@@ -28,8 +37,13 @@ def set_document_service(service: DocumentService) -> None:
     document_service = service
 
 
-@router.post("/ingest", response_model=IngestResponse, status_code=status.HTTP_200_OK)
-async def ingest_document(request: IngestRequest) -> IngestResponse:
+@router.post(
+    "/ingest",
+    response_model=IngestResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=_INGEST_REQUEST_BODY
+)
+async def ingest_document(raw_request: Request) -> IngestResponse:
     """Ingest a document into the RAG system.
     
     Requirements:
@@ -42,16 +56,27 @@ async def ingest_document(request: IngestRequest) -> IngestResponse:
     - 2.7: Return document_id and status "indexed"
     - 10.3: Validate required "text" field (handled by Pydantic)
     
+    The raw body is validated straight from bytes with
+    IngestRequest.model_validate_json, which skips building an
+    intermediate dict with the stdlib json parser for large documents.
+    
     Args:
-        request: IngestRequest containing text and optional metadata
+        raw_request: Request whose JSON body is an IngestRequest
         
     Returns:
         IngestResponse: Contains document_id and status
         
     Raises:
-        HTTPException: 422 if validation fails (handled by FastAPI)
+        RequestValidationError: 422 if the body is invalid JSON or fails validation
         HTTPException: 500 if ingestion fails
     """
+    try:
+        request = IngestRequest.model_validate_json(await raw_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+    
     if document_service is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -59,8 +84,8 @@ async def ingest_document(request: IngestRequest) -> IngestResponse:
         )
     
     try:
-        # Generate unique document_id using UUID
-        document_id = str(uuid.uuid4())
+        # Generate unique, time-ordered document_id (UUIDv7)
+        document_id = new_document_id()
         
         # Call DocumentService.ingest() with request data
         # This handles Requirements 2.2-2.6
@@ -7,9 +7,11 @@ This module provides CRUD operations for vaults:
 - DELETE /vaults/{vault_id} - Delete vault
 """
 
-from fastapi import APIRouter, HTTPException, status
-from fastapi.middleware.cors import CORSMiddleware
-from typing import List
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import Response
+from datetime import datetime
+from pydantic import TypeAdapter
+from typing import List, Optional
 
 from app.models.requests import VaultCreateRequest
 from app.models.responses import VaultResponse, VaultDeleteResponse
@@ -20,6 +22,9 @@ from app.logging_config import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Serializes vault lists in a single pydantic-core pass
+_VAULTS_ADAPTER = TypeAdapter(List[VaultResponse])
+
 # Service will be injected at startup
 _vault_service: VaultService = None
 
@@ -62,16 +67,23 @@ async def create_vault(request: VaultCreateRequest):
             description=request.description
         )
         
-        # Get document count (will be 0 for new vault)
-        doc_count = await _vault_service.count_documents(vault.vault_id)
+        # A vault that was just created cannot contain documents yet
+        doc_count = 0
         
-        return VaultResponse(
+        # Return the encoded model directly so FastAPI does not validate
+        # the response against response_model a second time
+        vault_response = VaultResponse(
             vault_id=vault.vault_id,
             name=vault.name,
             description=vault.description,
             created_at=vault.created_at,
             document_count=doc_count
         )
+        return Response(
+            content=vault_response.model_dump_json(),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json"
+        )
         
     except VaultAlreadyExistsError as e:
         logger.warning(f"Vault creation failed: {e.message}")
@@ -105,23 +117,23 @@ async def list_vaults():
     logger.info("GET /vaults")
     
     try:
-        vaults = await _vault_service.list_all()
-        
-        # Build response with document counts
-        response = []
-        for vault in vaults:
-            doc_count = await _vault_service.count_documents(vault.vault_id)
-            response.append(
-                VaultResponse(
-                    vault_id=vault.vault_id,
-                    name=vault.name,
-                    description=vault.description,
-                    created_at=vault.created_at,
-                    document_count=doc_count
-                )
-            )
+        # Vaults and their document counts come back from a single query
+        vaults = await _vault_service.list_all_with_counts()
         
-        return response
+        vault_responses = [
+            VaultResponse(
+                vault_id=vault.vault_id,
+                name=vault.name,
+                description=vault.description,
+                created_at=vault.created_at,
+                document_count=doc_count
+            )
+            for vault, doc_count in vaults
+        ]
+        return Response(
+            content=_VAULTS_ADAPTER.dump_json(vault_responses),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Vault listing failed: {str(e)}", exc_info=True)
@@ -137,11 +149,15 @@ async def list_vaults():
     summary="Get vault by ID",
     description="Retrieve a single vault by its ID with document count."
 )
-async def get_vault(vault_id: str):
+async def get_vault(vault_id: str, request: Request):
     """Get vault by ID.
     
+    The response carries an ETag; a matching If-None-Match gets 304 Not
+    Modified.
+    
     Args:
         vault_id: Unique vault identifier
+        request: Incoming request, used for conditional GET headers
         
     Returns:
         VaultResponse: Vault with metadata
@@ -153,23 +169,35 @@ async def get_vault(vault_id: str):
     logger.info("GET /vaults/{vault_id}", extra={"vault_id": vault_id})
     
     try:
-        vault = await _vault_service.get_by_id(vault_id)
+        result = await _vault_service.get_with_count(vault_id)
         
-        if not vault:
+        if result is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Vault not found: {vault_id}"
             )
         
-        doc_count = await _vault_service.count_documents(vault.vault_id)
+        vault, doc_count, last_document_at = result
+        etag = _vault_etag(vault.updated_at, doc_count, last_document_at)
+        
+        if request.headers.get("if-none-match") == etag:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag}
+            )
         
-        return VaultResponse(
+        vault_response = VaultResponse(
             vault_id=vault.vault_id,
             name=vault.name,
             description=vault.description,
             created_at=vault.created_at,
             document_count=doc_count
         )
+        return Response(
+            content=vault_response.model_dump_json(),
+            media_type="application/json",
+            headers={"ETag": etag}
+        )
         
     except HTTPException:
         raise
@@ -181,6 +209,29 @@ async def get_vault(vault_id: str):
         )
 
 
+def _vault_etag(
+    updated_at: datetime,
+    doc_count: int,
+    last_document_at: Optional[datetime]
+) -> str:
+    """Build a weak ETag from a vault's update time and document stats.
+    
+    The count alone stays the same when one document is added and another
+    deleted; the newest document's created_at moves forward on every add,
+    so the pair changes whenever the documents do.
+    
+    Args:
+        updated_at: Vault updated_at timestamp
+        doc_count: Number of documents in the vault
+        last_document_at: created_at of the vault's newest document, if any
+        
+    Returns:
+        str: Quoted weak ETag value
+    """
+    last = last_document_at.timestamp() if last_document_at is not None else 0.0
+    return f'W/"{updated_at.timestamp():.6f}-{doc_count}-{last:.6f}"'
+
+
 @router.delete(
     "/vaults/{vault_id}",
     response_model=VaultDeleteResponse,
@@ -4,10 +4,30 @@ This module provides configuration loading from environment variables
 with validation and defaults as specified in Requirements 8.1-8.6.
 """
 
+import functools
+import os
+import re
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 
 
+_VALID_ENVIRONMENTS = frozenset({"development", "staging", "production"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_POSTGRES_URL = re.compile(r"^postgres(?:ql)?://")
+# Upper bound for a derived per-worker asyncpg pool
+_DEFAULT_DB_POOL_MAX_SIZE = 50
+
+
+def _strip_non_empty(v: str, name: str) -> str:
+    """Strip a required string setting and reject it if empty."""
+    v = v.strip() if v else ""
+    if not v:
+        raise ValueError(f"{name} must not be empty")
+    return v
+
+
 class Config(BaseSettings):
     """Application configuration loaded from environment variables.
     
@@ -48,6 +68,36 @@ class Config(BaseSettings):
         description="OpenAI embedding model name"
     )
     
+    embedding_batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=2048,
+        description="Number of chunks sent per embedding API request"
+    )
+    
+    vector_store_setup: bool = Field(
+        default=True,
+        description="Let PGVectorStore run its extension/schema/table DDL checks on first use"
+    )
+    
+    vector_store_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="Connections kept open by each vector store engine (per worker process)"
+    )
+    
+    vector_store_max_overflow: int = Field(
+        default=5,
+        ge=0,
+        description="Extra vector store connections allowed under load (per worker process)"
+    )
+    
+    vector_insert_batch_size: int = Field(
+        default=2048,
+        ge=1,
+        description="Number of embedded chunks written per vector store insert"
+    )
+    
     chat_model: str = Field(
         default="gpt-4.1-mini",
         description="OpenAI chat model name"
@@ -70,6 +120,35 @@ class Config(BaseSettings):
         description="Default temperature for LLM responses"
     )
     
+    warm_up_connections: bool = Field(
+        default=True,
+        description="Send a throwaway embedding and completion at startup to open OpenAI connections"
+    )
+    
+    response_cache_enabled: bool = Field(
+        default=True,
+        description="Serve first-turn chat answers from the per-worker semantic response cache"
+    )
+    
+    response_cache_threshold: float = Field(
+        default=0.92,
+        gt=0,
+        le=1,
+        description="Minimum cosine similarity between questions for a cache hit"
+    )
+    
+    response_cache_ttl: float = Field(
+        default=3600.0,
+        gt=0,
+        description="Seconds a cached chat answer stays valid"
+    )
+    
+    response_cache_max_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of cached chat answers"
+    )
+    
     host: str = Field(
         default="0.0.0.0",
         description="Server host address"
@@ -112,35 +191,77 @@ class Config(BaseSettings):
     )
     
     workers: int = Field(
-        default=1,
-        description="Number of Uvicorn worker processes"
+        default_factory=lambda: os.cpu_count() or 1,
+        description="Number of Uvicorn worker processes (defaults to the CPU count)"
+    )
+    
+    # Database connection pool configuration
+    db_pool_min_size: int = Field(
+        default=10,
+        description="Minimum number of connections kept in the asyncpg pool"
+    )
+    
+    db_pool_max_size: Optional[int] = Field(
+        default=None,
+        description="Maximum connections in the asyncpg pool (default: derived from db_max_connections)"
+    )
+    
+    db_max_connections: int = Field(
+        default=90,
+        ge=1,
+        description=(
+            "Connections all workers together may open; leaves headroom under "
+            "Postgres' default max_connections of 100 for migrations and admin sessions"
+        )
+    )
+    
+    db_pool_max_queries: int = Field(
+        default=50_000,
+        description="Queries a pooled connection serves before it is replaced"
+    )
+    
+    db_pool_max_inactive_lifetime: float = Field(
+        default=300.0,
+        description="Seconds an idle pooled connection is kept before closing"
+    )
+    
+    db_command_timeout: float = Field(
+        default=60.0,
+        description="Default timeout in seconds for database queries"
+    )
+    
+    db_statement_cache_size: int = Field(
+        default=1024,
+        description="Prepared statements cached per database connection"
+    )
+    
+    run_migrations: bool = Field(
+        default=False,
+        description="Run alembic upgrade head at startup instead of only checking the schema version"
     )
     
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True
     )
     
     @field_validator("openai_api_key")
     @classmethod
     def validate_openai_api_key(cls, v: str) -> str:
         """Validate that OpenAI API key is not empty."""
-        if not v or not v.strip():
-            raise ValueError("OPENAI_API_KEY must not be empty")
-        return v.strip()
+        return _strip_non_empty(v, "OPENAI_API_KEY")
     
     @field_validator("db_url")
     @classmethod
     def validate_db_url(cls, v: str) -> str:
         """Validate that database URL is not empty and has basic format."""
-        if not v or not v.strip():
-            raise ValueError("DB_URL must not be empty")
+        v = _strip_non_empty(v, "DB_URL")
         
         # Basic validation that it looks like a database URL
-        v = v.strip()
-        if not (v.startswith("postgresql://") or v.startswith("postgres://")):
+        if not _POSTGRES_URL.match(v):
             raise ValueError(
                 "DB_URL must be a valid PostgreSQL connection string "
                 "(starting with postgresql:// or postgres://)"
@@ -164,6 +285,80 @@ class Config(BaseSettings):
             raise ValueError("TOP_K_DEFAULT must be at least 1")
         return v
     
+    @field_validator("db_pool_min_size", "db_pool_max_size")
+    @classmethod
+    def validate_db_pool_size(cls, v: Optional[int]) -> Optional[int]:
+        """Validate that pool sizes are positive."""
+        if v is not None and v < 1:
+            raise ValueError("Database pool sizes must be at least 1")
+        return v
+    
+    @field_validator("workers")
+    @classmethod
+    def validate_workers(cls, v: int) -> int:
+        """Validate that there is at least one worker."""
+        if v < 1:
+            raise ValueError("WORKERS must be at least 1")
+        return v
+    
+    @functools.cached_property
+    def _worker_connection_share(self) -> int:
+        """Connections one worker may open out of db_max_connections."""
+        return self.db_max_connections // self.workers
+    
+    @functools.cached_property
+    def resolved_db_pool_max_size(self) -> int:
+        """asyncpg pool max size, derived when DB_POOL_MAX_SIZE is unset.
+        
+        A worker's share of db_max_connections is split between the asyncpg
+        pool and the vector store pool in proportion to their full sizes
+        (50 and vector_store_pool_size + vector_store_max_overflow). The
+        asyncpg pool never drops below db_pool_min_size, since it serves
+        every request; check_connection_budget() warns if that floor takes
+        the workers over budget.
+        """
+        if self.db_pool_max_size is not None:
+            return self.db_pool_max_size
+        vector_store_size = self.vector_store_pool_size + self.vector_store_max_overflow
+        full_size = _DEFAULT_DB_POOL_MAX_SIZE + vector_store_size
+        if self._worker_connection_share >= full_size:
+            return _DEFAULT_DB_POOL_MAX_SIZE
+        proportional = self._worker_connection_share * _DEFAULT_DB_POOL_MAX_SIZE // full_size
+        return max(self.db_pool_min_size, proportional)
+    
+    @functools.cached_property
+    def resolved_db_pool_min_size(self) -> int:
+        """asyncpg pool min size, never above the resolved max size."""
+        return min(self.db_pool_min_size, self.resolved_db_pool_max_size)
+    
+    @functools.cached_property
+    def _resolved_vector_store_size(self) -> int:
+        """Total vector store connections (pool plus overflow) per worker."""
+        configured = self.vector_store_pool_size + self.vector_store_max_overflow
+        if self.db_pool_max_size is not None:
+            return configured
+        remaining = self._worker_connection_share - self.resolved_db_pool_max_size
+        return max(1, min(configured, remaining))
+    
+    @functools.cached_property
+    def resolved_vector_store_pool_size(self) -> int:
+        """Vector store pool size, shrunk with the worker's share."""
+        return min(self.vector_store_pool_size, self._resolved_vector_store_size)
+    
+    @functools.cached_property
+    def resolved_vector_store_max_overflow(self) -> int:
+        """Vector store overflow, shrunk with the worker's share."""
+        return self._resolved_vector_store_size - self.resolved_vector_store_pool_size
+    
+    @functools.cached_property
+    def connections_per_worker(self) -> int:
+        """Most database connections one worker process can open."""
+        return (
+            self.resolved_db_pool_max_size
+            + self.resolved_vector_store_pool_size
+            + self.resolved_vector_store_max_overflow
+        )
+    
     @field_validator("default_temperature")
     @classmethod
     def validate_temperature(cls, v: float) -> float:
@@ -184,30 +379,34 @@ class Config(BaseSettings):
     @classmethod
     def validate_environment(cls, v: str) -> str:
         """Validate that environment is a valid value."""
-        valid_envs = ["development", "staging", "production"]
-        if v.lower() not in valid_envs:
-            raise ValueError(f"ENVIRONMENT must be one of: {', '.join(valid_envs)}")
-        return v.lower()
+        v_lower = v.lower()
+        if v_lower not in _VALID_ENVIRONMENTS:
+            raise ValueError("ENVIRONMENT must be one of: development, staging, production")
+        return v_lower
     
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate that log level is valid."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"LOG_LEVEL must be one of: {', '.join(valid_levels)}")
+        if v_upper not in _VALID_LOG_LEVELS:
+            raise ValueError("LOG_LEVEL must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL")
         return v_upper
     
+    @functools.cached_property
+    def cors_origins_list(self) -> list[str]:
+        """CORS origins parsed from the comma-separated string, computed once."""
+        if self.cors_origins == "*":
+            return ["*"]
+        return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
+    
     def get_cors_origins_list(self) -> list[str]:
         """Parse CORS origins from comma-separated string.
         
         Returns:
             List of allowed origins
         """
-        if self.cors_origins == "*":
-            return ["*"]
-        return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
+        return self.cors_origins_list
     
     def is_production(self) -> bool:
         """Check if running in production environment.
@@ -222,6 +421,7 @@ class Config(BaseSettings):
 config: Config | None = None
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get the global configuration instance.
     
@@ -251,4 +451,5 @@ def load_config() -> Config:
     """
     global config
     config = Config()
+    get_config.cache_clear()
     return config
@@ -1,7 +1,35 @@
 """Database connection and query utilities using asyncpg."""
 
 import asyncpg
-from typing import Any, List, Optional
+import orjson
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Iterable, List, Optional, Sequence
+
+
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime.
+    
+    Use this for TIMESTAMPTZ columns. asyncpg converts naive values for
+    those columns from the server's local time zone, which shifts them on
+    any host not running in UTC.
+    
+    Returns:
+        datetime: Current UTC time with tzinfo set
+    """
+    return datetime.now(timezone.utc)
+
+
+def utc_now_naive() -> datetime:
+    """Return the current UTC time for TIMESTAMP (without time zone) columns.
+    
+    asyncpg rejects timezone-aware values for TIMESTAMP columns, so the
+    time zone is dropped after reading the clock in UTC.
+    
+    Returns:
+        datetime: Current UTC time as a naive datetime
+    """
+    return utc_now().replace(tzinfo=None)
 
 
 class Database:
@@ -66,15 +94,127 @@ class Database:
         """
         async with self.pool.acquire() as conn:
             return await conn.fetchval(query, *args)
+    
+    async def executemany(self, query: str, args: Iterable[Sequence[Any]]) -> None:
+        """Execute a query once per argument tuple on a single connection.
+        
+        asyncpg pipelines the executions, so inserting many rows costs one
+        pool acquire and far fewer network round trips than calling
+        execute() in a loop.
+        
+        Args:
+            query: SQL query string
+            args: Iterable of query parameter tuples
+        """
+        async with self.pool.acquire() as conn:
+            await conn.executemany(query, args)
+    
+    async def copy_records_to_table(
+        self,
+        table: str,
+        records: Iterable[Sequence[Any]],
+        columns: Sequence[str]
+    ) -> str:
+        """Bulk-load rows into a table with a single COPY.
+        
+        Much faster than executemany() for large batches: the rows are
+        streamed in binary COPY format in one statement.
+        
+        Args:
+            table: Name of the target table
+            records: Iterable of row tuples, in the order of columns
+            columns: Columns the row values are written to
+            
+        Returns:
+            Status string from the COPY command
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.copy_records_to_table(table, records=records, columns=columns)
+    
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire one connection and run the enclosed block in a transaction.
+        
+        The yielded connection exposes the same execute/executemany/fetch/
+        fetchrow/fetchval methods as Database, so several statements can
+        share a single acquire and commit or roll back together.
+        
+        Yields:
+            asyncpg connection bound to the open transaction
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
+
+# Version byte that prefixes jsonb values in Postgres' binary format
+_JSONB_FORMAT_VERSION = b"\x01"
+
+
+def _encode_json(value: Any) -> str:
+    """Encode a value for a json parameter (text format)."""
+    return orjson.dumps(value).decode()
+
 
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a value for a jsonb parameter or COPY field (binary format)."""
+    return _JSONB_FORMAT_VERSION + orjson.dumps(value)
 
-async def create_pool(db_url: str, min_size: int = 5, max_size: int = 20) -> asyncpg.Pool:
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Decode a jsonb column value (binary format)."""
+    return orjson.loads(data[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Set up a new pool connection.
+    
+    json and jsonb values are converted to and from Python objects by
+    the driver with orjson, so callers pass and receive dicts instead of
+    JSON strings. jsonb uses the binary format, which binary COPY
+    (copy_records_to_table) requires for every column.
+    
+    Args:
+        conn: Newly opened connection
+    """
+    await conn.set_type_codec(
+        "json",
+        encoder=_encode_json,
+        decoder=orjson.loads,
+        schema="pg_catalog",
+        format="text"
+    )
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary"
+    )
+
+
+async def create_pool(
+    db_url: str,
+    min_size: int = 10,
+    max_size: int = 50,
+    max_queries: int = 50_000,
+    max_inactive_connection_lifetime: float = 300.0,
+    command_timeout: float = 60.0,
+    statement_cache_size: int = 1024
+) -> asyncpg.Pool:
     """Create asyncpg connection pool.
     
+    Connections decode json and jsonb columns to Python objects and
+    encode parameters for them from Python objects.
+    
     Args:
         db_url: Database connection URL
         min_size: Minimum number of connections in pool
         max_size: Maximum number of connections in pool
+        max_queries: Queries a connection serves before it is replaced
+        max_inactive_connection_lifetime: Seconds before idle connections close
+        command_timeout: Default query timeout in seconds
+        statement_cache_size: Prepared statements cached per connection
         
     Returns:
         asyncpg connection pool
@@ -82,5 +222,10 @@ async def create_pool(db_url: str, min_size: int = 5, max_size: int = 20) -> asy
     return await asyncpg.create_pool(
         dsn=db_url,
         min_size=min_size,
-        max_size=max_size
+        max_size=max_size,
+        max_queries=max_queries,
+        max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+        command_timeout=command_timeout,
+        statement_cache_size=statement_cache_size,
+        init=_init_connection
     )
@@ -6,41 +6,80 @@ in the RAG API Server, enabling better error handling and user feedback.
 Requirement 10.4: Proper error handling with clear error messages.
 """
 
+from typing import Optional
+
+
+# Error codes; identifier-like literals are interned by CPython already
+_CODE_RAG_API_ERROR = "RAG_API_ERROR"
+_CODE_SESSION_NOT_FOUND = "SESSION_NOT_FOUND"
+_CODE_DOCUMENT_INGEST_ERROR = "DOCUMENT_INGEST_ERROR"
+_CODE_DOCUMENT_NOT_FOUND = "DOCUMENT_NOT_FOUND"
+_CODE_CHAT_GENERATION_ERROR = "CHAT_GENERATION_ERROR"
+_CODE_MESSAGE_SAVE_ERROR = "MESSAGE_SAVE_ERROR"
+_CODE_DATABASE_CONNECTION_ERROR = "DATABASE_CONNECTION_ERROR"
+_CODE_OPENAI_SERVICE_ERROR = "OPENAI_SERVICE_ERROR"
+_CODE_VALIDATION_ERROR = "VALIDATION_ERROR"
+
 
 class RAGAPIException(Exception):
-    """Base exception for all RAG API errors."""
+    """Base exception for all RAG API errors.
     
-    def __init__(self, message: str, code: str = "RAG_API_ERROR"):
+    Subclasses store their raw fields and override _format_message(), so
+    the human-readable message is only built when something reads it.
+    """
+    
+    code: str = _CODE_RAG_API_ERROR
+    
+    def __init__(self, message: Optional[str] = None, code: Optional[str] = None):
         """Initialize exception with message and error code.
         
         Args:
-            message: Human-readable error message
-            code: Machine-readable error code
+            message: Human-readable error message; built lazily if omitted
+            code: Machine-readable error code; defaults to the class code
         """
-        self.message = message
-        self.code = code
-        super().__init__(self.message)
+        self._message = message
+        if code is not None:
+            self.code = code
+        super().__init__()
+    
+    @property
+    def message(self) -> str:
+        """Human-readable error message, formatted on first access."""
+        if self._message is None:
+            self._message = self._format_message()
+        return self._message
+    
+    def _format_message(self) -> str:
+        """Build the error message from the exception's fields."""
+        return self.code
+    
+    def __str__(self) -> str:
+        return self.message
 
 
 class SessionNotFoundError(RAGAPIException):
     """Raised when a session cannot be found."""
     
+    code = _CODE_SESSION_NOT_FOUND
+    
     def __init__(self, session_id: str):
         """Initialize with session ID.
         
         Args:
             session_id: The session ID that was not found
         """
-        super().__init__(
-            message=f"Session not found: {session_id}",
-            code="SESSION_NOT_FOUND"
-        )
+        super().__init__()
         self.session_id = session_id
+    
+    def _format_message(self) -> str:
+        return f"Session not found: {self.session_id}"
 
 
 class DocumentIngestError(RAGAPIException):
     """Raised when document ingestion fails."""
     
+    code = _CODE_DOCUMENT_INGEST_ERROR
+    
     def __init__(self, document_id: str, reason: str):
         """Initialize with document ID and failure reason.
         
@@ -48,33 +87,37 @@ class DocumentIngestError(RAGAPIException):
             document_id: The document ID that failed to ingest
             reason: Reason for the failure
         """
-        super().__init__(
-            message=f"Failed to ingest document {document_id}: {reason}",
-            code="DOCUMENT_INGEST_ERROR"
-        )
+        super().__init__()
         self.document_id = document_id
         self.reason = reason
+    
+    def _format_message(self) -> str:
+        return f"Failed to ingest document {self.document_id}: {self.reason}"
 
 
 class DocumentNotFoundError(RAGAPIException):
     """Raised when a document cannot be found."""
     
+    code = _CODE_DOCUMENT_NOT_FOUND
+    
     def __init__(self, document_id: str):
         """Initialize with document ID.
         
         Args:
             document_id: The document ID that was not found
         """
-        super().__init__(
-            message=f"Document not found: {document_id}",
-            code="DOCUMENT_NOT_FOUND"
-        )
+        super().__init__()
         self.document_id = document_id
+    
+    def _format_message(self) -> str:
+        return f"Document not found: {self.document_id}"
 
 
 class ChatGenerationError(RAGAPIException):
     """Raised when chat response generation fails."""
     
+    code = _CODE_CHAT_GENERATION_ERROR
+    
     def __init__(self, session_id: str, reason: str):
         """Initialize with session ID and failure reason.
         
@@ -82,17 +125,19 @@ class ChatGenerationError(RAGAPIException):
             session_id: The session ID where chat generation failed
             reason: Reason for the failure
         """
-        super().__init__(
-            message=f"Failed to generate chat response for session {session_id}: {reason}",
-            code="CHAT_GENERATION_ERROR"
-        )
+        super().__init__()
         self.session_id = session_id
         self.reason = reason
+    
+    def _format_message(self) -> str:
+        return f"Failed to generate chat response for session {self.session_id}: {self.reason}"
 
 
 class MessageSaveError(RAGAPIException):
     """Raised when saving a message fails."""
     
+    code = _CODE_MESSAGE_SAVE_ERROR
+    
     def __init__(self, session_id: str, reason: str):
         """Initialize with session ID and failure reason.
         
@@ -100,33 +145,37 @@ class MessageSaveError(RAGAPIException):
             session_id: The session ID where message save failed
             reason: Reason for the failure
         """
-        super().__init__(
-            message=f"Failed to save message for session {session_id}: {reason}",
-            code="MESSAGE_SAVE_ERROR"
-        )
+        super().__init__()
         self.session_id = session_id
         self.reason = reason
+    
+    def _format_message(self) -> str:
+        return f"Failed to save message for session {self.session_id}: {self.reason}"
 
 
 class DatabaseConnectionError(RAGAPIException):
     """Raised when database connection fails."""
     
+    code = _CODE_DATABASE_CONNECTION_ERROR
+    
     def __init__(self, reason: str):
         """Initialize with failure reason.
         
         Args:
             reason: Reason for the connection failure
         """
-        super().__init__(
-            message=f"Database connection failed: {reason}",
-            code="DATABASE_CONNECTION_ERROR"
-        )
+        super().__init__()
         self.reason = reason
+    
+    def _format_message(self) -> str:
+        return f"Database connection failed: {self.reason}"
 
 
 class OpenAIServiceError(RAGAPIException):
     """Raised when OpenAI API calls fail."""
     
+    code = _CODE_OPENAI_SERVICE_ERROR
+    
     def __init__(self, operation: str, reason: str):
         """Initialize with operation and failure reason.
         
@@ -134,17 +183,19 @@ class OpenAIServiceError(RAGAPIException):
             operation: The operation that failed (e.g., "embedding", "chat")
             reason: Reason for the failure
         """
-        super().__init__(
-            message=f"OpenAI API error during {operation}: {reason}",
-            code="OPENAI_SERVICE_ERROR"
-        )
+        super().__init__()
         self.operation = operation
         self.reason = reason
+    
+    def _format_message(self) -> str:
+        return f"OpenAI API error during {self.operation}: {self.reason}"
 
 
 class ValidationError(RAGAPIException):
     """Raised when input validation fails."""
     
+    code = _CODE_VALIDATION_ERROR
+    
     def __init__(self, field: str, reason: str):
         """Initialize with field name and validation reason.
         
@@ -152,9 +203,9 @@ class ValidationError(RAGAPIException):
             field: The field that failed validation
             reason: Reason for the validation failure
         """
-        super().__init__(
-            message=f"Validation error for field '{field}': {reason}",
-            code="VALIDATION_ERROR"
-        )
+        super().__init__()
         self.field = field
         self.reason = reason
+    
+    def _format_message(self) -> str:
+        return f"Validation error for field '{self.field}': {self.reason}"
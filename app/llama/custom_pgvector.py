@@ -0,0 +1,96 @@
+"""PGVector store that writes embedded nodes with batched multi-row inserts
+and keeps its SQLAlchemy connection pools bounded."""
+
+from typing import Any, Dict, List, Sequence
+
+import orjson
+from sqlalchemy import String, bindparam, cast, create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.schema import BaseNode, MetadataMode
+from llama_index.core.vector_stores.utils import node_to_metadata_dict
+from llama_index.vector_stores.postgres import PGVectorStore
+
+
+# Rows per INSERT round trip
+_INSERT_BATCH_SIZE = 500
+
+
+class BatchedPGVectorStore(PGVectorStore):
+    """PGVectorStore with batched, ORM-free inserts.
+    
+    The stock add()/async_add() create one ORM object per node and let the
+    session flush them, fetching every generated id back. This store sends
+    plain Core executemany() batches instead, and serializes embeddings
+    with orjson rather than pgvector's per-float str() join.
+    
+    Its engines are built with the pool limits given to set_pool_limits()
+    instead of SQLAlchemy's defaults, so the vector store's connections
+    stay a known share of the server's max_connections.
+    """
+    
+    _engine_kwargs: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    
+    def set_pool_limits(self, pool_size: int, max_overflow: int) -> None:
+        """Bound the connection pools of the engines created on first use.
+        
+        Args:
+            pool_size: Connections kept open per engine
+            max_overflow: Extra connections allowed under load per engine
+        """
+        self._engine_kwargs = {"pool_size": pool_size, "max_overflow": max_overflow}
+    
+    def _connect(self) -> Any:
+        """Create the sync and async engines with the configured pool limits."""
+        self._engine = create_engine(self.connection_string, echo=self.debug, **self._engine_kwargs)
+        self._session = sessionmaker(self._engine)
+        
+        self._async_engine = create_async_engine(self.async_connection_string, **self._engine_kwargs)
+        self._async_session = sessionmaker(self._async_engine, class_=AsyncSession)
+    
+    def _insert_statement(self) -> Any:
+        """Build the INSERT with the embedding bound as pre-serialized text."""
+        table = self._table_class.__table__
+        return insert(table).values(
+            node_id=bindparam("node_id"),
+            text=bindparam("text"),
+            metadata_=bindparam("metadata_"),
+            embedding=cast(bindparam("embedding", type_=String), table.c.embedding.type),
+        )
+    
+    def _node_to_insert_params(self, node: BaseNode) -> Dict[str, Any]:
+        """Convert a node to bound parameters for the batched INSERT."""
+        return {
+            "node_id": node.node_id,
+            "text": node.get_content(metadata_mode=MetadataMode.NONE),
+            "metadata_": node_to_metadata_dict(
+                node,
+                remove_text=True,
+                flat_metadata=self.flat_metadata,
+            ),
+            "embedding": orjson.dumps(node.get_embedding()).decode(),
+        }
+    
+    def add(self, nodes: List[BaseNode], **add_kwargs: Any) -> List[str]:
+        """Insert nodes in batches of _INSERT_BATCH_SIZE rows."""
+        self._initialize()
+        statement = self._insert_statement()
+        with self._session() as session, session.begin():
+            for batch in _batched(nodes):
+                session.execute(statement, [self._node_to_insert_params(node) for node in batch])
+        return [node.node_id for node in nodes]
+    
+    async def async_add(self, nodes: List[BaseNode], **kwargs: Any) -> List[str]:
+        """Asynchronously insert nodes in batches of _INSERT_BATCH_SIZE rows."""
+        self._initialize()
+        statement = self._insert_statement()
+        async with self._async_session() as session, session.begin():
+            for batch in _batched(nodes):
+                await session.execute(statement, [self._node_to_insert_params(node) for node in batch])
+        return [node.node_id for node in nodes]
+
+
+def _batched(nodes: Sequence[BaseNode]) -> List[Sequence[BaseNode]]:
+    """Split nodes into consecutive batches of _INSERT_BATCH_SIZE."""
+    return [nodes[i:i + _INSERT_BATCH_SIZE] for i in range(0, len(nodes), _INSERT_BATCH_SIZE)]
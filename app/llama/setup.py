@@ -8,9 +8,12 @@ This module provides functions to initialize LlamaIndex components including:
 - Global LlamaIndex Settings configuration (Requirement 6.5)
 """
 
+import asyncio
+import functools
 from typing import Tuple
 from urllib.parse import urlparse
 
+import httpx
 from llama_index.core import VectorStoreIndex, StorageContext, Settings
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.llms.openai import OpenAI
@@ -18,6 +21,15 @@ from llama_index.vector_stores.postgres import PGVectorStore
 
 from app.config import Config
 from app.llama.custom_openai import CustomOpenAI
+from app.llama.custom_pgvector import BatchedPGVectorStore
+from app.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Connection pool of the LLM's async HTTP client; chat requests reuse its
+# keep-alive connections instead of opening new ones
+_LLM_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
 
 
 def parse_db_url(db_url: str) -> dict:
@@ -29,17 +41,38 @@ def parse_db_url(db_url: str) -> dict:
     Returns:
         dict: Dictionary with keys: host, port, database, user, password
     """
-    parsed = urlparse(db_url)
+    host, port, database, user, password = _parse_db_url(db_url)
     
     return {
-        "host": parsed.hostname or "localhost",
-        "port": parsed.port or 5432,
-        "database": parsed.path.lstrip("/") if parsed.path else "postgres",
-        "user": parsed.username or "postgres",
-        "password": parsed.password or "",
+        "host": host,
+        "port": port,
+        "database": database,
+        "user": user,
+        "password": password,
     }
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_db_url(db_url: str) -> Tuple[str, int, str, str, str]:
+    """Parse a connection URL once per distinct URL.
+    
+    Args:
+        db_url: PostgreSQL connection string
+        
+    Returns:
+        Tuple of host, port, database, user and password
+    """
+    parsed = urlparse(db_url)
+    
+    return (
+        parsed.hostname or "localhost",
+        parsed.port or 5432,
+        parsed.path.lstrip("/") if parsed.path else "postgres",
+        parsed.username or "postgres",
+        parsed.password or "",
+    )
+
+
 def initialize_embedding_model(config: Config) -> OpenAIEmbedding:
     """Initialize OpenAI embedding model.
     
@@ -55,6 +88,8 @@ def initialize_embedding_model(config: Config) -> OpenAIEmbedding:
     kwargs = {
         "model": config.embedding_model,
         "api_key": config.openai_api_key,
+        # Send chunks as array inputs, embedding_batch_size per request
+        "embed_batch_size": config.embedding_batch_size,
     }
     
     # Add custom base URL if provided
@@ -82,6 +117,9 @@ def initialize_llm(config: Config) -> OpenAI:
         "model": config.chat_model,
         "temperature": config.default_temperature,
         "api_key": config.openai_api_key,
+        # Passed through LlamaIndex's public parameter, so the client is
+        # built with the LLM's own timeout, retries and headers
+        "async_http_client": httpx.AsyncClient(limits=_LLM_HTTP_LIMITS),
     }
     
     # Use CustomOpenAI wrapper for custom API endpoints to bypass model validation
@@ -110,8 +148,9 @@ def initialize_vector_store(config: Config) -> PGVectorStore:
     # Parse database URL into components
     db_params = parse_db_url(config.db_url)
     
-    # Initialize PGVectorStore with connection parameters
-    vector_store = PGVectorStore.from_params(
+    # Initialize PGVectorStore with connection parameters; the batched
+    # subclass writes embedded chunks with multi-row inserts
+    vector_store = BatchedPGVectorStore.from_params(
         database=db_params["database"],
         host=db_params["host"],
         password=db_params["password"],
@@ -119,12 +158,24 @@ def initialize_vector_store(config: Config) -> PGVectorStore:
         user=db_params["user"],
         table_name="embeddings",
         embed_dim=1536,  # Dimension for text-embedding-3-small
+        # The table and its HNSW index come from alembic migration 008;
+        # skip the store's own DDL once they are known to exist
+        perform_setup=config.vector_store_setup,
+    )
+    
+    vector_store.set_pool_limits(
+        config.resolved_vector_store_pool_size,
+        config.resolved_vector_store_max_overflow
     )
     
     return vector_store
 
 
-def initialize_index(vector_store: PGVectorStore, embed_model: OpenAIEmbedding) -> VectorStoreIndex:
+def initialize_index(
+    vector_store: PGVectorStore,
+    embed_model: OpenAIEmbedding,
+    insert_batch_size: int = 2048
+) -> VectorStoreIndex:
     """Create VectorStoreIndex from vector store.
     
     Requirement 6.4: Create or load a vector index from the Vector_Store.
@@ -132,6 +183,7 @@ def initialize_index(vector_store: PGVectorStore, embed_model: OpenAIEmbedding)
     Args:
         vector_store: Configured PGVector store
         embed_model: Configured embedding model
+        insert_batch_size: Number of nodes written per vector store insert
         
     Returns:
         VectorStoreIndex: Vector store index for retrieval
@@ -144,6 +196,7 @@ def initialize_index(vector_store: PGVectorStore, embed_model: OpenAIEmbedding)
         vector_store=vector_store,
         storage_context=storage_context,
         embed_model=embed_model,
+        insert_batch_size=insert_batch_size,
     )
     
     return index
@@ -193,9 +246,35 @@ def initialize_llama_components(config: Config) -> Tuple[VectorStoreIndex, OpenA
     vector_store = initialize_vector_store(config)
     
     # Create index from vector store
-    index = initialize_index(vector_store, embed_model)
+    index = initialize_index(vector_store, embed_model, config.vector_insert_batch_size)
     
     # Configure global settings
     configure_settings(embed_model, llm)
     
     return index, llm, embed_model
+
+
+async def warm_up_clients(
+    llm: OpenAI,
+    embed_model: OpenAIEmbedding,
+    timeout: float = 5.0
+) -> None:
+    """Open the OpenAI HTTP connections before the first user request.
+    
+    Sends one throwaway embedding and completion so the TLS handshakes
+    happen at startup and later requests reuse the keep-alive sockets.
+    Failures are logged and ignored; the clients reconnect on demand.
+    
+    Args:
+        llm: Configured LLM
+        embed_model: Configured embedding model
+        timeout: Seconds to wait for both requests
+    """
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(embed_model.aget_text_embedding(" "), llm.acomplete(" ")),
+            timeout=timeout
+        )
+        logger.info("OpenAI connections warmed up")
+    except Exception as e:
+        logger.warning(f"OpenAI connection warm-up failed: {e}")
@@ -8,7 +8,17 @@ Requirement 10.4: Add structured logging throughout the application.
 
 import logging
 import sys
-from typing import Any, Dict
+from contextvars import ContextVar
+from typing import Optional
+
+
+# Extra record attributes included in the output, in output order
+_EXTRA_KEYS = ("session_id", "document_id", "user_id", "request_id", "duration_ms")
+_EXTRA_KEY_SET = frozenset(_EXTRA_KEYS)
+
+# ID of the request being handled, set by RequestLoggingMiddleware and
+# added to every record logged while handling it
+request_id_context: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
 
 class StructuredFormatter(logging.Formatter):
@@ -17,39 +27,38 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with structured information.
         
+        Builds the key=value line directly; the extra-field scan only runs
+        when the record carries at least one of _EXTRA_KEYS. Records logged
+        while handling a request get its request_id from request_id_context.
+        
         Args:
             record: Log record to format
             
         Returns:
             Formatted log string
         """
-        # Base log data
-        log_data: Dict[str, Any] = {
-            "timestamp": self.formatTime(record, self.datefmt),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-        }
+        # Base log data, formatted as key=value pairs for easy parsing
+        line = (
+            f"timestamp={self.formatTime(record, self.datefmt)} "
+            f"level={record.levelname} "
+            f"logger={record.name} "
+            f"message={record.getMessage()}"
+        )
         
         # Add exception info if present
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            line += f" exception={self.formatException(record.exc_info)}"
         
         # Add extra fields if present
-        if hasattr(record, "session_id"):
-            log_data["session_id"] = record.session_id
-        if hasattr(record, "document_id"):
-            log_data["document_id"] = record.document_id
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
+        attrs = record.__dict__
+        request_id = None if "request_id" in attrs else request_id_context.get()
+        if request_id is not None:
+            # Use a local copy; the record is shared with other handlers
+            attrs = {**attrs, "request_id": request_id}
+        if not _EXTRA_KEY_SET.isdisjoint(attrs):
+            line += "".join(f" {key}={attrs[key]}" for key in _EXTRA_KEYS if key in attrs)
         
-        # Format as key=value pairs for easy parsing
-        parts = [f"{key}={value}" for key, value in log_data.items()]
-        return " ".join(parts)
+        return line
 
 
 def setup_logging(log_level: str = "INFO") -> None:
@@ -61,6 +70,12 @@ def setup_logging(log_level: str = "INFO") -> None:
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
+    # The formatter never prints thread or process details, so skip
+    # collecting them on every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Create formatter
     formatter = StructuredFormatter(
         datefmt="%Y-%m-%d %H:%M:%S"
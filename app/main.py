@@ -11,21 +11,26 @@ This module creates the FastAPI application and wires together all components:
 Requirements: 1.1, 2.1, 5.1, 6.1, 6.2, 6.3, 6.4, 6.5, 9.1, 10.1, 10.2, 10.3, 10.4
 """
 
+import asyncio
 import asyncpg
+import orjson
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, status
+from typing import Any, Dict, Tuple
+from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import ValidationError as PydanticValidationError
 
-from app.config import load_config
+from app.config import Config, load_config
 from app.db.database import create_pool, Database
-from app.llama.setup import initialize_llama_components
+from app.llama.setup import initialize_llama_components, warm_up_clients
 from app.services.session_service import SessionService
 from app.services.message_service import MessageService
 from app.services.document_service import DocumentService
 from app.services.chat_service import ChatService
+from app.services.semantic_cache import SemanticResponseCache
 from app.services.vault_service import VaultService, VaultNotFoundError, VaultAlreadyExistsError
 from app.services.agent_service import AgentService, AgentNotFoundError
 from app.logging_config import setup_logging, get_logger
@@ -54,6 +59,79 @@ app_state = {
     "db_pool": None,
 }
 
+# Seconds to wait at shutdown for assistant messages still being saved
+SHUTDOWN_DRAIN_TIMEOUT_SECONDS = 10.0
+
+
+def migration_head() -> str:
+    """Return the latest alembic revision shipped with the code.
+    
+    Reads the migration scripts only; no database connection is made.
+    
+    Returns:
+        str: Head revision id
+    """
+    from alembic.config import Config as AlembicConfig
+    from alembic.script import ScriptDirectory
+    return ScriptDirectory.from_config(AlembicConfig("alembic.ini")).get_current_head()
+
+
+async def check_migration_head(db: Database) -> None:
+    """Verify the database schema is at the latest migration.
+    
+    Args:
+        db: Database instance
+        
+    Raises:
+        DatabaseConnectionError: If the schema is not at the head revision
+    """
+    head = migration_head()
+    try:
+        current = await db.fetchval("SELECT version_num FROM alembic_version")
+    except asyncpg.UndefinedTableError:
+        current = None
+    
+    if current != head:
+        raise DatabaseConnectionError(
+            f"database schema is at revision {current}, expected {head}; "
+            "run `alembic upgrade head` or set RUN_MIGRATIONS=true"
+        )
+    
+    logger.info("Database schema is up to date", extra={"revision": current})
+
+
+async def check_connection_budget(db: Database, config: Config) -> None:
+    """Warn if all workers together can exceed their connection limits.
+    
+    Every worker opens its own asyncpg pool and vector store pool, so
+    workers × connections_per_worker connections must fit both in
+    DB_MAX_CONNECTIONS and in what the server accepts. The derived pools
+    fit DB_MAX_CONNECTIONS unless the DB_POOL_MIN_SIZE floor or an explicit
+    DB_POOL_MAX_SIZE pushes them over.
+    
+    Args:
+        db: Database instance
+        config: Application configuration
+    """
+    available = await db.fetchval(
+        "SELECT current_setting('max_connections')::int"
+        " - current_setting('superuser_reserved_connections')::int"
+    )
+    required = config.workers * config.connections_per_worker
+    if required > min(available, config.db_max_connections):
+        logger.warning(
+            "Workers can open more database connections than allowed; lower "
+            "WORKERS or DB_POOL_MIN_SIZE, or raise DB_MAX_CONNECTIONS and the "
+            "server's max_connections",
+            extra={
+                "workers": config.workers,
+                "connections_per_worker": config.connections_per_worker,
+                "required": required,
+                "budget": config.db_max_connections,
+                "available": available
+            }
+        )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -61,8 +139,9 @@ async def lifespan(app: FastAPI):
     
     Startup:
     - Load configuration
-    - Initialize database connection pool
     - Initialize LlamaIndex components
+    - Initialize database connection pool, warming up OpenAI connections
+      concurrently
     - Initialize services
     - Wire services to API routers
     
@@ -70,6 +149,7 @@ async def lifespan(app: FastAPI):
     - Close database connection pool
     """
     # Startup: Initialize all components
+    warm_up_task = None
     try:
         # Load configuration from environment variables
         config = load_config()
@@ -97,28 +177,19 @@ async def lifespan(app: FastAPI):
             }
         )
         
-        # Run database migrations
-        logger.info("Running database migrations...")
-        try:
-            from alembic.config import Config as AlembicConfig
-            from alembic import command
-            alembic_cfg = AlembicConfig("alembic.ini")
-            alembic_cfg.set_main_option("sqlalchemy.url", config.db_url)
-            command.upgrade(alembic_cfg, "head")
-            logger.info("Database migrations completed")
-        except Exception as e:
-            logger.warning(f"Migration warning (may be already applied): {e}")
-        
-        # Initialize database connection pool
-        logger.info("Connecting to database...")
-        try:
-            db_pool = await create_pool(config.db_url, min_size=5, max_size=20)
-            app_state["db_pool"] = db_pool
-            db = Database(db_pool)
-            logger.info("Database connection pool created")
-        except Exception as e:
-            logger.error(f"Failed to connect to database", exc_info=True)
-            raise DatabaseConnectionError(str(e))
+        # Run database migrations only when asked to; normally they run once,
+        # out-of-band, before the workers start
+        if config.run_migrations:
+            logger.info("Running database migrations...")
+            try:
+                from alembic.config import Config as AlembicConfig
+                from alembic import command
+                alembic_cfg = AlembicConfig("alembic.ini")
+                alembic_cfg.set_main_option("sqlalchemy.url", config.db_url)
+                command.upgrade(alembic_cfg, "head")
+                logger.info("Database migrations completed")
+            except Exception as e:
+                logger.warning(f"Migration warning (may be already applied): {e}")
         
         # Initialize LlamaIndex components (Requirements 6.1, 6.2, 6.3, 6.4, 6.5)
         logger.info("Initializing LlamaIndex components...")
@@ -135,20 +206,66 @@ async def lifespan(app: FastAPI):
             logger.error("Failed to initialize LlamaIndex components", exc_info=True)
             raise OpenAIServiceError("initialization", str(e))
         
+        # Warm up the OpenAI connections while the database pool connects;
+        # both only wait on the network
+        if config.warm_up_connections:
+            warm_up_task = asyncio.create_task(warm_up_clients(llm, embed_model))
+        
+        # Initialize database connection pool
+        logger.info("Connecting to database...")
+        try:
+            db_pool = await create_pool(
+                config.db_url,
+                min_size=config.resolved_db_pool_min_size,
+                max_size=config.resolved_db_pool_max_size,
+                max_queries=config.db_pool_max_queries,
+                max_inactive_connection_lifetime=config.db_pool_max_inactive_lifetime,
+                command_timeout=config.db_command_timeout,
+                statement_cache_size=config.db_statement_cache_size
+            )
+            app_state["db_pool"] = db_pool
+            db = Database(db_pool)
+            logger.info(
+                "Database connection pool created",
+                extra={
+                    "min_size": config.resolved_db_pool_min_size,
+                    "max_size": config.resolved_db_pool_max_size
+                }
+            )
+        except Exception as e:
+            logger.error(f"Failed to connect to database", exc_info=True)
+            raise DatabaseConnectionError(str(e))
+        
+        # Fail fast if the schema is behind the code
+        await check_migration_head(db)
+        await check_connection_budget(db, config)
+        
+        if warm_up_task is not None:
+            await warm_up_task
+        
         # Initialize services
         logger.info("Initializing services...")
         session_service = SessionService(db)
         message_service = MessageService(db)
-        document_service = DocumentService(db, index)
-        chat_service = ChatService(index, llm, config)
         vault_service = VaultService(db)
+        response_cache = None
+        if config.response_cache_enabled:
+            response_cache = SemanticResponseCache(
+                embed_model,
+                threshold=config.response_cache_threshold,
+                ttl=config.response_cache_ttl,
+                max_size=config.response_cache_max_size,
+                db=db
+            )
+        document_service = DocumentService(db, index, embed_model, response_cache)
+        chat_service = ChatService(index, llm, config)
         agent_service = AgentService(db)
         logger.info("Services initialized")
         
         # Wire services to API routers
         logger.info("Wiring services to API routers...")
         ingest.set_document_service(document_service)
-        chat.set_services(session_service, message_service, chat_service, config)
+        chat.set_services(session_service, message_service, chat_service, config, response_cache)
         documents.set_document_service(document_service)
         vaults.set_vault_service(vault_service)
         agents.set_agent_service(agent_service)
@@ -163,6 +280,8 @@ async def lifespan(app: FastAPI):
         )
         
     except Exception as e:
+        if warm_up_task is not None:
+            warm_up_task.cancel()
         logger.error("Failed to start RAG API Server", exc_info=True)
         raise
     
@@ -172,6 +291,10 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down RAG API Server...")
     
     try:
+        # Let in-flight assistant message saves finish before the pool
+        # they write through is closed
+        await chat.drain_background_tasks(SHUTDOWN_DRAIN_TIMEOUT_SECONDS)
+        
         # Close database connection pool
         if app_state["db_pool"]:
             await app_state["db_pool"].close()
@@ -188,23 +311,16 @@ app = FastAPI(
     description="Conversational RAG API with LlamaIndex, FastAPI, and PostgreSQL",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
-# Add response middleware to ensure CORS headers on all responses
-@app.middleware("http")
-async def add_cors_headers(request, call_next):
-    response = await call_next(request)
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "*"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
-
 # Configure middleware (must be done before app starts)
 # Add request logging middleware (Requirement 10.4)
 app.add_middleware(RequestLoggingMiddleware)
 
-# Configure CORS - Allow all origins for now
+# Configure CORS - Allow all origins for now. CORSMiddleware answers
+# preflight requests itself and sets the headers on every other response.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -238,6 +354,51 @@ app.include_router(agents.router, tags=["agents"])
 
 # Exception Handlers (Requirements 10.1, 10.2, 10.3, 10.4)
 
+# Seconds during which repeats of the same failure are logged without a traceback
+TRACEBACK_SUPPRESSION_SECONDS = 60.0
+TRACEBACK_SUPPRESSION_MAX_SIZE = 256
+
+# Failure key -> monotonic time its traceback was last logged
+_traceback_logged_at: Dict[Tuple[type, Any, type], float] = {}
+
+
+def _should_log_traceback(exc: Exception) -> bool:
+    """Decide whether a handler should log the traceback of an exception.
+    
+    Formatting tracebacks is expensive, and during an incident the same
+    failure repeats many times. Only the first occurrence of each
+    (exception type, code, cause type) within TRACEBACK_SUPPRESSION_SECONDS
+    is logged with its traceback.
+    
+    Args:
+        exc: Exception being handled
+        
+    Returns:
+        bool: True if the traceback should be logged
+    """
+    key = (type(exc), getattr(exc, "code", None), type(exc.__cause__))
+    now = time.monotonic()
+    logged_at = _traceback_logged_at.get(key)
+    if logged_at is not None and now - logged_at < TRACEBACK_SUPPRESSION_SECONDS:
+        return False
+    
+    if len(_traceback_logged_at) >= TRACEBACK_SUPPRESSION_MAX_SIZE:
+        _traceback_logged_at.clear()
+    _traceback_logged_at[key] = now
+    return True
+
+
+class ErrorJSONResponse(ORJSONResponse):
+    """orjson-encoded error response.
+    
+    Values orjson cannot encode natively, such as the exception objects
+    Pydantic puts in validation error contexts, are rendered with str().
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle FastAPI request validation errors (Requirements 10.1, 10.2, 10.3).
@@ -247,11 +408,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     logger.warning(
         "Request validation error",
         extra={
-            "path": request.url.path,
             "errors": exc.errors(),
         }
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Validation error",
@@ -270,11 +430,10 @@ async def pydantic_validation_exception_handler(request: Request, exc: PydanticV
     logger.warning(
         "Pydantic validation error",
         extra={
-            "path": request.url.path,
             "errors": exc.errors(),
         }
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Validation error",
@@ -294,10 +453,9 @@ async def session_not_found_handler(request: Request, exc: SessionNotFoundError)
         "Session not found",
         extra={
             "session_id": exc.session_id,
-            "path": request.url.path,
         }
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={
             "error": exc.message,
@@ -317,10 +475,9 @@ async def document_not_found_handler(request: Request, exc: DocumentNotFoundErro
         "Document not found",
         extra={
             "document_id": exc.document_id,
-            "path": request.url.path,
         }
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={
             "error": exc.message,
@@ -340,10 +497,9 @@ async def vault_not_found_handler(request: Request, exc: VaultNotFoundError):
         "Vault not found",
         extra={
             "vault_id": exc.vault_id,
-            "path": request.url.path,
         }
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={
             "error": exc.message,
@@ -363,10 +519,9 @@ async def vault_already_exists_handler(request: Request, exc: VaultAlreadyExists
         "Vault already exists",
         extra={
             "name": exc.name,
-            "path": request.url.path,
         }
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_409_CONFLICT,
         content={
             "error": exc.message,
@@ -386,10 +541,9 @@ async def agent_not_found_handler(request: Request, exc: AgentNotFoundError):
         "Agent not found",
         extra={
             "agent_id": exc.agent_id,
-            "path": request.url.path,
         }
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={
             "error": exc.message,
@@ -410,11 +564,10 @@ async def document_ingest_error_handler(request: Request, exc: DocumentIngestErr
         extra={
             "document_id": exc.document_id,
             "reason": exc.reason,
-            "path": request.url.path,
         },
-        exc_info=True
+        exc_info=_should_log_traceback(exc)
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": exc.message,
@@ -435,11 +588,10 @@ async def chat_generation_error_handler(request: Request, exc: ChatGenerationErr
         extra={
             "session_id": exc.session_id,
             "reason": exc.reason,
-            "path": request.url.path,
         },
-        exc_info=True
+        exc_info=_should_log_traceback(exc)
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": exc.message,
@@ -460,11 +612,10 @@ async def message_save_error_handler(request: Request, exc: MessageSaveError):
         extra={
             "session_id": exc.session_id,
             "reason": exc.reason,
-            "path": request.url.path,
         },
-        exc_info=True
+        exc_info=_should_log_traceback(exc)
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": exc.message,
@@ -484,11 +635,10 @@ async def database_connection_error_handler(request: Request, exc: DatabaseConne
         "Database connection error",
         extra={
             "reason": exc.reason,
-            "path": request.url.path,
         },
-        exc_info=True
+        exc_info=_should_log_traceback(exc)
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         content={
             "error": exc.message,
@@ -509,11 +659,10 @@ async def openai_service_error_handler(request: Request, exc: OpenAIServiceError
         extra={
             "operation": exc.operation,
             "reason": exc.reason,
-            "path": request.url.path,
         },
-        exc_info=True
+        exc_info=_should_log_traceback(exc)
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_502_BAD_GATEWAY,
         content={
             "error": exc.message,
@@ -534,11 +683,10 @@ async def rag_api_exception_handler(request: Request, exc: RAGAPIException):
         extra={
             "error_code": exc.code,
             "message": exc.message,
-            "path": request.url.path,
         },
-        exc_info=True
+        exc_info=_should_log_traceback(exc)
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": exc.message,
@@ -557,12 +705,11 @@ async def database_exception_handler(request: Request, exc: asyncpg.PostgresErro
     logger.error(
         "Database error",
         extra={
-            "path": request.url.path,
             "error": str(exc),
         },
-        exc_info=True
+        exc_info=_should_log_traceback(exc)
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Database error",
@@ -586,12 +733,11 @@ async def general_exception_handler(request: Request, exc: Exception):
         logger.error(
             "OpenAI API error",
             extra={
-                "path": request.url.path,
                 "error_type": exc_type,
             },
-            exc_info=True
+            exc_info=_should_log_traceback(exc)
         )
-        return JSONResponse(
+        return ErrorJSONResponse(
             status_code=status.HTTP_502_BAD_GATEWAY,
             content={
                 "error": "External service error",
@@ -604,12 +750,11 @@ async def general_exception_handler(request: Request, exc: Exception):
     logger.error(
         "Unhandled exception",
         extra={
-            "path": request.url.path,
             "error_type": exc_type,
         },
-        exc_info=True
+        exc_info=_should_log_traceback(exc)
     )
-    return JSONResponse(
+    return ErrorJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal server error",
@@ -619,24 +764,27 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Root endpoint for basic info
+# Root endpoint for basic info; the response never changes, so encode it once
+_ROOT_BODY = orjson.dumps({
+    "name": "LlamaIndex RAG API",
+    "version": "0.1.0",
+    "status": "running",
+    "endpoints": {
+        "health": "/health",
+        "ingest": "/ingest",
+        "chat": "/chat",
+        "documents": "/documents",
+        "vaults": "/vaults",
+        "agents": "/agents",
+        "docs": "/docs"
+    }
+})
+
+
 @app.get("/", tags=["root"])
-async def root():
+async def root() -> Response:
     """Root endpoint providing basic API information."""
-    return {
-        "name": "LlamaIndex RAG API",
-        "version": "0.1.0",
-        "status": "running",
-        "endpoints": {
-            "health": "/health",
-            "ingest": "/ingest",
-            "chat": "/chat",
-            "documents": "/documents",
-            "vaults": "/vaults",
-            "agents": "/agents",
-            "docs": "/docs"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -645,10 +793,16 @@ if __name__ == "__main__":
     # Load config to get port
     config = load_config()
     
+    # Auto-reload in development; uvicorn ignores workers when reloading
+    reload = config.environment == "development"
+    
     # Run the application
     uvicorn.run(
         "app.main:app",
         host=config.host,
         port=config.port,
-        reload=True,  # Enable auto-reload for development
+        reload=reload,
+        workers=None if reload else config.workers,
+        loop="uvloop",
+        http="httptools",
     )
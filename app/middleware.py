@@ -6,101 +6,160 @@ with timing information.
 Requirement 10.4: Add request/response logging middleware.
 """
 
+import logging
+import os
+import random
 import time
-import uuid
-from typing import Callable
+from typing import FrozenSet, Tuple
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.logging_config import get_logger
+from app.logging_config import get_logger, request_id_context
 
 
 logger = get_logger(__name__)
 
+# Polled by load balancers and monitoring; not worth a log line per hit
+DEFAULT_SKIP_PATHS: FrozenSet[str] = frozenset({"/health", "/healthz", "/metrics"})
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests and responses."""
+# Random bytes drawn from os.urandom in bulk and sliced into request IDs
+_ENTROPY_SIZE = 4096
+_REQUEST_ID_BYTES = 16
+_entropy = b""
+_entropy_offset = _ENTROPY_SIZE
+
+
+def _new_request_id() -> str:
+    """Return a random 32-character hex request ID.
+    
+    Slices 16 bytes from a 4 KiB os.urandom buffer, refilled when used
+    up, instead of building a uuid.UUID per request. Only called from the
+    event loop thread, so the buffer needs no lock.
+    
+    Returns:
+        str: Hex-encoded request ID
+    """
+    global _entropy, _entropy_offset
+    if _entropy_offset >= _ENTROPY_SIZE:
+        _entropy = os.urandom(_ENTROPY_SIZE)
+        _entropy_offset = 0
+    start = _entropy_offset
+    _entropy_offset = start + _REQUEST_ID_BYTES
+    return _entropy[start:_entropy_offset].hex()
+
+
+class RequestLoggingMiddleware:
+    """Middleware for logging HTTP requests and responses.
+    
+    Implemented as a plain ASGI middleware rather than on
+    BaseHTTPMiddleware, which runs every request through an extra task
+    group and a streaming bridge for the response body.
+    """
     
-    def __init__(self, app: ASGIApp):
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        skip_paths: FrozenSet[str] = DEFAULT_SKIP_PATHS,
+        passthrough_prefixes: Tuple[str, ...] = ()
+    ):
         """Initialize middleware.
         
+        OPTIONS requests and paths under passthrough_prefixes (e.g. static
+        assets) bypass the middleware entirely: no request ID, header or
+        log line. Completed requests to skip_paths and requests left out
+        by sampling are not logged. Failed requests always are.
+        
         Args:
             app: ASGI application
+            sample_rate: Fraction of completed requests to log (0.0-1.0)
+            skip_paths: Paths whose completed requests are never logged
+            passthrough_prefixes: Path prefixes forwarded without instrumentation
         """
-        super().__init__(app)
+        self.app = app
+        self.sample_rate = sample_rate
+        self.skip_paths = frozenset(skip_paths)
+        self.passthrough_prefixes = tuple(passthrough_prefixes)
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log details.
         
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-            
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or scope["path"].startswith(self.passthrough_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        # Plain scope reads; no Request or URL objects are built
+        method = scope["method"]
+        path = scope["path"]
+        
         # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
         
         # Add request ID to request state for use in handlers
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
         
-        # Log incoming request
-        logger.info(
-            f"Incoming request",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client": request.client.host if request.client else "unknown",
-            }
-        )
+        # Tag every log record written while handling this request
+        request_id_context.set(request_id)
+        
+        status_code = None
         
-        # Record start time
-        start_time = time.time()
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                message.setdefault("headers", []).append(
+                    (b"x-request-id", request_id.encode("latin-1"))
+                )
+            await send(message)
+        
+        # Record start time (monotonic, unaffected by wall clock changes)
+        start_ns = time.perf_counter_ns()
         
         # Process request
         try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            
-            # Log response
-            logger.info(
-                f"Request completed",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_ms": round(duration_ms, 2),
-                }
-            )
-            
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             # Log error
             logger.error(
-                f"Request failed",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "duration_ms": round(duration_ms, 2),
-                    "error": str(exc),
-                },
+                "Request failed %s %s",
+                method,
+                path,
+                extra={"duration_ms": round(duration_ms, 2)},
                 exc_info=True
             )
             
             # Re-raise exception to be handled by exception handlers
             raise
+        
+        # Skip noisy and unsampled requests before building the log record
+        if (
+            not logger.isEnabledFor(logging.INFO)
+            or path in self.skip_paths
+            or (self.sample_rate < 1.0 and random.random() >= self.sample_rate)
+        ):
+            return
+        
+        # Calculate duration
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        
+        # Log response; the message is only formatted if a handler emits it
+        logger.info(
+            "Request completed %s %s -> %s",
+            method,
+            path,
+            status_code,
+            extra={"duration_ms": round(duration_ms, 2)}
+        )
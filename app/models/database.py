@@ -26,7 +26,7 @@ class Session(BaseModel):
 
 class Message(BaseModel):
     """Message model representing a single turn in a conversation."""
-    id: int
+    id: Optional[int] = None
     session_id: str
     role: MessageRole
     content: str
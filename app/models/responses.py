@@ -1,30 +1,42 @@
-"""Response models for API endpoints."""
+"""Response models for API endpoints.
 
-from pydantic import BaseModel, Field
+Response models are built once per response and never modified, so they
+are all frozen.
+"""
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import List, Optional
 
 
 class HealthResponse(BaseModel):
     """Response model for health check endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="Service version")
 
 
 class IngestResponse(BaseModel):
     """Response model for document ingestion endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     document_id: str = Field(..., description="Unique document identifier")
     status: str = Field(..., description="Ingestion status")
 
 
 class DeleteResponse(BaseModel):
     """Response model for document deletion endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     document_id: str = Field(..., description="Unique document identifier")
     status: str = Field(..., description="Deletion status")
 
 
 class Source(BaseModel):
     """Source information for retrieved document chunks."""
+    model_config = ConfigDict(frozen=True)
+
     document_id: str = Field(..., description="Document identifier")
     title: Optional[str] = Field(None, description="Document title")
     snippet: str = Field(..., description="Text snippet from document")
@@ -33,6 +45,8 @@ class Source(BaseModel):
 
 class ChatResponse(BaseModel):
     """Response model for chat endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     session_id: str = Field(..., description="Session identifier")
     answer: str = Field(..., description="Generated response")
     sources: List[Source] = Field(
@@ -43,7 +57,14 @@ class ChatResponse(BaseModel):
 
 class DocumentInfo(BaseModel):
     """Document information for listing endpoint."""
-    document_id: str = Field(..., description="Document identifier")
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    # Also read from the database model's `id` attribute
+    document_id: str = Field(
+        ...,
+        validation_alias=AliasChoices("document_id", "id"),
+        description="Document identifier"
+    )
     title: Optional[str] = Field(None, description="Document title")
     source: Optional[str] = Field(None, description="Document source")
     created_at: datetime = Field(..., description="Creation timestamp")
@@ -51,6 +72,8 @@ class DocumentInfo(BaseModel):
 
 class DocumentsResponse(BaseModel):
     """Response model for documents listing endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     documents: List[DocumentInfo] = Field(
         default_factory=list,
         description="List of documents"
@@ -59,6 +82,8 @@ class DocumentsResponse(BaseModel):
 
 class VaultResponse(BaseModel):
     """Response model for vault operations."""
+    model_config = ConfigDict(frozen=True)
+
     vault_id: str = Field(..., description="Vault identifier")
     name: str = Field(..., description="Vault name")
     description: Optional[str] = Field(None, description="Vault description")
@@ -68,12 +93,16 @@ class VaultResponse(BaseModel):
 
 class VaultDeleteResponse(BaseModel):
     """Response model for vault deletion."""
+    model_config = ConfigDict(frozen=True)
+
     vault_id: str = Field(..., description="Vault identifier")
     status: str = Field(..., description="Deletion status")
 
 
 class AgentResponse(BaseModel):
     """Response model for agent operations."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     agent_id: str = Field(..., description="Agent identifier")
     name: str = Field(..., description="Agent name")
     vault_id: str = Field(..., description="Associated vault ID")
@@ -83,5 +112,7 @@ class AgentResponse(BaseModel):
 
 class AgentDeleteResponse(BaseModel):
     """Response model for agent deletion."""
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(..., description="Deletion success status")
     message: str = Field(..., description="Deletion message")
@@ -8,10 +8,11 @@ This service handles:
 """
 
 import uuid
-from datetime import datetime
 from typing import List, Optional
 
-from app.db.database import Database
+import asyncpg
+
+from app.db.database import Database, utc_now_naive
 from app.models.database import Agent
 from app.logging_config import get_logger
 from app.exceptions import RAGAPIException
@@ -19,6 +20,52 @@ from app.exceptions import RAGAPIException
 
 logger = get_logger(__name__)
 
+# Agent SQL. Kept as module constants like MessageService's queries; asyncpg
+# caches prepared statements per connection keyed on this exact text.
+_INSERT_AGENT_QUERY = """
+    INSERT INTO agents (agent_id, name, vault_id, system_prompt, created_at)
+    VALUES ($1, $2, $3, $4, $5)
+    RETURNING agent_id, name, vault_id, system_prompt, created_at
+"""
+
+# One statement for both filtered and unfiltered listing; a NULL vault_id
+# turns the filter into a no-op. idx_agents_created_at_vault serves both.
+_LIST_AGENTS_QUERY = """
+    SELECT agent_id, name, vault_id, system_prompt, created_at
+    FROM agents
+    WHERE ($1::text IS NULL OR vault_id = $1)
+    ORDER BY created_at DESC
+"""
+
+_SELECT_AGENT_QUERY = """
+    SELECT agent_id, name, vault_id, system_prompt, created_at
+    FROM agents
+    WHERE agent_id = $1
+"""
+
+_DELETE_AGENT_QUERY = "DELETE FROM agents WHERE agent_id = $1 RETURNING agent_id"
+
+
+def _row_to_agent(row: asyncpg.Record) -> Agent:
+    """Build an Agent from a database row without re-validating it.
+    
+    The row's values already have the model's types, so the model is
+    built with model_construct() instead of running pydantic validation.
+    
+    Args:
+        row: agents row with all Agent columns
+        
+    Returns:
+        Agent: Agent built from the row
+    """
+    return Agent.model_construct(
+        agent_id=row["agent_id"],
+        name=row["name"],
+        vault_id=row["vault_id"],
+        system_prompt=row["system_prompt"],
+        created_at=row["created_at"]
+    )
+
 
 class AgentNotFoundError(RAGAPIException):
     """Exception raised when agent is not found."""
@@ -62,17 +109,12 @@ class AgentService:
         
         # Generate unique agent_id
         agent_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        # agents.created_at is TIMESTAMP without time zone
+        now = utc_now_naive()
         
         try:
-            query = """
-                INSERT INTO agents (agent_id, name, vault_id, system_prompt, created_at)
-                VALUES ($1, $2, $3, $4, $5)
-                RETURNING agent_id, name, vault_id, system_prompt, created_at
-            """
-            
             row = await self.db.fetchrow(
-                query,
+                _INSERT_AGENT_QUERY,
                 agent_id,
                 name,
                 vault_id,
@@ -80,13 +122,7 @@ class AgentService:
                 now
             )
             
-            agent = Agent(
-                agent_id=row["agent_id"],
-                name=row["name"],
-                vault_id=row["vault_id"],
-                system_prompt=row["system_prompt"],
-                created_at=row["created_at"]
-            )
+            agent = _row_to_agent(row)
             
             logger.info(
                 "Agent created successfully",
@@ -114,34 +150,11 @@ class AgentService:
         """
         logger.debug("Listing agents", extra={"vault_id": vault_id})
         
-        if vault_id:
-            query = """
-                SELECT agent_id, name, vault_id, system_prompt, created_at
-                FROM agents
-                WHERE vault_id = $1
-                ORDER BY created_at DESC
-            """
-            rows = await self.db.fetch(query, vault_id)
-        else:
-            query = """
-                SELECT agent_id, name, vault_id, system_prompt, created_at
-                FROM agents
-                ORDER BY created_at DESC
-            """
-            rows = await self.db.fetch(query)
-        
-        agents = [
-            Agent(
-                agent_id=row["agent_id"],
-                name=row["name"],
-                vault_id=row["vault_id"],
-                system_prompt=row["system_prompt"],
-                created_at=row["created_at"]
-            )
-            for row in rows
-        ]
+        rows = await self.db.fetch(_LIST_AGENTS_QUERY, vault_id or None)
         
-        logger.info(f"Retrieved {len(agents)} agents")
+        agents = [_row_to_agent(row) for row in rows]
+        
+        logger.info("Retrieved %d agents", len(agents))
         
         return agents
     
@@ -156,25 +169,13 @@ class AgentService:
         """
         logger.debug("Retrieving agent by ID", extra={"agent_id": agent_id})
         
-        query = """
-            SELECT agent_id, name, vault_id, system_prompt, created_at
-            FROM agents
-            WHERE agent_id = $1
-        """
-        
-        row = await self.db.fetchrow(query, agent_id)
+        row = await self.db.fetchrow(_SELECT_AGENT_QUERY, agent_id)
         
         if row is None:
             logger.warning("Agent not found", extra={"agent_id": agent_id})
             return None
         
-        agent = Agent(
-            agent_id=row["agent_id"],
-            name=row["name"],
-            vault_id=row["vault_id"],
-            system_prompt=row["system_prompt"],
-            created_at=row["created_at"]
-        )
+        agent = _row_to_agent(row)
         
         logger.info("Agent retrieved", extra={"agent_id": agent_id})
         
@@ -191,20 +192,9 @@ class AgentService:
         """
         logger.info("Deleting agent", extra={"agent_id": agent_id})
         
-        # Check if agent exists
-        agent = await self.get_by_id(agent_id)
-        if not agent:
-            raise AgentNotFoundError(agent_id)
-        
         try:
-            query = "DELETE FROM agents WHERE agent_id = $1"
-            await self.db.execute(query, agent_id)
-            
-            logger.info(
-                "Agent deleted successfully",
-                extra={"agent_id": agent_id}
-            )
-            
+            # Delete and check existence in one round trip
+            row = await self.db.fetchrow(_DELETE_AGENT_QUERY, agent_id)
         except Exception as e:
             logger.error(
                 "Agent deletion failed",
@@ -212,3 +202,11 @@ class AgentService:
                 exc_info=True
             )
             raise
+        
+        if row is None:
+            raise AgentNotFoundError(agent_id)
+        
+        logger.info(
+            "Agent deleted successfully",
+            extra={"agent_id": agent_id}
+        )
@@ -2,18 +2,23 @@
 
 This service orchestrates the RAG chat flow using LlamaIndex components.
 It creates chat engines with configurable parameters, manages chat history,
-and extracts source information from responses.
+and extracts source information from responses. Retrievers are cached per
+top_k and vault; chat engines are built per request around a fresh memory.
 """
 
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import AsyncIterator, List, Optional, Tuple
 
 from llama_index.core import VectorStoreIndex
 from llama_index.core.vector_stores import MetadataFilters, ExactMatchFilter
 from llama_index.core.chat_engine import CondensePlusContextChatEngine
+from llama_index.core.chat_engine.types import StreamingAgentChatResponse
+from llama_index.core.base.base_retriever import BaseRetriever
 from llama_index.core.llms import ChatMessage
 from llama_index.core.memory import ChatMemoryBuffer
+from llama_index.core.postprocessor.types import BaseNodePostprocessor
+from llama_index.core.schema import NodeWithScore, QueryBundle
 from llama_index.llms.openai import OpenAI
-from app.llama.custom_openai import CustomOpenAI
 
 from app.config import Config
 from app.models.responses import Source
@@ -24,6 +29,36 @@ from app.exceptions import ChatGenerationError
 logger = get_logger(__name__)
 
 
+class _StableContextOrder(BaseNodePostprocessor):
+    """Order retrieved chunks by node ID instead of by score.
+    
+    The retrieved chunks are formatted into the system message, which
+    opens every LLM request. Scores differ from question to question even
+    when the same top-K chunks come back, so ordering by score would turn
+    the same chunks into a different prompt. A fixed order keeps the
+    prompt prefix byte-identical across such turns, so the provider's
+    automatic prompt caching can skip prefilling it again.
+    """
+    
+    @classmethod
+    def class_name(cls) -> str:
+        return "StableContextOrder"
+    
+    def _postprocess_nodes(
+        self,
+        nodes: List[NodeWithScore],
+        query_bundle: Optional[QueryBundle] = None,
+    ) -> List[NodeWithScore]:
+        return sorted(nodes, key=lambda node: node.node.node_id)
+
+
+# Stateless, so one instance serves every chat engine
+_STABLE_CONTEXT_ORDER = _StableContextOrder()
+
+# Maximum number of cached (top_k, vault_id) retrievers
+_RETRIEVER_CACHE_SIZE = 256
+
+
 class ChatService:
     """Service for generating RAG-based chat responses.
     
@@ -46,6 +81,8 @@ class ChatService:
         self.index = index
         self.llm = llm
         self.config = config
+        # Retrievers by (top_k, vault_id), least recently used first
+        self._retrievers: "OrderedDict[Tuple[int, Optional[str]], BaseRetriever]" = OrderedDict()
     
     async def generate_response(
         self,
@@ -94,67 +131,13 @@ class ChatService:
                 }
             )
             
-            # Create chat memory buffer for conversation history
-            memory = ChatMemoryBuffer.from_defaults(token_limit=3000)
-            
-            # Load chat history into memory (Requirement 5.6)
-            for msg in chat_history:
-                memory.put(msg)
-            
-            logger.debug(
-                "Chat history loaded into memory",
-                extra={"session_id": session_id, "messages": len(chat_history)}
-            )
-            
-            # Create LLM with specified temperature
-            # For custom API endpoints, use CustomOpenAI to avoid model validation
-            if self.config.openai_api_base:
-                llm_with_temp = CustomOpenAI(
-                    model=self.llm.model,
-                    temperature=temperature,
-                    api_key=self.config.openai_api_key,
-                    api_base=self.config.openai_api_base,
-                )
-            else:
-                llm_with_temp = OpenAI(
-                    model=self.llm.model,
-                    temperature=temperature,
-                    api_key=self.config.openai_api_key,
-                )
-
-            
-            # Create filters if vault_id is provided
-            filters = None
-            if vault_id:
-                filters = MetadataFilters(
-                    filters=[ExactMatchFilter(key="vault_id", value=vault_id)]
-                )
-                logger.debug(
-                    "Applying vault filter",
-                    extra={"session_id": session_id, "vault_id": vault_id}
-                )
-
-            # Create chat engine with condense_plus_context mode
-            # This mode:
-            # - Condenses conversation history into a standalone question
-            # - Performs vector similarity search (Requirement 5.4)
-            # - Retrieves top_k chunks (Requirement 5.5)
-            # - Generates response with context (Requirement 5.6, 5.7)
-            chat_engine = self.index.as_chat_engine(
-                chat_mode="condense_plus_context",
-                memory=memory,
-                similarity_top_k=top_k,
-                llm=llm_with_temp,
-                filters=filters,
+            chat_engine = self._create_chat_engine(
+                chat_history, top_k, temperature, session_id, vault_id
             )
             
-            logger.debug(
-                "Chat engine created",
-                extra={"session_id": session_id, "mode": "condense_plus_context"}
-            )
-            
-            # Generate response
-            response = chat_engine.chat(message)
+            # Generate response with the engine's native async path, so the
+            # event loop keeps serving other requests during the LLM calls
+            response = await chat_engine.achat(message)
             
             # Extract source nodes and format as Source objects (Requirement 5.9)
             sources = self._extract_sources(response)
@@ -178,6 +161,205 @@ class ChatService:
             )
             raise ChatGenerationError(session_id=session_id, reason=str(e)) from e
     
+    async def generate_response_stream(
+        self,
+        message: str,
+        chat_history: List[ChatMessage],
+        top_k: int,
+        temperature: float,
+        session_id: str = "unknown",
+        vault_id: str = None
+    ) -> Tuple[AsyncIterator[str], List[Source]]:
+        """Generate a response as a stream of text deltas.
+        
+        Retrieval and question condensing finish before this returns, so
+        the sources are known up front; the answer text is then yielded
+        as the LLM produces it.
+        
+        Args:
+            message: User's current message
+            chat_history: Previous messages in the conversation
+            top_k: Number of document chunks to retrieve
+            temperature: LLM temperature for response generation
+            session_id: Session ID for logging purposes
+            vault_id: Optional vault to restrict retrieval to
+            
+        Returns:
+            Tuple[AsyncIterator[str], List[Source]]: Text deltas and sources
+            
+        Raises:
+            ChatGenerationError: If response generation fails, including
+                while the deltas are being consumed
+        """
+        try:
+            logger.info(
+                "Streaming chat response",
+                extra={
+                    "session_id": session_id,
+                    "message_length": len(message),
+                    "history_length": len(chat_history),
+                    "top_k": top_k,
+                    "temperature": temperature,
+                }
+            )
+            
+            chat_engine = self._create_chat_engine(
+                chat_history, top_k, temperature, session_id, vault_id
+            )
+            
+            response = await chat_engine.astream_chat(message)
+            
+            sources = self._extract_sources(response)
+            
+        except Exception as e:
+            logger.error(
+                "Failed to start chat response stream",
+                extra={"session_id": session_id, "error": str(e)},
+                exc_info=True
+            )
+            raise ChatGenerationError(session_id=session_id, reason=str(e)) from e
+        
+        return self._stream_deltas(response, session_id, len(sources)), sources
+    
+    async def _stream_deltas(
+        self,
+        response: StreamingAgentChatResponse,
+        session_id: str,
+        sources_count: int
+    ) -> AsyncIterator[str]:
+        """Yield the text deltas of a streaming chat response.
+        
+        Args:
+            response: Response returned by astream_chat()
+            session_id: Session ID for logging purposes
+            sources_count: Number of sources, for logging
+            
+        Yields:
+            str: Next piece of the answer text
+            
+        Raises:
+            ChatGenerationError: If the LLM stream fails
+        """
+        response_length = 0
+        try:
+            async for delta in response.async_response_gen():
+                response_length += len(delta)
+                yield delta
+        except Exception as e:
+            logger.error(
+                "Chat response stream failed",
+                extra={"session_id": session_id, "error": str(e)},
+                exc_info=True
+            )
+            raise ChatGenerationError(session_id=session_id, reason=str(e)) from e
+        
+        logger.info(
+            "Chat response streamed successfully",
+            extra={
+                "session_id": session_id,
+                "response_length": response_length,
+                "sources_count": sources_count,
+            }
+        )
+    
+    def _create_chat_engine(
+        self,
+        chat_history: List[ChatMessage],
+        top_k: int,
+        temperature: float,
+        session_id: str,
+        vault_id: str = None
+    ) -> CondensePlusContextChatEngine:
+        """Create a condense_plus_context chat engine for one request.
+        
+        Args:
+            chat_history: Previous messages in the conversation
+            top_k: Number of document chunks to retrieve
+            temperature: LLM temperature for response generation
+            session_id: Session ID for logging purposes
+            vault_id: Optional vault to restrict retrieval to
+            
+        Returns:
+            CondensePlusContextChatEngine: Chat engine with history loaded into memory
+        """
+        # Create chat memory buffer loaded with the conversation history
+        # (Requirement 5.6) in one call rather than a put() per message.
+        # The tokenizer is a process-wide cached instance, not loaded here.
+        memory = ChatMemoryBuffer.from_defaults(chat_history=chat_history, token_limit=3000)
+        
+        logger.debug(
+            "Chat history loaded into memory",
+            extra={"session_id": session_id, "messages": len(chat_history)}
+        )
+        
+        # Per-request copy of the shared LLM with the requested temperature.
+        # The shared instance is never mutated, and the copy reuses its
+        # OpenAI clients and their keep-alive connections (pydantic's copy()
+        # shares private attributes) instead of opening new ones.
+        llm_with_temp = self.llm.copy(update={"temperature": temperature})
+        
+        # Create chat engine with condense_plus_context mode
+        # This mode:
+        # - Condenses conversation history into a standalone question
+        # - Performs vector similarity search (Requirement 5.4)
+        # - Retrieves top_k chunks (Requirement 5.5)
+        # - Generates response with context (Requirement 5.6, 5.7)
+        # The engine holds this request's memory, so it is built per request
+        # from the cached retriever; chunks are put into the prompt in a
+        # stable order for prompt caching.
+        chat_engine = CondensePlusContextChatEngine.from_defaults(
+            retriever=self._get_retriever(top_k, vault_id),
+            llm=llm_with_temp,
+            memory=memory,
+            node_postprocessors=[_STABLE_CONTEXT_ORDER],
+        )
+        
+        logger.debug(
+            "Chat engine created",
+            extra={"session_id": session_id, "mode": "condense_plus_context"}
+        )
+        
+        return chat_engine
+    
+    def _get_retriever(self, top_k: int, vault_id: Optional[str]) -> BaseRetriever:
+        """Return the retriever for a top_k and vault filter, creating it once.
+        
+        Retrievers hold no per-request state, so one per (top_k, vault_id)
+        is shared by all requests. The least recently used one is dropped
+        when more than _RETRIEVER_CACHE_SIZE are cached.
+        
+        Args:
+            top_k: Number of document chunks to retrieve
+            vault_id: Optional vault to restrict retrieval to
+            
+        Returns:
+            BaseRetriever: Vector retriever over the index
+        """
+        key = (top_k, vault_id)
+        retriever = self._retrievers.get(key)
+        if retriever is not None:
+            self._retrievers.move_to_end(key)
+            return retriever
+        
+        # Create filters if vault_id is provided
+        filters = None
+        if vault_id:
+            filters = MetadataFilters(
+                filters=[ExactMatchFilter(key="vault_id", value=vault_id)]
+            )
+        
+        retriever = self.index.as_retriever(similarity_top_k=top_k, filters=filters)
+        self._retrievers[key] = retriever
+        if len(self._retrievers) > _RETRIEVER_CACHE_SIZE:
+            self._retrievers.popitem(last=False)
+        
+        logger.debug(
+            "Retriever created",
+            extra={"top_k": top_k, "vault_id": vault_id}
+        )
+        
+        return retriever
+    
     def _extract_sources(self, response) -> List[Source]:
         """Extract source nodes from response and format as Source objects.
         
@@ -188,30 +370,22 @@ class ChatService:
             response: Chat engine response object with source_nodes
             
         Returns:
-            List[Source]: Formatted source information
+            List[Source]: Formatted source information, most relevant first
         """
-        sources = []
-        
-        # Check if response has source nodes
-        if hasattr(response, 'source_nodes') and response.source_nodes:
-            for node in response.source_nodes:
-                # Extract metadata
-                metadata = node.metadata if hasattr(node, 'metadata') else {}
-                document_id = metadata.get('document_id', 'unknown')
-                title = metadata.get('title')
-                
-                # Get text snippet (limit to 200 characters)
-                text = node.text if hasattr(node, 'text') else ''
-                snippet = text[:200] if text else ''
-                
-                # Get relevance score
-                score = node.score if hasattr(node, 'score') else 0.0
-                
-                sources.append(Source(
-                    document_id=document_id,
-                    title=title,
-                    snippet=snippet,
-                    score=score
-                ))
+        # Retrieved nodes are NodeWithScore objects, which always have
+        # metadata, text and score; only score may be None
+        nodes = getattr(response, 'source_nodes', None) or ()
         
+        # The chunks were reordered for the prompt; report them by relevance.
+        # Snippets are limited to 200 characters.
+        sources = [
+            Source(
+                document_id=node.metadata.get('document_id', 'unknown'),
+                title=node.metadata.get('title'),
+                snippet=node.text[:200],
+                score=node.score or 0.0
+            )
+            for node in nodes
+        ]
+        sources.sort(key=lambda source: source.score, reverse=True)
         return sources
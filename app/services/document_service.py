@@ -6,34 +6,139 @@ This service handles:
 - Document listing and retrieval (Requirements 9.2, 9.3)
 """
 
-import json
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import asyncio
+import os
+import time
+import uuid
+from typing import AsyncIterator, List, Optional, Dict, Any
 
-from llama_index.core import VectorStoreIndex, Document
-from llama_index.core.schema import TextNode
+import asyncpg
+from llama_index.core import VectorStoreIndex, Document, Settings
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.ingestion import run_transformations
+from llama_index.core.schema import MetadataMode, TextNode
 
 from app.db.database import Database
 from app.models.database import DocumentInfo
+from app.services.semantic_cache import SemanticResponseCache
 from app.logging_config import get_logger
 from app.exceptions import DocumentIngestError, DocumentNotFoundError
 
 
 logger = get_logger(__name__)
 
+# Columns written for each document by ingest_batch(); created_at and
+# updated_at are filled in by the columns' now() defaults
+_DOCUMENT_COPY_COLUMNS = ("id", "title", "source", "vault_id", "metadata_json")
+
+# Deletes a document row and reports whether it existed in one round trip
+_DELETE_DOCUMENT_QUERY = "DELETE FROM documents WHERE id = $1 RETURNING vault_id"
+
+# Rows fetched per keyset page by iter_all()
+_DOCUMENT_PAGE_SIZE = 500
+
+# Embedding batches requested ahead of the one being written to the index,
+# so bulk ingestion stays within the embedding API's rate limits
+_EMBED_PREFETCH_BATCHES = 4
+
+
+def new_document_id() -> str:
+    """Generate a time-ordered UUIDv7 document ID (RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so new IDs sort
+    after older ones and inserts land on the right edge of the documents
+    primary key index instead of on random leaf pages as with uuid4.
+    
+    Returns:
+        str: Canonical UUID string
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+def _build_document(
+    document_id: str,
+    text: str,
+    title: Optional[str],
+    source: Optional[str],
+    vault_id: Optional[str],
+    metadata: Dict[str, Any]
+) -> Document:
+    """Create the LlamaIndex Document for an ingested document.
+    
+    The document's fields are stored as metadata, which is preserved
+    with each chunk.
+    
+    Args:
+        document_id: Unique identifier for the document
+        text: Document text content
+        title: Optional document title
+        source: Optional document source
+        vault_id: Optional vault identifier for multi-tenancy
+        metadata: Additional metadata
+        
+    Returns:
+        Document: Document ready to be chunked
+    """
+    doc_metadata = {
+        "document_id": document_id,
+        "title": title,
+        "source": source,
+        "vault_id": vault_id,
+        **metadata
+    }
+    return Document(text=text, metadata=doc_metadata, id_=document_id)
+
+
+def _row_to_document(row: asyncpg.Record) -> DocumentInfo:
+    """Build a DocumentInfo from a database row without re-validating it.
+    
+    The row's values already have the model's types, so the model is
+    built with model_construct() instead of running pydantic validation.
+    
+    Args:
+        row: documents row with all DocumentInfo columns
+        
+    Returns:
+        DocumentInfo: Document metadata built from the row
+    """
+    return DocumentInfo.model_construct(
+        id=row["id"],
+        title=row["title"],
+        source=row["source"],
+        vault_id=row["vault_id"],
+        metadata_json=row["metadata_json"] or {},
+        created_at=row["created_at"],
+        updated_at=row["updated_at"]
+    )
+
 
 class DocumentService:
     """Service for document ingestion and management."""
     
-    def __init__(self, db: Database, index: VectorStoreIndex):
+    def __init__(
+        self,
+        db: Database,
+        index: VectorStoreIndex,
+        embed_model: BaseEmbedding,
+        response_cache: Optional[SemanticResponseCache] = None
+    ):
         """Initialize DocumentService.
         
         Args:
             db: Database instance for metadata storage
             index: LlamaIndex VectorStoreIndex for vector storage
+            embed_model: Embedding model used to embed document chunks
+            response_cache: Optional SemanticResponseCache whose answers
+                are invalidated when documents change
         """
         self.db = db
         self.index = index
+        self.embed_model = embed_model
+        self.response_cache = response_cache
     
     async def ingest(
         self,
@@ -84,57 +189,46 @@ class DocumentService:
         
         try:
             # Create LlamaIndex Document with metadata (Requirement 2.2)
-            # Metadata will be preserved with each chunk
-            doc_metadata = {
-                "document_id": document_id,
-                "title": title,
-                "source": source,
-                "vault_id": vault_id,
-                **metadata
-            }
-            
-            # Create Document object
-            llama_doc = Document(
-                text=text,
-                metadata=doc_metadata,
-                id_=document_id
-            )
+            llama_doc = _build_document(document_id, text, title, source, vault_id, metadata)
             
             logger.debug(
                 "Document object created",
                 extra={"document_id": document_id}
             )
             
-            # Insert into vector index (Requirements 2.3, 2.4, 2.5)
-            # LlamaIndex will automatically:
-            # - Chunk the text (Requirement 2.3)
-            # - Generate embeddings (Requirement 2.4)
-            # - Store in vector store (Requirement 2.5)
-            self.index.insert(llama_doc)
+            # Chunk the text (Requirement 2.3)
+            nodes = run_transformations([llama_doc], Settings.transformations)
+            
+            # Generate embeddings (Requirement 2.4) and store them in the
+            # vector store (Requirement 2.5) as a pipeline
+            await self._embed_and_insert(nodes)
             
             logger.info(
                 "Document inserted into vector index",
-                extra={"document_id": document_id}
+                extra={"document_id": document_id, "chunk_count": len(nodes)}
             )
             
-            # Store document metadata in database (Requirement 2.6)
-            now = datetime.utcnow()
-            
+            # Store document metadata in database (Requirement 2.6);
+            # created_at and updated_at come from the columns' now() defaults
             query = """
-                INSERT INTO documents (id, title, source, vault_id, metadata_json, created_at, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
+                INSERT INTO documents (id, title, source, vault_id, metadata_json)
+                VALUES ($1, $2, $3, $4, $5)
             """
             
-            await self.db.execute(
-                query,
-                document_id,
-                title,
-                source,
-                vault_id,
-                json.dumps(metadata),
-                now,
-                now
-            )
+            try:
+                await self.db.execute(
+                    query,
+                    document_id,
+                    title,
+                    source,
+                    vault_id,
+                    metadata
+                )
+            except Exception:
+                # Do not leave vectors behind without their documents row
+                await self._delete_nodes(nodes)
+                raise
+            await self._invalidate_vault(vault_id)
             
             logger.info(
                 "Document metadata saved to database",
@@ -151,6 +245,183 @@ class DocumentService:
             )
             raise DocumentIngestError(document_id=document_id, reason=str(e)) from e
     
+    async def ingest_batch(self, documents: List[Dict[str, Any]]) -> List[str]:
+        """Ingest many documents with batched embedding and one COPY.
+        
+        Chunks of all documents are embedded together, so small documents
+        share embedding API requests instead of costing one request each,
+        and the documents rows are written with a single COPY instead of
+        one INSERT per document.
+        
+        If the batch fails, the vectors already written for it are deleted
+        again, so no document is left with vectors but no documents row.
+        
+        Args:
+            documents: Documents to ingest, each a dict with the keyword
+                arguments of ingest() ("document_id" and "text" required;
+                "title", "source", "vault_id" and "metadata" optional)
+                
+        Returns:
+            List[str]: The document_ids of the ingested documents, in order
+            
+        Raises:
+            DocumentIngestError: If ingestion of the batch fails
+        """
+        if not documents:
+            return []
+        
+        document_ids = [doc["document_id"] for doc in documents]
+        
+        logger.info(
+            "Starting batch document ingestion",
+            extra={"document_count": len(documents)}
+        )
+        
+        try:
+            llama_docs = [
+                _build_document(
+                    doc["document_id"],
+                    doc["text"],
+                    doc.get("title"),
+                    doc.get("source"),
+                    doc.get("vault_id"),
+                    doc.get("metadata") or {}
+                )
+                for doc in documents
+            ]
+            
+            nodes = run_transformations(llama_docs, Settings.transformations)
+            await self._embed_and_insert(nodes)
+            
+            logger.info(
+                "Documents inserted into vector index",
+                extra={"document_count": len(documents), "chunk_count": len(nodes)}
+            )
+            
+            try:
+                await self.db.copy_records_to_table(
+                    "documents",
+                    records=[
+                        (
+                            doc["document_id"],
+                            doc.get("title"),
+                            doc.get("source"),
+                            doc.get("vault_id"),
+                            doc.get("metadata") or {}
+                        )
+                        for doc in documents
+                    ],
+                    columns=_DOCUMENT_COPY_COLUMNS
+                )
+            except Exception:
+                # Do not leave vectors behind without their documents rows
+                await self._delete_nodes(nodes)
+                raise
+            
+        except Exception as e:
+            logger.error(
+                "Batch document ingestion failed",
+                extra={"document_count": len(documents), "error": str(e)},
+                exc_info=True
+            )
+            raise DocumentIngestError(
+                document_id=f"{document_ids[0]} (batch of {len(documents)})",
+                reason=str(e)
+            ) from e
+        
+        finally:
+            # Vectors may have been written, and their cleanup may have
+            # failed, even if the batch failed
+            for vault_id in {doc.get("vault_id") for doc in documents}:
+                await self._invalidate_vault(vault_id)
+        
+        logger.info(
+            "Document metadata saved to database",
+            extra={"document_count": len(documents)}
+        )
+        
+        return document_ids
+    
+    async def _embed_and_insert(self, nodes: List[TextNode]) -> None:
+        """Embed chunks and write them to the vector index, overlapping the two.
+        
+        Chunks are embedded in embed_batch_size batches, with at most
+        _EMBED_PREFETCH_BATCHES requests to the embedding API in flight.
+        Batches are written to the index in order as soon as each one's
+        embeddings arrive, in a worker thread, so vector store writes run
+        while later batches are still being embedded.
+        
+        If a batch fails, the batches already written are deleted again.
+        
+        Args:
+            nodes: Chunked nodes of one or more documents
+        """
+        batch_size = self.embed_model.embed_batch_size
+        batches = [nodes[i:i + batch_size] for i in range(0, len(nodes), batch_size)]
+        embed_tasks = [self._embed_batch(batch) for batch in batches[:_EMBED_PREFETCH_BATCHES]]
+        inserted: List[TextNode] = []
+        
+        try:
+            for i, batch in enumerate(batches):
+                embeddings = await embed_tasks[i]
+                
+                # Keep the prefetch window full while this batch is written
+                if i + _EMBED_PREFETCH_BATCHES < len(batches):
+                    embed_tasks.append(self._embed_batch(batches[i + _EMBED_PREFETCH_BATCHES]))
+                
+                for node, embedding in zip(batch, embeddings):
+                    node.embedding = embedding
+                
+                # Nodes that already carry an embedding are not re-embedded
+                # by the index
+                await asyncio.to_thread(self.index.insert_nodes, batch)
+                inserted.extend(batch)
+        except Exception:
+            # Stop outstanding embedding requests and drop the vectors
+            # already written, which would have no documents row
+            for embed_task in embed_tasks:
+                embed_task.cancel()
+            await self._delete_nodes(inserted)
+            raise
+    
+    def _embed_batch(self, batch: List[TextNode]) -> "asyncio.Future[List[List[float]]]":
+        """Start embedding one batch of chunks.
+        
+        Args:
+            batch: Chunks to embed in one embedding API request
+            
+        Returns:
+            asyncio.Future: Future resolving to one embedding per chunk
+        """
+        return asyncio.ensure_future(
+            self.embed_model.aget_text_embedding_batch(
+                [node.get_content(metadata_mode=MetadataMode.EMBED) for node in batch]
+            )
+        )
+    
+    async def _delete_nodes(self, nodes: List[TextNode]) -> None:
+        """Delete vectors written for a failed ingestion.
+        
+        A failed cleanup is logged, not raised, so the caller still reports
+        the original ingestion error.
+        
+        Args:
+            nodes: Nodes whose vectors were written to the index
+        """
+        if not nodes:
+            return
+        
+        try:
+            await asyncio.to_thread(
+                self.index.delete_nodes, [node.node_id for node in nodes]
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to delete vectors of failed ingestion",
+                extra={"chunk_count": len(nodes), "error": str(e)},
+                exc_info=True
+            )
+    
     async def list_all(self, vault_id: Optional[str] = None) -> List[DocumentInfo]:
         """Retrieve all documents from database.
         
@@ -169,34 +440,90 @@ class DocumentService:
                 SELECT id, title, source, vault_id, metadata_json, created_at, updated_at
                 FROM documents
                 WHERE vault_id = $1
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
             """
             rows = await self.db.fetch(query, vault_id)
         else:
             query = """
                 SELECT id, title, source, vault_id, metadata_json, created_at, updated_at
                 FROM documents
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
             """
             rows = await self.db.fetch(query)
         
-        documents = []
-        for row in rows:
-            doc = DocumentInfo(
-                id=row["id"],
-                title=row["title"],
-                source=row["source"],
-                vault_id=row["vault_id"],
-                metadata_json=json.loads(row["metadata_json"]) if row["metadata_json"] else {},
-                created_at=row["created_at"],
-                updated_at=row["updated_at"]
-            )
-            documents.append(doc)
+        documents = [_row_to_document(row) for row in rows]
         
-        logger.info(f"Retrieved {len(documents)} documents")
+        logger.info("Retrieved %d documents", len(documents))
         
         return documents
     
+    async def iter_all(
+        self,
+        vault_id: Optional[str] = None,
+        page_size: int = _DOCUMENT_PAGE_SIZE
+    ) -> AsyncIterator[DocumentInfo]:
+        """Stream documents from the database one at a time.
+        
+        Same rows and ordering as list_all(), read in keyset pages of
+        page_size rows. Each page is its own query, so no connection or
+        transaction is held while the caller works through a page (for
+        example while a slow client downloads it), and memory use stays
+        flat for large vaults.
+        
+        Args:
+            vault_id: Optional vault identifier to filter documents
+            page_size: Number of rows fetched per query
+        
+        Yields:
+            DocumentInfo: Document metadata, newest first
+        """
+        logger.debug("Streaming documents", extra={"vault_id": vault_id})
+        
+        if vault_id:
+            first_page_query = """
+                SELECT id, title, source, vault_id, metadata_json, created_at, updated_at
+                FROM documents
+                WHERE vault_id = $1
+                ORDER BY created_at DESC, id DESC
+                LIMIT $2
+            """
+            next_page_query = """
+                SELECT id, title, source, vault_id, metadata_json, created_at, updated_at
+                FROM documents
+                WHERE vault_id = $1
+                  AND created_at <= $3
+                  AND (created_at, id) < ($3, $4)
+                ORDER BY created_at DESC, id DESC
+                LIMIT $2
+            """
+            args = (vault_id, page_size)
+        else:
+            first_page_query = """
+                SELECT id, title, source, vault_id, metadata_json, created_at, updated_at
+                FROM documents
+                ORDER BY created_at DESC, id DESC
+                LIMIT $1
+            """
+            next_page_query = """
+                SELECT id, title, source, vault_id, metadata_json, created_at, updated_at
+                FROM documents
+                WHERE created_at <= $2
+                  AND (created_at, id) < ($2, $3)
+                ORDER BY created_at DESC, id DESC
+                LIMIT $1
+            """
+            args = (page_size,)
+        
+        rows = await self.db.fetch(first_page_query, *args)
+        while rows:
+            for row in rows:
+                yield _row_to_document(row)
+            if len(rows) < page_size:
+                return
+            # Resume after the last row of this page
+            last = rows[-1]
+            rows = await self.db.fetch(next_page_query, *args, last["created_at"], last["id"])
+    
     async def get_by_id(self, document_id: str) -> Optional[DocumentInfo]:
         """Retrieve specific document by ID.
         
@@ -224,15 +551,7 @@ class DocumentService:
         
         logger.info("Document retrieved", extra={"document_id": document_id})
         
-        return DocumentInfo(
-            id=row["id"],
-            title=row["title"],
-            source=row["source"],
-            vault_id=row["vault_id"],
-            metadata_json=json.loads(row["metadata_json"]) if row["metadata_json"] else {},
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
-        )
+        return _row_to_document(row)
 
     async def delete(self, document_id: str) -> None:
         """Delete document from vector store and database.
@@ -246,41 +565,43 @@ class DocumentService:
         """
         logger.info("Deleting document", extra={"document_id": document_id})
         
-        # Check if document exists in database first
-        existing_doc = await self.get_by_id(document_id)
-        if not existing_doc:
-            raise DocumentNotFoundError(document_id=document_id)
-            
+        row = None
         try:
-            # Delete from LlamaIndex vector store
-            # delete_ref_doc removes the document and all its nodes from the index
-            # delete_from_docstore=True ensures it's removed from the docstore if one is configured
-            self.index.delete_ref_doc(document_id, delete_from_docstore=True)
-            
-            logger.info(
-                "Document deleted from vector index",
-                extra={"document_id": document_id}
-            )
-            
-            # Delete from database
-            query = "DELETE FROM documents WHERE id = $1"
-            await self.db.execute(query, document_id)
+            async with self.db.transaction() as conn:
+                # Delete the row and check that it existed in one round trip;
+                # it is rolled back if removing the vectors below fails
+                row = await conn.fetchrow(_DELETE_DOCUMENT_QUERY, document_id)
+                if row is None:
+                    raise DocumentNotFoundError(document_id=document_id)
+                
+                try:
+                    # Delete from LlamaIndex vector store
+                    # delete_ref_doc removes the document and all its nodes from the index
+                    # delete_from_docstore=True ensures it's removed from the docstore if one is configured
+                    await asyncio.to_thread(
+                        self.index.delete_ref_doc, document_id, delete_from_docstore=True
+                    )
+                    
+                    logger.info(
+                        "Document deleted from vector index",
+                        extra={"document_id": document_id}
+                    )
+                    
+                except KeyError:
+                    # LlamaIndex raises KeyError if doc_id not found in index
+                    # We still want to proceed with DB deletion if it was in DB
+                    logger.warning(
+                        "Document not found in vector index during deletion",
+                        extra={"document_id": document_id}
+                    )
             
             logger.info(
                 "Document metadata deleted from database",
                 extra={"document_id": document_id}
             )
             
-        except KeyError:
-            # LlamaIndex raises KeyError if doc_id not found in index
-            # We still want to proceed with DB deletion if it was in DB
-            logger.warning(
-                "Document not found in vector index during deletion",
-                extra={"document_id": document_id}
-            )
-            # Continue to delete from DB
-            query = "DELETE FROM documents WHERE id = $1"
-            await self.db.execute(query, document_id)
+        except DocumentNotFoundError:
+            raise
             
         except Exception as e:
             logger.error(
@@ -289,3 +610,26 @@ class DocumentService:
                 exc_info=True
             )
             raise
+        
+        finally:
+            if row is not None:
+                await self._invalidate_vault(row["vault_id"])
+    
+    async def _invalidate_vault(self, vault_id: Optional[str]) -> None:
+        """Drop cached answers that depend on a vault's documents.
+        
+        A failure to publish the invalidation to other workers is logged
+        rather than raised; the document change itself has already happened.
+        
+        Args:
+            vault_id: Vault the changed document belongs to
+        """
+        if self.response_cache is not None:
+            try:
+                await self.response_cache.invalidate(vault_id)
+            except Exception as e:
+                logger.error(
+                    "Failed to invalidate semantic cache",
+                    extra={"vault_id": vault_id, "error": str(e)},
+                    exc_info=True
+                )
@@ -1,6 +1,5 @@
 """Message management service for handling conversation history."""
 
-from datetime import datetime
 from typing import List
 from llama_index.core.llms import ChatMessage, MessageRole as LlamaMessageRole
 
@@ -12,6 +11,40 @@ from app.exceptions import MessageSaveError
 
 logger = get_logger(__name__)
 
+# Map stored role values straight to LlamaIndex roles
+_LLAMA_ROLES = {
+    MessageRole.USER.value: LlamaMessageRole.USER,
+    MessageRole.ASSISTANT.value: LlamaMessageRole.ASSISTANT,
+    MessageRole.SYSTEM.value: LlamaMessageRole.SYSTEM,
+}
+
+# Hot-path chat SQL. asyncpg keeps a per-connection cache of prepared
+# statements keyed on query text, so reusing these exact strings means each
+# pooled connection parses and plans them once.
+_SAVE_MESSAGE_QUERY = """
+    INSERT INTO messages (session_id, role, content)
+    VALUES ($1, $2, $3)
+    RETURNING id, session_id, role, content, created_at
+"""
+
+# Served in order by idx_messages_session_created_covering; content is
+# read from the heap since it is too large to keep in the index
+_RECENT_MESSAGES_QUERY = """
+    SELECT role, content, created_at
+    FROM messages
+    WHERE session_id = $1
+    ORDER BY created_at DESC
+    LIMIT $2
+"""
+
+_RECENT_CHAT_HISTORY_QUERY = """
+    SELECT role, content
+    FROM messages
+    WHERE session_id = $1
+    ORDER BY created_at DESC
+    LIMIT $2
+"""
+
 
 class MessageService:
     """Service for managing conversation messages."""
@@ -69,14 +102,8 @@ class MessageService:
                 }
             )
             
-            now = datetime.now()
-            query = """
-                INSERT INTO messages (session_id, role, content, created_at)
-                VALUES ($1, $2, $3, $4)
-                RETURNING id, session_id, role, content, created_at
-            """
-            
-            row = await self.db.fetchrow(query, session_id, role, content, now)
+            # created_at comes from the column default
+            row = await self.db.fetchrow(_SAVE_MESSAGE_QUERY, session_id, role, content)
             
             message = Message(
                 id=row['id'],
@@ -128,21 +155,12 @@ class MessageService:
             extra={"session_id": session_id, "limit": limit}
         )
         
-        query = """
-            SELECT id, session_id, role, content, created_at
-            FROM messages
-            WHERE session_id = $1
-            ORDER BY created_at DESC
-            LIMIT $2
-        """
-        
-        rows = await self.db.fetch(query, session_id, limit)
+        rows = await self.db.fetch(_RECENT_MESSAGES_QUERY, session_id, limit)
         
         # Convert rows to Message objects and reverse to get chronological order
         messages = [
             Message(
-                id=row['id'],
-                session_id=row['session_id'],
+                session_id=session_id,
                 role=MessageRole(row['role']),
                 content=row['content'],
                 created_at=row['created_at']
@@ -157,6 +175,39 @@ class MessageService:
         
         return messages
     
+    async def get_recent_chat_history(
+        self,
+        session_id: str,
+        limit: int = 10
+    ) -> List[ChatMessage]:
+        """Get recent messages for a session as LlamaIndex ChatMessages.
+        
+        Projects only role and content and builds ChatMessage objects
+        straight from the database records, skipping the intermediate
+        Message models used by get_recent_messages().
+        
+        Args:
+            session_id: Session identifier to retrieve messages for
+            limit: Maximum number of messages to retrieve (default: 10)
+            
+        Returns:
+            List of ChatMessage objects in chronological order (oldest first)
+        """
+        rows = await self.db.fetch(_RECENT_CHAT_HISTORY_QUERY, session_id, limit)
+        
+        logger.debug(
+            "Retrieved recent chat history",
+            extra={"session_id": session_id, "count": len(rows)}
+        )
+        
+        return [
+            ChatMessage(
+                role=_LLAMA_ROLES.get(row['role'], LlamaMessageRole.USER),
+                content=row['content']
+            )
+            for row in reversed(rows)
+        ]
+    
     def format_for_chat_engine(self, messages: List[Message]) -> List[ChatMessage]:
         """Convert Message objects to LlamaIndex ChatMessage format.
         
@@ -169,22 +220,11 @@ class MessageService:
         Returns:
             List of ChatMessage objects for LlamaIndex
         """
-        chat_messages = []
-        
-        for msg in messages:
-            # Map our MessageRole to LlamaIndex MessageRole
-            if msg.role == MessageRole.USER:
-                llama_role = LlamaMessageRole.USER
-            elif msg.role == MessageRole.ASSISTANT:
-                llama_role = LlamaMessageRole.ASSISTANT
-            elif msg.role == MessageRole.SYSTEM:
-                llama_role = LlamaMessageRole.SYSTEM
-            else:
-                # Fallback, though this shouldn't happen with enum validation
-                llama_role = LlamaMessageRole.USER
-            
-            chat_messages.append(
-                ChatMessage(role=llama_role, content=msg.content)
+        # Unknown roles fall back to USER, though enum validation prevents them
+        return [
+            ChatMessage(
+                role=_LLAMA_ROLES.get(msg.role.value, LlamaMessageRole.USER),
+                content=msg.content
             )
-        
-        return chat_messages
+            for msg in messages
+        ]
@@ -0,0 +1,208 @@
+"""Semantic response cache for chat answers.
+
+This service handles:
+- Embedding incoming questions and matching them against recent answers
+- Serving a cached answer when a question is close enough to an earlier one
+- LRU eviction and TTL expiry of cached answers
+- Invalidation per vault when documents are ingested or deleted, shared
+  across worker processes through the database
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from llama_index.core.base.embeddings.base import BaseEmbedding
+
+from app.db.database import Database
+from app.models.responses import Source
+from app.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Generation counters live in the database so an invalidation in one worker
+# reaches every worker's cache; the empty scope stands for unfiltered chats
+_GET_GENERATION_QUERY = """
+    SELECT generation FROM response_cache_generations WHERE scope = $1
+"""
+
+_BUMP_GENERATIONS_QUERY = """
+    INSERT INTO response_cache_generations (scope, generation)
+    SELECT scope, 1 FROM unnest($1::text[]) AS scope
+    ON CONFLICT (scope) DO UPDATE
+        SET generation = response_cache_generations.generation + 1
+    RETURNING scope, generation
+"""
+
+
+def _scope(vault_id: Optional[str]) -> str:
+    """Return the generation row key for a vault (empty for unfiltered chats)."""
+    return vault_id or ""
+
+
+class CacheQuery(NamedTuple):
+    """An embedded question together with the scope it was asked in."""
+    vector: np.ndarray
+    vault_id: Optional[str]
+    top_k: int
+    generation: int
+
+
+class _CacheEntry(NamedTuple):
+    query: CacheQuery
+    answer: str
+    sources: List[Source]
+    expires_at: float
+    slot: int
+
+
+class SemanticResponseCache:
+    """In-process LRU cache of chat answers keyed by question similarity."""
+    
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        threshold: float = 0.92,
+        ttl: float = 3600.0,
+        max_size: int = 1024,
+        db: Optional[Database] = None
+    ):
+        """Initialize SemanticResponseCache.
+        
+        Args:
+            embed_model: Embedding model used to embed questions
+            threshold: Minimum cosine similarity for a cache hit
+            ttl: Seconds a cached answer stays valid
+            max_size: Maximum number of cached answers
+            db: Optional Database holding the generation counters shared by
+                all workers; without it invalidation is local to this process
+        """
+        self.embed_model = embed_model
+        self.db = db
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, _CacheEntry]" = OrderedDict()
+        self._next_id = 0
+        # Bumped whenever documents in a vault change; None covers unfiltered chats
+        self._generations: Dict[Optional[str], int] = {}
+        # Unit-normalized question vectors, one row per slot, allocated on the
+        # first put(); rows [0, len(self._entries)) are in use
+        self._vectors: Optional[np.ndarray] = None
+        # Entry id stored in each slot
+        self._slot_ids: List[int] = []
+    
+    async def prepare(self, message: str, vault_id: Optional[str], top_k: int) -> CacheQuery:
+        """Embed a question for lookup and later storage.
+        
+        Args:
+            message: User question
+            vault_id: Vault the chat is filtered to, if any
+            top_k: Number of chunks retrieved for the answer
+            
+        Returns:
+            CacheQuery: Normalized question embedding and its scope
+        """
+        if self.db is None:
+            embedding = await self.embed_model.aget_query_embedding(message)
+        else:
+            # Pick up invalidations made by other workers
+            embedding, generation = await asyncio.gather(
+                self.embed_model.aget_query_embedding(message),
+                self.db.fetchval(_GET_GENERATION_QUERY, _scope(vault_id))
+            )
+            self._generations[vault_id] = generation or 0
+        
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return CacheQuery(vector, vault_id, top_k, self._generations.get(vault_id, 0))
+    
+    def get(self, query: CacheQuery) -> Optional[Tuple[str, List[Source]]]:
+        """Return the cached answer closest to a question, if similar enough.
+        
+        Args:
+            query: Question prepared with prepare()
+            
+        Returns:
+            Optional[Tuple[str, List[Source]]]: Cached answer and sources, or None
+        """
+        if not self._entries:
+            return None
+        
+        now = time.monotonic()
+        similarities = self._vectors[:len(self._entries)] @ query.vector
+        candidates = np.flatnonzero(similarities >= self.threshold)
+        for slot in candidates[np.argsort(similarities[candidates])[::-1]]:
+            entry_id = self._slot_ids[slot]
+            entry = self._entries[entry_id]
+            cached = entry.query
+            if (
+                cached.vault_id == query.vault_id
+                and cached.top_k == query.top_k
+                and cached.generation == self._generations.get(cached.vault_id, 0)
+                and entry.expires_at > now
+            ):
+                self._entries.move_to_end(entry_id)
+                logger.debug(
+                    "Semantic cache hit",
+                    extra={"vault_id": query.vault_id, "similarity": float(similarities[slot])}
+                )
+                return entry.answer, entry.sources
+        
+        return None
+    
+    def put(self, query: CacheQuery, answer: str, sources: List[Source]) -> None:
+        """Cache an answer for a question.
+        
+        Answers computed before an invalidation of their vault are dropped.
+        
+        Args:
+            query: Question prepared with prepare() before generating the answer
+            answer: Generated answer
+            sources: Sources returned with the answer
+        """
+        if query.generation != self._generations.get(query.vault_id, 0):
+            return
+        
+        if self._vectors is None:
+            self._vectors = np.empty((self.max_size, len(query.vector)), dtype=np.float32)
+        
+        if len(self._entries) >= self.max_size:
+            # Reuse the least recently used entry's slot
+            slot = self._entries.popitem(last=False)[1].slot
+        else:
+            slot = len(self._entries)
+            self._slot_ids.append(-1)
+        
+        entry_id = self._next_id
+        self._next_id += 1
+        self._vectors[slot] = query.vector
+        self._slot_ids[slot] = entry_id
+        self._entries[entry_id] = _CacheEntry(
+            query, answer, sources, time.monotonic() + self.ttl, slot
+        )
+    
+    async def invalidate(self, vault_id: Optional[str]) -> None:
+        """Invalidate cached answers that may depend on a vault's documents.
+        
+        Unfiltered chats search every vault, so they are invalidated too.
+        With a database the shared counters are bumped as well, and other
+        workers see the change on their next prepare().
+        
+        Args:
+            vault_id: Vault whose documents changed; None for unassigned documents
+        """
+        keys = {vault_id, None}
+        for key in keys:
+            self._generations[key] = self._generations.get(key, 0) + 1
+        if self.db is None:
+            return
+        
+        rows = await self.db.fetch(_BUMP_GENERATIONS_QUERY, [_scope(key) for key in keys])
+        for row in rows:
+            self._generations[row["scope"] or None] = row["generation"]
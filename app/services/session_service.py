@@ -117,3 +117,40 @@ class SessionService:
             "Session last_active_at updated",
             extra={"session_id": session_id}
         )
+    
+    async def touch_session(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None
+    ) -> Session:
+        """Create the session if missing, otherwise refresh last_active_at.
+        
+        Combines get_or_create_session() and update_last_active() into a
+        single upsert so the chat path needs one database round trip.
+        
+        Args:
+            session_id: Unique identifier for the session
+            user_id: Optional user identifier, only used when creating
+            
+        Returns:
+            Session object with id, user_id, created_at, and last_active_at
+        """
+        logger.debug(
+            "Touching session",
+            extra={"session_id": session_id, "user_id": user_id}
+        )
+        
+        query = """
+            INSERT INTO sessions (id, user_id, created_at, last_active_at)
+            VALUES ($1, $2, NOW(), NOW())
+            ON CONFLICT (id) DO UPDATE SET last_active_at = NOW()
+            RETURNING id, user_id, created_at, last_active_at
+        """
+        row = await self.db.fetchrow(query, session_id, user_id)
+        
+        return Session(
+            id=row['id'],
+            user_id=row['user_id'],
+            created_at=row['created_at'],
+            last_active_at=row['last_active_at']
+        )
@@ -9,9 +9,9 @@ This service handles:
 
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from app.db.database import Database
+from app.db.database import Database, utc_now
 from app.models.database import Vault
 from app.logging_config import get_logger
 from app.exceptions import RAGAPIException
@@ -19,7 +19,6 @@ from app.exceptions import RAGAPIException
 
 logger = get_logger(__name__)
 
-
 class VaultNotFoundError(RAGAPIException):
     """Exception raised when vault is not found."""
     
@@ -83,7 +82,7 @@ class VaultService:
         
         # Generate unique vault_id
         vault_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        now = utc_now()
         
         try:
             query = """
@@ -151,7 +150,51 @@ class VaultService:
             for row in rows
         ]
         
-        logger.info(f"Retrieved {len(vaults)} vaults")
+        logger.info("Retrieved %d vaults", len(vaults))
+        
+        return vaults
+    
+    async def list_all_with_counts(self) -> List[Tuple[Vault, int]]:
+        """Retrieve all vaults together with their document counts.
+        
+        Counts come from a single grouped join, so listing N vaults costs
+        one query instead of 1 + N count_documents() calls.
+        
+        Returns:
+            List[Tuple[Vault, int]]: Vaults paired with their document counts
+        """
+        logger.debug("Listing all vaults with document counts")
+        
+        query = """
+            SELECT v.vault_id, v.name, v.description, v.created_at, v.updated_at,
+                   COALESCE(c.document_count, 0) AS document_count
+            FROM vaults v
+            LEFT JOIN (
+                SELECT vault_id, COUNT(*) AS document_count
+                FROM documents
+                WHERE vault_id IS NOT NULL
+                GROUP BY vault_id
+            ) c ON c.vault_id = v.vault_id
+            ORDER BY v.created_at DESC
+        """
+        
+        rows = await self.db.fetch(query)
+        
+        vaults = [
+            (
+                Vault(
+                    vault_id=row["vault_id"],
+                    name=row["name"],
+                    description=row["description"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"]
+                ),
+                row["document_count"]
+            )
+            for row in rows
+        ]
+        
+        logger.info("Retrieved %d vaults", len(vaults))
         
         return vaults
     
@@ -220,6 +263,54 @@ class VaultService:
             updated_at=row["updated_at"]
         )
     
+    async def get_with_count(
+        self,
+        vault_id: str
+    ) -> Optional[Tuple[Vault, int, Optional[datetime]]]:
+        """Retrieve vault by ID together with its document count.
+        
+        Also returns when the vault's newest document was created. A new
+        document always moves it forward, so with the count it changes
+        whenever the vault's documents do, even if one document is added
+        and another deleted.
+        
+        Args:
+            vault_id: Unique vault identifier
+            
+        Returns:
+            Optional[Tuple[Vault, int, Optional[datetime]]]: Vault, document
+                count and newest document created_at (None if empty), or
+                None if the vault is not found
+        """
+        # Vault row and document stats come back in one round trip
+        query = """
+            SELECT v.vault_id, v.name, v.description, v.created_at, v.updated_at,
+                   d.document_count, d.last_document_at
+            FROM vaults v
+            CROSS JOIN LATERAL (
+                SELECT COUNT(*) AS document_count, MAX(created_at) AS last_document_at
+                FROM documents
+                WHERE vault_id = v.vault_id
+            ) d
+            WHERE v.vault_id = $1
+        """
+        
+        row = await self.db.fetchrow(query, vault_id)
+        
+        if row is None:
+            logger.warning("Vault not found", extra={"vault_id": vault_id})
+            return None
+        
+        vault = Vault(
+            vault_id=row["vault_id"],
+            name=row["name"],
+            description=row["description"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+        
+        return vault, row["document_count"], row["last_document_at"]
+    
     async def count_documents(self, vault_id: str) -> int:
         """Count documents in a vault.
         
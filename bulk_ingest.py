@@ -0,0 +1,110 @@
+"""Bulk-ingest documents with the documents table's secondary indexes dropped.
+
+Every row inserted into `documents` also updates each of its secondary
+indexes. For large imports or re-indexing runs it is much cheaper to drop
+those indexes, load the rows, and rebuild each index once at the end.
+
+Usage:
+    python bulk_ingest.py documents.jsonl
+
+Each input line is a JSON object with a required "text" field and optional
+"document_id", "title", "source", "vault_id" and "metadata" fields.
+
+The indexes are dropped and rebuilt CONCURRENTLY, so the table stays
+writable, but listing queries fall back to sequential scans while the
+import runs. Run it in a maintenance window.
+"""
+import asyncio
+import json
+import sys
+
+from app.config import load_config
+from app.db.database import create_pool, Database
+from app.llama.setup import initialize_llama_components
+from app.services.document_service import DocumentService, new_document_id
+
+
+# Documents embedded and written together per DocumentService.ingest_batch call
+BATCH_SIZE = 100
+
+# Secondary indexes on documents and the statements that rebuild them
+DOCUMENT_INDEXES = {
+    "idx_documents_created": "ON documents (created_at DESC)",
+    "idx_documents_vault_created": "ON documents (vault_id, created_at DESC)",
+}
+
+
+async def drop_document_indexes(db: Database) -> None:
+    """Drop the documents table's secondary indexes."""
+    for name in DOCUMENT_INDEXES:
+        print(f"Dropping index {name}")
+        await db.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+async def create_document_indexes(db: Database) -> None:
+    """Rebuild the documents table's secondary indexes."""
+    for name, definition in DOCUMENT_INDEXES.items():
+        print(f"Rebuilding index {name}")
+        await db.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+
+
+async def bulk_ingest(path: str) -> None:
+    """Ingest every document in a JSONL file.
+
+    Args:
+        path: Path to a JSONL file with one document per line
+    """
+    config = load_config()
+    pool = await create_pool(config.db_url, min_size=1, max_size=2)
+    db = Database(pool)
+    index, _, embed_model = initialize_llama_components(config)
+    document_service = DocumentService(db=db, index=index, embed_model=embed_model)
+
+    ingested = 0
+    failed = 0
+
+    async def ingest_batch(batch: list) -> None:
+        nonlocal ingested, failed
+        try:
+            await document_service.ingest_batch(batch)
+            ingested += len(batch)
+        except Exception as e:
+            failed += len(batch)
+            print(f"✗ Failed to ingest batch of {len(batch)} documents: {e}")
+
+    try:
+        await drop_document_indexes(db)
+        try:
+            batch = []
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    doc = json.loads(line)
+                    batch.append({
+                        "document_id": doc.get("document_id") or new_document_id(),
+                        "text": doc["text"],
+                        "title": doc.get("title"),
+                        "source": doc.get("source"),
+                        "vault_id": doc.get("vault_id"),
+                        "metadata": doc.get("metadata")
+                    })
+                    if len(batch) >= BATCH_SIZE:
+                        await ingest_batch(batch)
+                        batch = []
+            if batch:
+                await ingest_batch(batch)
+        finally:
+            # Always restore the indexes, even if the import stopped early
+            await create_document_indexes(db)
+    finally:
+        await pool.close()
+
+    print(f"✓ Ingested {ingested} documents ({failed} failed)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python bulk_ingest.py <documents.jsonl>")
+        sys.exit(1)
+    asyncio.run(bulk_ingest(sys.argv[1]))
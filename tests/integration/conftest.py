@@ -151,8 +151,12 @@ def mock_config(test_db_url: str) -> Config:
 def mock_openai_embedding():
     """Mock OpenAI embedding model."""
     mock = MagicMock()
+    mock.embed_batch_size = 10
     mock.get_text_embedding = MagicMock(return_value=[0.1] * 1536)
     mock.get_text_embedding_batch = MagicMock(return_value=[[0.1] * 1536])
+    mock.aget_text_embedding_batch = AsyncMock(
+        side_effect=lambda texts, **kwargs: [[0.1] * 1536 for _ in texts]
+    )
     return mock
 
 
@@ -184,20 +188,27 @@ def mock_index(mock_vector_store):
     mock = MagicMock()
     mock.vector_store = mock_vector_store
     mock.insert = MagicMock()
+    mock.insert_nodes = MagicMock()
     
-    # Mock chat engine
-    mock_chat_engine = MagicMock()
+    return mock
+
+
+@pytest.fixture
+def mock_chat_engine():
+    """Mock chat engine built by ChatService."""
+    mock = MagicMock()
     mock_response = MagicMock()
     mock_response.response = "This is a test response from the AI assistant."
+    mock_response.__str__ = lambda self: self.response
     mock_response.source_nodes = []
-    mock_chat_engine.chat = MagicMock(return_value=mock_response)
-    mock.as_chat_engine = MagicMock(return_value=mock_chat_engine)
-    
+    mock.achat = AsyncMock(return_value=mock_response)
     return mock
 
 
 @pytest.fixture
-def test_app(test_db, mock_config, mock_index, mock_openai_llm, mock_openai_embedding):
+def test_app(
+    test_db, mock_config, mock_index, mock_chat_engine, mock_openai_llm, mock_openai_embedding
+):
     """Create a test FastAPI app with mocked dependencies."""
     from fastapi import FastAPI
     from app.services.session_service import SessionService
@@ -212,7 +223,7 @@ def test_app(test_db, mock_config, mock_index, mock_openai_llm, mock_openai_embe
     # Initialize services with test database and mocked components
     session_service = SessionService(test_db)
     message_service = MessageService(test_db)
-    document_service = DocumentService(test_db, mock_index)
+    document_service = DocumentService(test_db, mock_index, mock_openai_embedding)
     chat_service = ChatService(mock_index, mock_openai_llm, mock_config)
     
     # Wire services to API routers
@@ -226,7 +237,11 @@ def test_app(test_db, mock_config, mock_index, mock_openai_llm, mock_openai_embe
     app.include_router(chat.router)
     app.include_router(documents.router)
     
-    return app
+    with patch(
+        'app.services.chat_service.CondensePlusContextChatEngine.from_defaults',
+        return_value=mock_chat_engine
+    ):
+        yield app
 
 
 @pytest.fixture
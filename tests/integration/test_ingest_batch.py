@@ -0,0 +1,80 @@
+"""Integration tests for batch document ingestion against a real database.
+
+Exercises the pool's jsonb codec through DocumentService.ingest_batch's
+binary COPY; only the vector index and embedding model are mocked.
+"""
+
+import uuid
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.db.database import Database, create_pool
+from app.services.document_service import DocumentService
+
+
+@pytest.mark.asyncio
+async def test_ingest_batch_copies_metadata_rows(test_db_url: str):
+    """Test ingest_batch writes jsonb metadata with COPY and reads it back as dicts."""
+    # Arrange
+    pool = await create_pool(test_db_url, min_size=1, max_size=2)
+    db = Database(pool)
+    table_exists = await db.fetchval("SELECT to_regclass('documents') IS NOT NULL")
+    if not table_exists:
+        # Same columns and defaults as the migrated documents table
+        await db.execute("""
+            CREATE TABLE documents (
+                id TEXT PRIMARY KEY,
+                title TEXT,
+                source TEXT,
+                vault_id TEXT,
+                metadata_json JSONB,
+                created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+            )
+        """)
+
+    index = MagicMock()
+    embed_model = MagicMock()
+    embed_model.embed_batch_size = 10
+    embed_model.aget_text_embedding_batch = AsyncMock(
+        side_effect=lambda texts, **kwargs: [[0.1] * 3 for _ in texts]
+    )
+    document_service = DocumentService(db=db, index=index, embed_model=embed_model)
+
+    prefix = f"batch_{uuid.uuid4().hex}"
+    documents = [
+        {
+            "document_id": f"{prefix}_1",
+            "text": "First document.",
+            "title": "One",
+            "metadata": {"author": "A", "tags": ["x", "é"], "nested": {"n": 1}},
+        },
+        {"document_id": f"{prefix}_2", "text": "Second document."},
+    ]
+
+    try:
+        # Act
+        result = await document_service.ingest_batch(documents)
+
+        # Assert
+        assert result == [f"{prefix}_1", f"{prefix}_2"]
+
+        first = await document_service.get_by_id(f"{prefix}_1")
+        assert first.title == "One"
+        assert first.metadata_json == {"author": "A", "tags": ["x", "é"], "nested": {"n": 1}}
+        assert first.created_at is not None
+
+        second = await document_service.get_by_id(f"{prefix}_2")
+        assert second.metadata_json == {}
+
+        # Stored as real jsonb, not as a JSON-encoded string
+        author = await db.fetchval(
+            "SELECT metadata_json->>'author' FROM documents WHERE id = $1", f"{prefix}_1"
+        )
+        assert author == "A"
+    finally:
+        await db.execute("DELETE FROM documents WHERE id LIKE $1", f"{prefix}_%")
+        if not table_exists:
+            await db.execute("DROP TABLE documents")
+        await pool.close()
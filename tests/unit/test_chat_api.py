@@ -0,0 +1,109 @@
+"""Unit tests for the chat API's background assistant message saves."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.api import chat
+from app.models.requests import ChatRequest
+
+
+@pytest.fixture
+def chat_module(monkeypatch):
+    """Inject mocked services into the chat router module."""
+    session_service = MagicMock()
+    session_service.touch_session = AsyncMock()
+    message_service = MagicMock()
+    message_service.get_recent_chat_history = AsyncMock(return_value=[])
+    config = MagicMock()
+    config.max_history_messages = 10
+
+    monkeypatch.setattr(chat, "session_service", session_service)
+    monkeypatch.setattr(chat, "message_service", message_service)
+    monkeypatch.setattr(chat, "config", config)
+    monkeypatch.setattr(chat, "response_cache", None)
+    monkeypatch.setattr(chat, "_background_tasks", set())
+    monkeypatch.setattr(chat, "_pending_saves", {})
+    return chat
+
+
+@pytest.mark.asyncio
+async def test_prepare_chat_waits_for_previous_answer(chat_module):
+    """Test the next turn's user message is saved after the previous answer."""
+    # Arrange
+    saved = []
+    release = asyncio.Event()
+
+    async def save_message(session_id, role, content):
+        if role == "assistant":
+            await release.wait()
+        saved.append(role)
+
+    chat_module.message_service.save_message = AsyncMock(side_effect=save_message)
+    chat_module._save_assistant_message("session_123", "First answer")
+
+    # Act
+    prepare = asyncio.create_task(
+        chat_module._prepare_chat(ChatRequest(session_id="session_123", message="Follow-up"))
+    )
+    await asyncio.sleep(0)
+    assert saved == []
+    release.set()
+    await prepare
+
+    # Assert
+    assert saved == ["assistant", "user"]
+    assert chat_module._pending_saves == {}
+    assert chat_module._background_tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_drain_background_tasks(chat_module):
+    """Test shutdown waits for in-flight saves and tolerates failures."""
+    # Arrange
+    saved = []
+
+    async def save_message(session_id, role, content):
+        await asyncio.sleep(0.01)
+        if session_id == "failing":
+            raise RuntimeError("database unavailable")
+        saved.append(session_id)
+
+    chat_module.message_service.save_message = AsyncMock(side_effect=save_message)
+    chat_module._save_assistant_message("session_1", "Answer")
+    chat_module._save_assistant_message("failing", "Answer")
+
+    # Act
+    await chat_module.drain_background_tasks(timeout=1.0)
+
+    # Assert
+    assert saved == ["session_1"]
+    assert chat_module._background_tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_stream_events_saves_partial_answer_on_disconnect(chat_module):
+    """Test the text streamed before a client disconnect is saved."""
+    # Arrange
+    chat_module.message_service.save_message = AsyncMock()
+
+    async def deltas():
+        yield "Partial "
+        yield "answer"
+        yield " never sent"
+
+    events = chat_module._stream_events("session_123", deltas(), [], None, False)
+
+    # Act
+    await events.__anext__()
+    await events.__anext__()
+    await events.aclose()
+    await chat_module.drain_background_tasks(timeout=1.0)
+
+    # Assert
+    chat_module.message_service.save_message.assert_awaited_once_with(
+        session_id="session_123",
+        role="assistant",
+        content="Partial answer"
+    )
@@ -4,7 +4,9 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from llama_index.core.llms import ChatMessage, MessageRole as LlamaMessageRole
 
-from app.services.chat_service import ChatService
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from app.services.chat_service import ChatService, _StableContextOrder
 from app.models.responses import Source
 from app.exceptions import ChatGenerationError
 
@@ -34,6 +36,13 @@ def mock_llm():
     return llm
 
 
+@pytest.fixture
+def mock_engine_class():
+    """Patch the chat engine class used by ChatService."""
+    with patch('app.services.chat_service.CondensePlusContextChatEngine') as engine_class:
+        yield engine_class
+
+
 @pytest.fixture
 def chat_service(mock_index, mock_llm, mock_config):
     """Create ChatService instance with mocks."""
@@ -41,7 +50,7 @@ def chat_service(mock_index, mock_llm, mock_config):
 
 
 @pytest.mark.asyncio
-async def test_generate_response_success(chat_service, mock_index):
+async def test_generate_response_success(chat_service, mock_index, mock_engine_class):
     """Test successful response generation."""
     # Arrange
     message = "What is the capital of France?"
@@ -65,8 +74,8 @@ async def test_generate_response_success(chat_service, mock_index):
         )
     ]
     
-    mock_chat_engine.chat.return_value = mock_response
-    mock_index.as_chat_engine.return_value = mock_chat_engine
+    mock_chat_engine.achat = AsyncMock(return_value=mock_response)
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
     
     # Act
     with patch('app.services.chat_service.OpenAI') as mock_openai_class:
@@ -90,17 +99,18 @@ async def test_generate_response_success(chat_service, mock_index):
     assert sources[0].score == 0.95
     
     # Verify chat engine was created with correct parameters
-    mock_index.as_chat_engine.assert_called_once()
-    call_kwargs = mock_index.as_chat_engine.call_args[1]
-    assert call_kwargs['chat_mode'] == 'condense_plus_context'
-    assert call_kwargs['similarity_top_k'] == top_k
+    mock_index.as_retriever.assert_called_once_with(similarity_top_k=top_k, filters=None)
+    mock_engine_class.from_defaults.assert_called_once()
+    call_kwargs = mock_engine_class.from_defaults.call_args[1]
+    assert call_kwargs['retriever'] is mock_index.as_retriever.return_value
+    assert isinstance(call_kwargs['node_postprocessors'][0], _StableContextOrder)
     
-    # Verify chat was called
-    mock_chat_engine.chat.assert_called_once_with(message)
+    # Verify chat was awaited
+    mock_chat_engine.achat.assert_awaited_once_with(message)
 
 
 @pytest.mark.asyncio
-async def test_generate_response_no_history(chat_service, mock_index):
+async def test_generate_response_no_history(chat_service, mock_index, mock_engine_class):
     """Test response generation with no chat history."""
     # Arrange
     message = "Tell me about Python"
@@ -113,8 +123,8 @@ async def test_generate_response_no_history(chat_service, mock_index):
     mock_response.__str__ = lambda self: "Python is a programming language."
     mock_response.source_nodes = []
     
-    mock_chat_engine.chat.return_value = mock_response
-    mock_index.as_chat_engine.return_value = mock_chat_engine
+    mock_chat_engine.achat = AsyncMock(return_value=mock_response)
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
     
     # Act
     with patch('app.services.chat_service.OpenAI'):
@@ -131,7 +141,7 @@ async def test_generate_response_no_history(chat_service, mock_index):
 
 
 @pytest.mark.asyncio
-async def test_generate_response_multiple_sources(chat_service, mock_index):
+async def test_generate_response_multiple_sources(chat_service, mock_index, mock_engine_class):
     """Test response generation with multiple source nodes."""
     # Arrange
     message = "What is machine learning?"
@@ -158,8 +168,8 @@ async def test_generate_response_multiple_sources(chat_service, mock_index):
         )
     ]
     
-    mock_chat_engine.chat.return_value = mock_response
-    mock_index.as_chat_engine.return_value = mock_chat_engine
+    mock_chat_engine.achat = AsyncMock(return_value=mock_response)
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
     
     # Act
     with patch('app.services.chat_service.OpenAI'):
@@ -179,7 +189,7 @@ async def test_generate_response_multiple_sources(chat_service, mock_index):
 
 
 @pytest.mark.asyncio
-async def test_generate_response_long_snippet(chat_service, mock_index):
+async def test_generate_response_long_snippet(chat_service, mock_index, mock_engine_class):
     """Test that snippets are truncated to 200 characters."""
     # Arrange
     message = "Test"
@@ -196,8 +206,8 @@ async def test_generate_response_long_snippet(chat_service, mock_index):
         )
     ]
     
-    mock_chat_engine.chat.return_value = mock_response
-    mock_index.as_chat_engine.return_value = mock_chat_engine
+    mock_chat_engine.achat = AsyncMock(return_value=mock_response)
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
     
     # Act
     with patch('app.services.chat_service.OpenAI'):
@@ -213,7 +223,7 @@ async def test_generate_response_long_snippet(chat_service, mock_index):
 
 
 @pytest.mark.asyncio
-async def test_generate_response_no_source_nodes(chat_service, mock_index):
+async def test_generate_response_no_source_nodes(chat_service, mock_index, mock_engine_class):
     """Test response when no source nodes are returned."""
     # Arrange
     message = "Random question"
@@ -224,8 +234,8 @@ async def test_generate_response_no_source_nodes(chat_service, mock_index):
     # Response has no source_nodes attribute
     delattr(type(mock_response), 'source_nodes')
     
-    mock_chat_engine.chat.return_value = mock_response
-    mock_index.as_chat_engine.return_value = mock_chat_engine
+    mock_chat_engine.achat = AsyncMock(return_value=mock_response)
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
     
     # Act
     with patch('app.services.chat_service.OpenAI'):
@@ -241,13 +251,13 @@ async def test_generate_response_no_source_nodes(chat_service, mock_index):
 
 
 @pytest.mark.asyncio
-async def test_generate_response_chat_engine_failure(chat_service, mock_index):
+async def test_generate_response_chat_engine_failure(chat_service, mock_index, mock_engine_class):
     """Test response generation when chat engine fails."""
     # Arrange
     message = "This will fail"
     session_id = "session_fail"
     
-    mock_index.as_chat_engine.side_effect = Exception("Chat engine creation failed")
+    mock_engine_class.from_defaults.side_effect = Exception("Chat engine creation failed")
     
     # Act & Assert
     with pytest.raises(ChatGenerationError) as exc_info:
@@ -264,15 +274,15 @@ async def test_generate_response_chat_engine_failure(chat_service, mock_index):
 
 
 @pytest.mark.asyncio
-async def test_generate_response_chat_failure(chat_service, mock_index):
+async def test_generate_response_chat_failure(chat_service, mock_index, mock_engine_class):
     """Test response generation when chat call fails."""
     # Arrange
     message = "This will fail"
     session_id = "session_chat_fail"
     
     mock_chat_engine = MagicMock()
-    mock_chat_engine.chat.side_effect = Exception("Chat generation failed")
-    mock_index.as_chat_engine.return_value = mock_chat_engine
+    mock_chat_engine.achat = AsyncMock(side_effect=Exception("Chat generation failed"))
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
     
     # Act & Assert
     with pytest.raises(ChatGenerationError) as exc_info:
@@ -288,6 +298,139 @@ async def test_generate_response_chat_failure(chat_service, mock_index):
     assert session_id in str(exc_info.value)
 
 
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_success(chat_service, mock_index, mock_engine_class):
+    """Test streaming response generation."""
+    # Arrange
+    session_id = "session_stream"
+    
+    async def response_gen():
+        for delta in ["Paris is ", "the capital", " of France."]:
+            yield delta
+    
+    mock_response = MagicMock()
+    mock_response.async_response_gen = response_gen
+    mock_response.source_nodes = [
+        MagicMock(
+            metadata={'document_id': 'doc_1', 'title': 'Geography'},
+            text='Paris is the capital and largest city of France.',
+            score=0.95
+        )
+    ]
+    
+    mock_chat_engine = MagicMock()
+    mock_chat_engine.astream_chat = AsyncMock(return_value=mock_response)
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
+    
+    # Act
+    with patch('app.services.chat_service.OpenAI'):
+        deltas, sources = await chat_service.generate_response_stream(
+            message="What is the capital of France?",
+            chat_history=[],
+            top_k=5,
+            temperature=0.7,
+            session_id=session_id
+        )
+        
+        # Sources are known before the answer is consumed
+        assert len(sources) == 1
+        assert sources[0].document_id == 'doc_1'
+        
+        answer = "".join([delta async for delta in deltas])
+    
+    # Assert
+    assert answer == "Paris is the capital of France."
+    mock_chat_engine.astream_chat.assert_called_once_with("What is the capital of France?")
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_failure_mid_stream(
+    chat_service, mock_index, mock_engine_class
+):
+    """Test that a failing LLM stream raises ChatGenerationError."""
+    # Arrange
+    session_id = "session_stream_fail"
+    
+    async def response_gen():
+        yield "Partial"
+        raise Exception("Stream interrupted")
+    
+    mock_response = MagicMock()
+    mock_response.async_response_gen = response_gen
+    mock_response.source_nodes = []
+    
+    mock_chat_engine = MagicMock()
+    mock_chat_engine.astream_chat = AsyncMock(return_value=mock_response)
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
+    
+    # Act & Assert
+    with patch('app.services.chat_service.OpenAI'):
+        deltas, sources = await chat_service.generate_response_stream(
+            message="This will fail",
+            chat_history=[],
+            top_k=5,
+            temperature=0.3,
+            session_id=session_id
+        )
+        
+        with pytest.raises(ChatGenerationError) as exc_info:
+            async for _ in deltas:
+                pass
+    
+    assert session_id in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_generate_response_uses_per_request_llm_copy(
+    chat_service, mock_index, mock_llm, mock_engine_class
+):
+    """Test the requested temperature is applied to a copy of the shared LLM."""
+    # Arrange
+    mock_chat_engine = MagicMock()
+    mock_chat_engine.achat = AsyncMock(return_value=MagicMock(source_nodes=[]))
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
+    
+    # Act
+    await chat_service.generate_response(
+        message="Hello",
+        chat_history=[],
+        top_k=5,
+        temperature=0.9
+    )
+    
+    # Assert
+    mock_llm.copy.assert_called_once_with(update={"temperature": 0.9})
+    call_kwargs = mock_engine_class.from_defaults.call_args[1]
+    assert call_kwargs['llm'] is mock_llm.copy.return_value
+
+
+@pytest.mark.asyncio
+async def test_generate_response_reuses_retriever(chat_service, mock_index, mock_engine_class):
+    """Test retrievers are created once per top_k and vault."""
+    # Arrange
+    mock_chat_engine = MagicMock()
+    mock_chat_engine.achat = AsyncMock(return_value=MagicMock(source_nodes=[]))
+    mock_engine_class.from_defaults.return_value = mock_chat_engine
+    
+    # Act
+    for vault_id in ["vault_1", "vault_1", "vault_2"]:
+        await chat_service.generate_response(
+            message="Hello",
+            chat_history=[],
+            top_k=5,
+            temperature=0.3,
+            vault_id=vault_id
+        )
+    
+    # Assert
+    assert mock_index.as_retriever.call_count == 2
+    assert mock_engine_class.from_defaults.call_count == 3
+    filters = mock_index.as_retriever.call_args_list[0][1]['filters']
+    assert filters.filters[0].key == 'vault_id'
+    assert filters.filters[0].value == 'vault_1'
+
+
 def test_extract_sources_with_metadata(chat_service):
     """Test extracting sources with complete metadata."""
     # Arrange
@@ -354,3 +497,35 @@ def test_extract_sources_empty_source_nodes(chat_service):
     
     # Assert
     assert sources == []
+
+
+def test_extract_sources_ordered_by_score(chat_service):
+    """Test that sources are reported most relevant first."""
+    mock_response = MagicMock()
+    mock_response.source_nodes = [
+        MagicMock(metadata={'document_id': 'doc_a'}, text='A', score=0.71),
+        MagicMock(metadata={'document_id': 'doc_b'}, text='B', score=0.93),
+        MagicMock(metadata={'document_id': 'doc_c'}, text='C', score=0.85)
+    ]
+    
+    sources = chat_service._extract_sources(mock_response)
+    
+    assert [s.document_id for s in sources] == ['doc_b', 'doc_c', 'doc_a']
+
+
+def test_stable_context_order_ignores_scores():
+    """Test that the same chunks reach the prompt in the same order."""
+    first = [
+        NodeWithScore(node=TextNode(id_='node_b', text='B'), score=0.9),
+        NodeWithScore(node=TextNode(id_='node_a', text='A'), score=0.8)
+    ]
+    second = [
+        NodeWithScore(node=TextNode(id_='node_a', text='A'), score=0.95),
+        NodeWithScore(node=TextNode(id_='node_b', text='B'), score=0.7)
+    ]
+    
+    postprocessor = _StableContextOrder()
+    
+    first_ids = [n.node.node_id for n in postprocessor.postprocess_nodes(first)]
+    second_ids = [n.node.node_id for n in postprocessor.postprocess_nodes(second)]
+    assert first_ids == second_ids == ['node_a', 'node_b']
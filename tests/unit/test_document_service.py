@@ -1,13 +1,15 @@
 """Unit tests for DocumentService."""
 
+import asyncio
 import pytest
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
-from app.services.document_service import DocumentService
+from app.services.document_service import DocumentService, _EMBED_PREFETCH_BATCHES
 from app.models.database import DocumentInfo
-from app.exceptions import DocumentIngestError
+from app.exceptions import DocumentIngestError, DocumentNotFoundError
 
 
 @pytest.fixture
@@ -17,6 +19,17 @@ def mock_db():
     db.fetchrow = AsyncMock()
     db.fetch = AsyncMock()
     db.execute = AsyncMock()
+    db.copy_records_to_table = AsyncMock()
+    
+    # transaction() yields a connection with the same query methods
+    db.conn = MagicMock()
+    db.conn.fetchrow = AsyncMock()
+    
+    @asynccontextmanager
+    async def transaction():
+        yield db.conn
+    
+    db.transaction = transaction
     return db
 
 
@@ -24,18 +37,29 @@ def mock_db():
 def mock_index():
     """Create a mock LlamaIndex VectorStoreIndex."""
     index = MagicMock()
-    index.insert = MagicMock()
+    index.insert_nodes = MagicMock()
     return index
 
 
 @pytest.fixture
-def document_service(mock_db, mock_index):
+def mock_embed_model():
+    """Create a mock embedding model returning one vector per text."""
+    embed_model = MagicMock()
+    embed_model.embed_batch_size = 10
+    embed_model.aget_text_embedding_batch = AsyncMock(
+        side_effect=lambda texts, **kwargs: [[0.1] * 3 for _ in texts]
+    )
+    return embed_model
+
+
+@pytest.fixture
+def document_service(mock_db, mock_index, mock_embed_model):
     """Create DocumentService instance with mocks."""
-    return DocumentService(db=mock_db, index=mock_index)
+    return DocumentService(db=mock_db, index=mock_index, embed_model=mock_embed_model)
 
 
 @pytest.mark.asyncio
-async def test_ingest_document_success(document_service, mock_db, mock_index):
+async def test_ingest_document_success(document_service, mock_db, mock_index, mock_embed_model):
     """Test successful document ingestion."""
     # Arrange
     document_id = "doc_123"
@@ -56,14 +80,20 @@ async def test_ingest_document_success(document_service, mock_db, mock_index):
     # Assert
     assert result == document_id
     
-    # Verify index.insert was called
-    mock_index.insert.assert_called_once()
-    inserted_doc = mock_index.insert.call_args[0][0]
-    assert inserted_doc.text == text
-    assert inserted_doc.metadata["document_id"] == document_id
-    assert inserted_doc.metadata["title"] == title
-    assert inserted_doc.metadata["source"] == source
-    assert inserted_doc.metadata["author"] == "Test Author"
+    # Verify all chunks were embedded in one batch call
+    mock_embed_model.aget_text_embedding_batch.assert_awaited_once()
+    
+    # Verify embedded chunks were inserted into the index
+    mock_index.insert_nodes.assert_called_once()
+    inserted_nodes = mock_index.insert_nodes.call_args[0][0]
+    assert len(inserted_nodes) == 1
+    inserted_node = inserted_nodes[0]
+    assert inserted_node.text == text
+    assert inserted_node.embedding == [0.1] * 3
+    assert inserted_node.metadata["document_id"] == document_id
+    assert inserted_node.metadata["title"] == title
+    assert inserted_node.metadata["source"] == source
+    assert inserted_node.metadata["author"] == "Test Author"
     
     # Verify database insert was called
     mock_db.execute.assert_called_once()
@@ -88,12 +118,12 @@ async def test_ingest_document_minimal(document_service, mock_db, mock_index):
     
     # Assert
     assert result == document_id
-    mock_index.insert.assert_called_once()
+    mock_index.insert_nodes.assert_called_once()
     
-    # Verify document has None for optional fields
-    inserted_doc = mock_index.insert.call_args[0][0]
-    assert inserted_doc.metadata["title"] is None
-    assert inserted_doc.metadata["source"] is None
+    # Verify chunks have None for optional fields
+    inserted_node = mock_index.insert_nodes.call_args[0][0][0]
+    assert inserted_node.metadata["title"] is None
+    assert inserted_node.metadata["source"] is None
 
 
 @pytest.mark.asyncio
@@ -121,7 +151,7 @@ async def test_ingest_document_index_failure(document_service, mock_db, mock_ind
     document_id = "doc_fail"
     text = "This will fail"
     
-    mock_index.insert.side_effect = Exception("Index insertion failed")
+    mock_index.insert_nodes.side_effect = Exception("Index insertion failed")
     
     # Act & Assert
     with pytest.raises(DocumentIngestError) as exc_info:
@@ -147,6 +177,145 @@ async def test_ingest_document_database_failure(document_service, mock_db, mock_
     assert document_id in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_ingest_document_inserts_each_embedded_batch(
+    document_service, mock_db, mock_index, mock_embed_model
+):
+    """Test chunks are embedded and inserted into the index batch by batch."""
+    # Arrange
+    mock_embed_model.embed_batch_size = 1
+    text = "This sentence is long enough to repeat. " * 600
+    
+    # Act
+    await document_service.ingest(document_id="doc_batches", text=text)
+    
+    # Assert
+    batch_count = mock_embed_model.aget_text_embedding_batch.await_count
+    assert batch_count > 1
+    assert mock_index.insert_nodes.call_count == batch_count
+    for call in mock_index.insert_nodes.call_args_list:
+        inserted_nodes = call[0][0]
+        assert len(inserted_nodes) == 1
+        assert inserted_nodes[0].embedding == [0.1] * 3
+    mock_db.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ingest_document_bounds_embedding_requests(
+    document_service, mock_db, mock_index, mock_embed_model
+):
+    """Test at most _EMBED_PREFETCH_BATCHES embedding requests are in flight."""
+    # Arrange
+    mock_embed_model.embed_batch_size = 1
+    text = "This sentence is long enough to repeat. " * 600
+    in_flight = 0
+    max_in_flight = 0
+    
+    async def embed(texts, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return [[0.1] * 3 for _ in texts]
+    
+    mock_embed_model.aget_text_embedding_batch = AsyncMock(side_effect=embed)
+    
+    # Act
+    await document_service.ingest(document_id="doc_bounded", text=text)
+    
+    # Assert
+    assert mock_embed_model.aget_text_embedding_batch.await_count > _EMBED_PREFETCH_BATCHES
+    assert max_in_flight == _EMBED_PREFETCH_BATCHES
+
+
+@pytest.mark.asyncio
+async def test_ingest_document_deletes_written_batches_on_failure(
+    document_service, mock_db, mock_index, mock_embed_model
+):
+    """Test vectors of batches already written are deleted when a later batch fails."""
+    # Arrange
+    mock_embed_model.embed_batch_size = 1
+    text = "This sentence is long enough to repeat. " * 600
+    mock_index.insert_nodes.side_effect = [None, None, Exception("Index insertion failed")]
+    
+    # Act & Assert
+    with pytest.raises(DocumentIngestError):
+        await document_service.ingest(document_id="doc_partial", text=text)
+    
+    written = [call[0][0][0].node_id for call in mock_index.insert_nodes.call_args_list[:2]]
+    mock_index.delete_nodes.assert_called_once_with(written)
+    mock_db.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ingest_batch_deletes_vectors_when_copy_fails(
+    document_service, mock_db, mock_index
+):
+    """Test vectors of a batch are deleted when its documents rows cannot be written."""
+    # Arrange
+    mock_db.copy_records_to_table.side_effect = Exception("Database error")
+    documents = [
+        {"document_id": "doc_1", "text": "First document."},
+        {"document_id": "doc_2", "text": "Second document."},
+    ]
+    
+    # Act & Assert
+    with pytest.raises(DocumentIngestError):
+        await document_service.ingest_batch(documents)
+    
+    inserted_ids = [n.node_id for n in mock_index.insert_nodes.call_args[0][0]]
+    mock_index.delete_nodes.assert_called_once_with(inserted_ids)
+
+
+@pytest.mark.asyncio
+async def test_ingest_batch_embeds_together_and_copies_rows(
+    document_service, mock_db, mock_index, mock_embed_model
+):
+    """Test batch ingestion shares embedding requests and writes rows with one COPY."""
+    # Arrange
+    documents = [
+        {"document_id": "doc_1", "text": "First document.", "title": "One"},
+        {"document_id": "doc_2", "text": "Second document.", "vault_id": "vault_1"},
+        {"document_id": "doc_3", "text": "Third document.", "metadata": {"author": "A"}},
+    ]
+    
+    # Act
+    result = await document_service.ingest_batch(documents)
+    
+    # Assert
+    assert result == ["doc_1", "doc_2", "doc_3"]
+    
+    # All chunks fit in one embedding batch
+    mock_embed_model.aget_text_embedding_batch.assert_awaited_once()
+    inserted_nodes = mock_index.insert_nodes.call_args[0][0]
+    assert [n.metadata["document_id"] for n in inserted_nodes] == ["doc_1", "doc_2", "doc_3"]
+    
+    # One COPY for all documents rows, no per-row INSERT
+    mock_db.execute.assert_not_called()
+    mock_db.copy_records_to_table.assert_awaited_once()
+    call = mock_db.copy_records_to_table.call_args
+    assert call[0][0] == "documents"
+    records = call[1]["records"]
+    assert [r[0] for r in records] == ["doc_1", "doc_2", "doc_3"]
+    assert records[1][3] == "vault_1"
+    assert records[2][4] == {"author": "A"}
+
+
+@pytest.mark.asyncio
+async def test_ingest_batch_database_failure(document_service, mock_db):
+    """Test batch ingestion error handling when the COPY fails."""
+    # Arrange
+    mock_db.copy_records_to_table.side_effect = Exception("Database error")
+    documents = [{"document_id": "doc_fail", "text": "Some text."}]
+    
+    # Act & Assert
+    with pytest.raises(DocumentIngestError) as exc_info:
+        await document_service.ingest_batch(documents)
+    
+    assert "doc_fail" in str(exc_info.value)
+
+
 @pytest.mark.asyncio
 async def test_list_all_documents(document_service, mock_db):
     """Test listing all documents."""
@@ -159,7 +328,8 @@ async def test_list_all_documents(document_service, mock_db):
             'id': 'doc_2',
             'title': 'Document 2',
             'source': 'source2.txt',
-            'metadata_json': json.dumps({"key": "value2"}),
+            'vault_id': 'vault_1',
+            'metadata_json': {"key": "value2"},
             'created_at': created_at_2,
             'updated_at': created_at_2
         },
@@ -167,7 +337,8 @@ async def test_list_all_documents(document_service, mock_db):
             'id': 'doc_1',
             'title': 'Document 1',
             'source': 'source1.txt',
-            'metadata_json': json.dumps({"key": "value1"}),
+            'vault_id': None,
+            'metadata_json': {"key": "value1"},
             'created_at': created_at_1,
             'updated_at': created_at_1
         }
@@ -181,6 +352,7 @@ async def test_list_all_documents(document_service, mock_db):
     assert isinstance(result[0], DocumentInfo)
     assert result[0].id == 'doc_2'
     assert result[0].title == 'Document 2'
+    assert result[0].vault_id == 'vault_1'
     assert result[0].metadata_json == {"key": "value2"}
     assert result[1].id == 'doc_1'
     
@@ -211,6 +383,7 @@ async def test_list_all_documents_null_metadata(document_service, mock_db):
             'id': 'doc_null_meta',
             'title': 'Document',
             'source': 'source.txt',
+            'vault_id': None,
             'metadata_json': None,
             'created_at': created_at,
             'updated_at': created_at
@@ -225,6 +398,39 @@ async def test_list_all_documents_null_metadata(document_service, mock_db):
     assert result[0].metadata_json == {}
 
 
+@pytest.mark.asyncio
+async def test_iter_all_documents(document_service, mock_db):
+    """Test streaming documents in keyset pages."""
+    # Arrange
+    created_at = datetime(2024, 1, 1, 12, 0, 0)
+    rows = [
+        {
+            'id': f'doc_{i}',
+            'title': f'Document {i}',
+            'source': f'source{i}.txt',
+            'vault_id': 'vault_1',
+            'metadata_json': {"key": f"value{i}"} if i == 3 else None,
+            'created_at': created_at,
+            'updated_at': created_at
+        }
+        for i in (3, 2, 1)
+    ]
+    mock_db.fetch.side_effect = [rows[:2], rows[2:]]
+    
+    # Act
+    result = [doc async for doc in document_service.iter_all(vault_id='vault_1', page_size=2)]
+    
+    # Assert
+    assert [doc.id for doc in result] == ['doc_3', 'doc_2', 'doc_1']
+    assert result[0].metadata_json == {"key": "value3"}
+    assert result[1].metadata_json == {}
+    assert mock_db.fetch.call_count == 2
+    first_page, next_page = mock_db.fetch.call_args_list
+    assert first_page.args[1:] == ('vault_1', 2)
+    # The second page resumes after the last row of the first
+    assert next_page.args[1:] == ('vault_1', 2, created_at, 'doc_2')
+
+
 @pytest.mark.asyncio
 async def test_get_by_id_found(document_service, mock_db):
     """Test getting a document by ID when it exists."""
@@ -237,7 +443,8 @@ async def test_get_by_id_found(document_service, mock_db):
         'id': document_id,
         'title': 'Existing Document',
         'source': 'existing.txt',
-        'metadata_json': json.dumps({"status": "active"}),
+        'vault_id': 'vault_1',
+        'metadata_json': {"status": "active"},
         'created_at': created_at,
         'updated_at': updated_at
     }
@@ -251,6 +458,7 @@ async def test_get_by_id_found(document_service, mock_db):
     assert result.id == document_id
     assert result.title == 'Existing Document'
     assert result.source == 'existing.txt'
+    assert result.vault_id == 'vault_1'
     assert result.metadata_json == {"status": "active"}
     assert result.created_at == created_at
     assert result.updated_at == updated_at
@@ -284,6 +492,7 @@ async def test_get_by_id_null_metadata(document_service, mock_db):
         'id': document_id,
         'title': 'Document',
         'source': None,
+        'vault_id': None,
         'metadata_json': None,
         'created_at': created_at,
         'updated_at': created_at
@@ -296,3 +505,49 @@ async def test_get_by_id_null_metadata(document_service, mock_db):
     assert result is not None
     assert result.metadata_json == {}
     assert result.source is None
+
+
+def test_new_document_id_time_ordered():
+    """Test generated document IDs are UUIDv7 and sort by creation time."""
+    import time
+    import uuid
+    from app.services.document_service import new_document_id
+    
+    # Act
+    first = new_document_id()
+    time.sleep(0.002)
+    second = new_document_id()
+    
+    # Assert
+    assert uuid.UUID(first).version == 7
+    assert uuid.UUID(first).variant == uuid.RFC_4122
+    assert first < second
+
+
+@pytest.mark.asyncio
+async def test_delete_document(document_service, mock_db, mock_index):
+    """Test deleting a document removes its row and vectors."""
+    # Arrange
+    mock_db.conn.fetchrow.return_value = {'vault_id': 'vault_1'}
+    
+    # Act
+    await document_service.delete("doc_1")
+    
+    # Assert
+    mock_db.conn.fetchrow.assert_awaited_once()
+    assert mock_db.conn.fetchrow.call_args[0][1] == "doc_1"
+    mock_index.delete_ref_doc.assert_called_once_with("doc_1", delete_from_docstore=True)
+    mock_db.fetchrow.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_document_not_found(document_service, mock_db, mock_index):
+    """Test deleting a missing document raises DocumentNotFoundError."""
+    # Arrange
+    mock_db.conn.fetchrow.return_value = None
+    
+    # Act & Assert
+    with pytest.raises(DocumentNotFoundError):
+        await document_service.delete("missing_doc")
+    
+    mock_index.delete_ref_doc.assert_not_called()
@@ -0,0 +1,79 @@
+"""Unit tests for the streamed document listing."""
+
+import orjson
+import pytest
+from datetime import datetime, timezone
+
+from app.api.documents import _encode_documents
+from app.models.database import DocumentInfo
+
+
+def _document(document_id):
+    """Create a document record as returned by DocumentService.iter_all."""
+    created_at = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    return DocumentInfo(
+        id=document_id,
+        title=f"Title {document_id}",
+        source=None,
+        vault_id=None,
+        metadata_json={},
+        created_at=created_at,
+        updated_at=created_at
+    )
+
+
+@pytest.mark.asyncio
+async def test_encode_documents_complete():
+    """Test streamed chunks form the full DocumentsResponse JSON."""
+    # Arrange
+    async def documents():
+        yield _document("doc_2")
+        yield _document("doc_3")
+
+    # Act
+    body = b"".join([chunk async for chunk in _encode_documents(_document("doc_1"), documents())])
+
+    # Assert
+    payload = orjson.loads(body)
+    assert [doc["document_id"] for doc in payload["documents"]] == ["doc_1", "doc_2", "doc_3"]
+
+
+@pytest.mark.asyncio
+async def test_encode_documents_empty():
+    """Test an empty listing is an empty documents array."""
+    # Arrange
+    async def documents():
+        return
+        yield
+
+    # Act
+    body = b"".join([chunk async for chunk in _encode_documents(None, documents())])
+
+    # Assert
+    assert orjson.loads(body) == {"documents": []}
+
+
+@pytest.mark.asyncio
+async def test_encode_documents_failure_mid_stream():
+    """Test a failing page aborts the stream instead of closing the JSON."""
+    # Arrange
+    closed = []
+
+    async def documents():
+        try:
+            yield _document("doc_2")
+            raise ConnectionError("connection lost")
+        finally:
+            closed.append(True)
+
+    chunks = []
+
+    # Act
+    with pytest.raises(ConnectionError):
+        async for chunk in _encode_documents(_document("doc_1"), documents()):
+            chunks.append(chunk)
+
+    # Assert
+    assert len(chunks) == 3
+    assert not b"".join(chunks).endswith(b"]}")
+    assert closed == [True]
@@ -0,0 +1,45 @@
+"""Unit tests for the structured log formatter."""
+
+import logging
+
+from app.logging_config import StructuredFormatter, request_id_context
+
+
+def _record(**extra):
+    """Create a log record carrying the given extra attributes."""
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, "Handled", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_format_adds_request_id_without_mutating_record():
+    """Test the context request_id is printed but not written to the record."""
+    # Arrange
+    record = _record(session_id="session_123")
+    token = request_id_context.set("req_1")
+    
+    # Act
+    try:
+        line = StructuredFormatter().format(record)
+    finally:
+        request_id_context.reset(token)
+    
+    # Assert
+    assert line.endswith(" session_id=session_123 request_id=req_1")
+    assert "request_id" not in record.__dict__
+
+
+def test_format_keeps_explicit_request_id():
+    """Test a request_id passed in extra wins over the context one."""
+    # Arrange
+    record = _record(request_id="req_explicit")
+    token = request_id_context.set("req_context")
+    
+    # Act
+    try:
+        line = StructuredFormatter().format(record)
+    finally:
+        request_id_context.reset(token)
+    
+    # Assert
+    assert line.endswith(" request_id=req_explicit")
@@ -150,22 +150,16 @@ async def test_get_recent_messages(message_service, mock_db):
     # Messages returned in DESC order (newest first)
     mock_db.fetch.return_value = [
         {
-            'id': 3,
-            'session_id': session_id,
             'role': 'assistant',
             'content': 'Response 2',
             'created_at': created_at_3
         },
         {
-            'id': 2,
-            'session_id': session_id,
             'role': 'user',
             'content': 'Question 2',
             'created_at': created_at_2
         },
         {
-            'id': 1,
-            'session_id': session_id,
             'role': 'user',
             'content': 'Question 1',
             'created_at': created_at_1
@@ -178,12 +172,12 @@ async def test_get_recent_messages(message_service, mock_db):
     # Assert
     assert len(result) == 3
     # Messages should be in chronological order (oldest first)
-    assert result[0].id == 1
     assert result[0].content == 'Question 1'
-    assert result[1].id == 2
+    assert result[0].created_at == created_at_1
     assert result[1].content == 'Question 2'
-    assert result[2].id == 3
     assert result[2].content == 'Response 2'
+    assert result[2].role == MessageRole.ASSISTANT
+    assert all(m.session_id == session_id for m in result)
     
     mock_db.fetch.assert_called_once()
 
@@ -218,6 +212,37 @@ async def test_get_recent_messages_empty(message_service, mock_db):
     assert result == []
 
 
+@pytest.mark.asyncio
+async def test_get_recent_chat_history(message_service, mock_db):
+    """Test retrieving recent history directly as ChatMessages."""
+    # Arrange
+    session_id = "session_chat_history"
+    
+    # Rows returned in DESC order (newest first)
+    mock_db.fetch.return_value = [
+        {'role': 'assistant', 'content': 'Answer 1'},
+        {'role': 'user', 'content': 'Question 1'},
+        {'role': 'system', 'content': 'You are helpful'}
+    ]
+    
+    # Act
+    result = await message_service.get_recent_chat_history(session_id, limit=3)
+    
+    # Assert
+    assert len(result) == 3
+    assert all(isinstance(m, ChatMessage) for m in result)
+    # Chronological order (oldest first)
+    assert result[0].role == LlamaMessageRole.SYSTEM
+    assert result[1].role == LlamaMessageRole.USER
+    assert result[1].content == 'Question 1'
+    assert result[2].role == LlamaMessageRole.ASSISTANT
+    assert result[2].content == 'Answer 1'
+    
+    call_args = mock_db.fetch.call_args[0]
+    assert session_id in call_args
+    assert 3 in call_args
+
+
 def test_format_for_chat_engine_user_message(message_service):
     """Test formatting user message for chat engine."""
     # Arrange
@@ -0,0 +1,150 @@
+"""Unit tests for SemanticResponseCache."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.responses import Source
+from app.services.semantic_cache import SemanticResponseCache
+
+
+# Fixed question embeddings; "refunds" and "refund policy" are near-duplicates
+EMBEDDINGS = {
+    "refunds": [1.0, 0.0, 0.0],
+    "refund policy": [0.99, 0.1, 0.0],
+    "shipping": [0.0, 1.0, 0.0],
+}
+
+
+@pytest.fixture
+def mock_embed_model():
+    """Create a mock embedding model with fixed question embeddings."""
+    embed_model = MagicMock()
+    embed_model.aget_query_embedding = AsyncMock(side_effect=lambda text: EMBEDDINGS[text])
+    return embed_model
+
+
+@pytest.fixture
+def response_cache(mock_embed_model):
+    """Create SemanticResponseCache with mock embedding model."""
+    return SemanticResponseCache(mock_embed_model, threshold=0.9, ttl=60, max_size=2)
+
+
+@pytest.fixture
+def sources():
+    """Create sources returned with a cached answer."""
+    return [Source(document_id="doc_1", title="Policy", snippet="Refunds...", score=0.9)]
+
+
+@pytest.mark.asyncio
+async def test_similar_question_hits(response_cache, sources):
+    """Test a semantically similar question returns the cached answer."""
+    # Arrange
+    query = await response_cache.prepare("refunds", "vault-1", 5)
+    response_cache.put(query, "30 days", sources)
+    
+    # Act
+    result = response_cache.get(await response_cache.prepare("refund policy", "vault-1", 5))
+    
+    # Assert
+    assert result == ("30 days", sources)
+
+
+@pytest.mark.asyncio
+async def test_different_question_misses(response_cache, sources):
+    """Test an unrelated question does not hit the cache."""
+    # Arrange
+    query = await response_cache.prepare("refunds", "vault-1", 5)
+    response_cache.put(query, "30 days", sources)
+    
+    # Act
+    result = response_cache.get(await response_cache.prepare("shipping", "vault-1", 5))
+    
+    # Assert
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_scope_must_match(response_cache, sources):
+    """Test cached answers are only shared within the same vault and top_k."""
+    # Arrange
+    query = await response_cache.prepare("refunds", "vault-1", 5)
+    response_cache.put(query, "30 days", sources)
+    
+    # Act & Assert
+    assert response_cache.get(await response_cache.prepare("refunds", "vault-2", 5)) is None
+    assert response_cache.get(await response_cache.prepare("refunds", "vault-1", 3)) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_vault(response_cache, sources):
+    """Test invalidating a vault drops its answers and unfiltered answers."""
+    # Arrange
+    vault_query = await response_cache.prepare("refunds", "vault-1", 5)
+    response_cache.put(vault_query, "30 days", sources)
+    global_query = await response_cache.prepare("shipping", None, 5)
+    response_cache.put(global_query, "2 days", [])
+    
+    # Act
+    await response_cache.invalidate("vault-1")
+    
+    # Assert
+    assert response_cache.get(await response_cache.prepare("refunds", "vault-1", 5)) is None
+    assert response_cache.get(await response_cache.prepare("shipping", None, 5)) is None
+
+
+@pytest.mark.asyncio
+async def test_put_after_invalidate_is_dropped(response_cache, sources):
+    """Test an answer computed before an invalidation is not cached."""
+    # Arrange
+    query = await response_cache.prepare("refunds", "vault-1", 5)
+    await response_cache.invalidate("vault-1")
+    
+    # Act
+    response_cache.put(query, "30 days", sources)
+    
+    # Assert
+    assert response_cache.get(await response_cache.prepare("refunds", "vault-1", 5)) is None
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used(response_cache):
+    """Test the least recently used answer is evicted when full."""
+    # Arrange
+    response_cache.put(await response_cache.prepare("refunds", "vault-1", 5), "30 days", [])
+    response_cache.put(await response_cache.prepare("shipping", "vault-1", 5), "2 days", [])
+    
+    # Act: touch "refunds", then insert a third answer
+    response_cache.get(await response_cache.prepare("refunds", "vault-1", 5))
+    response_cache.put(await response_cache.prepare("refunds", "vault-2", 5), "14 days", [])
+    
+    # Assert
+    assert response_cache.get(await response_cache.prepare("shipping", "vault-1", 5)) is None
+    assert response_cache.get(await response_cache.prepare("refunds", "vault-1", 5)) == ("30 days", [])
+
+
+@pytest.mark.asyncio
+async def test_invalidate_reaches_other_workers(mock_embed_model, sources):
+    """Test an invalidation in one worker drops answers cached by another."""
+    # Arrange: two workers sharing the generation counters in the database
+    generations = {}
+    
+    async def bump(query, scopes):
+        for scope in scopes:
+            generations[scope] = generations.get(scope, 0) + 1
+        return [{"scope": scope, "generation": generations[scope]} for scope in scopes]
+    
+    db = MagicMock()
+    db.fetchval = AsyncMock(side_effect=lambda query, scope: generations.get(scope))
+    db.fetch = AsyncMock(side_effect=bump)
+    serving_worker = SemanticResponseCache(mock_embed_model, threshold=0.9, ttl=60, db=db)
+    ingesting_worker = SemanticResponseCache(mock_embed_model, threshold=0.9, ttl=60, db=db)
+    
+    query = await serving_worker.prepare("refunds", "vault-1", 5)
+    serving_worker.put(query, "30 days", sources)
+    
+    # Act
+    await ingesting_worker.invalidate("vault-1")
+    
+    # Assert
+    assert sorted(db.fetch.call_args.args[1]) == ["", "vault-1"]
+    assert serving_worker.get(await serving_worker.prepare("refunds", "vault-1", 5)) is None
@@ -128,3 +128,29 @@ async def test_update_last_active(session_service, mock_db):
     call_args = mock_db.execute.call_args
     # Verify session_id is in the call
     assert session_id in call_args[0]
+
+
+@pytest.mark.asyncio
+async def test_touch_session(session_service, mock_db):
+    """Test creating or refreshing a session with a single upsert."""
+    # Arrange
+    session_id = "touched_session"
+    now = datetime.now()
+    mock_db.fetchrow.return_value = {
+        'id': session_id,
+        'user_id': None,
+        'created_at': now,
+        'last_active_at': now
+    }
+    
+    # Act
+    result = await session_service.touch_session(session_id)
+    
+    # Assert
+    assert isinstance(result, Session)
+    assert result.id == session_id
+    assert result.last_active_at == now
+    mock_db.fetchrow.assert_called_once()
+    query = mock_db.fetchrow.call_args[0][0]
+    assert "ON CONFLICT (id) DO UPDATE" in query
+    mock_db.execute.assert_not_called()
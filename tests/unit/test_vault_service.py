@@ -3,7 +3,7 @@
 import pytest
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 # Add project root to path
@@ -54,6 +54,25 @@ async def test_create_vault_success(vault_service, mock_db):
     assert mock_db.fetchrow.called
 
 
+@pytest.mark.asyncio
+async def test_create_vault_passes_aware_timestamps(vault_service, mock_db):
+    """Test vault creation binds timezone-aware UTC timestamps for TIMESTAMPTZ columns."""
+    vault_service.get_by_name = AsyncMock(return_value=None)
+    mock_db.fetchrow.return_value = {
+        "vault_id": "test-vault-id",
+        "name": "Test Vault",
+        "description": None,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc)
+    }
+    
+    await vault_service.create(name="Test Vault")
+    
+    created_at, updated_at = mock_db.fetchrow.call_args.args[4:6]
+    assert created_at.utcoffset() == timedelta(0)
+    assert updated_at == created_at
+
+
 @pytest.mark.asyncio
 async def test_create_vault_duplicate_name(vault_service, mock_db):
     """Test vault creation with duplicate name."""
@@ -109,6 +128,39 @@ async def test_list_all_vaults(vault_service, mock_db):
     assert mock_db.fetch.called
 
 
+@pytest.mark.asyncio
+async def test_list_all_vaults_with_counts(vault_service, mock_db):
+    """Test listing vaults with document counts in one query."""
+    # Mock database response
+    mock_rows = [
+        {
+            "vault_id": "vault-1",
+            "name": "Vault 1",
+            "description": "First vault",
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+            "document_count": 3
+        },
+        {
+            "vault_id": "vault-2",
+            "name": "Vault 2",
+            "description": None,
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+            "document_count": 0
+        }
+    ]
+    mock_db.fetch.return_value = mock_rows
+    
+    # List vaults
+    vaults = await vault_service.list_all_with_counts()
+    
+    # Assertions
+    assert [(vault.name, count) for vault, count in vaults] == [("Vault 1", 3), ("Vault 2", 0)]
+    mock_db.fetch.assert_called_once()
+    assert not mock_db.fetchval.called
+
+
 @pytest.mark.asyncio
 async def test_get_vault_by_id_found(vault_service, mock_db):
     """Test getting vault by ID when it exists."""
@@ -256,3 +308,67 @@ async def test_validate_exists_not_found(vault_service, mock_db):
     # Validate vault exists
     with pytest.raises(VaultNotFoundError):
         await vault_service.validate_exists("nonexistent-id")
+
+
+@pytest.mark.asyncio
+async def test_get_with_count(vault_service, mock_db):
+    """Test vault lookup returns the document count and newest document time."""
+    # Mock database response
+    last_document_at = datetime.now(timezone.utc)
+    mock_db.fetchrow.return_value = {
+        "vault_id": "test-vault-id",
+        "name": "Test Vault",
+        "description": "Test description",
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+        "document_count": 4,
+        "last_document_at": last_document_at
+    }
+    
+    # Look up vault
+    vault, doc_count, last = await vault_service.get_with_count("test-vault-id")
+    
+    # Assertions
+    assert vault.vault_id == "test-vault-id"
+    assert doc_count == 4
+    assert last == last_document_at
+    assert not mock_db.fetchval.called
+
+
+@pytest.mark.asyncio
+async def test_get_with_count_not_cached(vault_service, mock_db):
+    """Test every lookup reads the database so all workers see changes."""
+    # Mock database responses
+    row = {
+        "vault_id": "test-vault-id",
+        "name": "Test Vault",
+        "description": "Test description",
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+        "last_document_at": None
+    }
+    mock_db.fetchrow.side_effect = [
+        {**row, "document_count": 4},
+        {**row, "document_count": 5}
+    ]
+    
+    # Look up twice
+    await vault_service.get_with_count("test-vault-id")
+    _, doc_count, _ = await vault_service.get_with_count("test-vault-id")
+    
+    # Assertions
+    assert doc_count == 5
+    assert mock_db.fetchrow.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_with_count_not_found(vault_service, mock_db):
+    """Test looking up a missing vault with its document count."""
+    # Mock database response
+    mock_db.fetchrow.return_value = None
+    
+    # Look up vault
+    result = await vault_service.get_with_count("nonexistent-id")
+    
+    # Assertions
+    assert result is None
@@ -0,0 +1,24 @@
+"""Unit tests for vault API helpers."""
+
+from datetime import datetime, timedelta, timezone
+
+from app.api.vaults import _vault_etag
+
+
+def test_vault_etag_changes_when_documents_are_swapped():
+    """Test adding one document and deleting another changes the ETag."""
+    updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    before = _vault_etag(updated_at, 3, updated_at + timedelta(minutes=1))
+    
+    # Same count, but the newly added document is the newest one
+    after = _vault_etag(updated_at, 3, updated_at + timedelta(minutes=2))
+    
+    assert before != after
+
+
+def test_vault_etag_stable_without_changes():
+    """Test the ETag is stable while the vault and its documents are unchanged."""
+    updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    
+    assert _vault_etag(updated_at, 0, None) == _vault_etag(updated_at, 0, None)
+    assert _vault_etag(updated_at, 0, None).startswith('W/"')